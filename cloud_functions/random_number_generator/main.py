@@ -16,7 +16,21 @@ import functions_framework
 import random
 import json
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional
+
+import numpy as np
+from flask import Response
+
+# Bulk mode limits and streaming granularity
+BULK_MAX_COUNT = 1_000_000
+BULK_CHUNK_SIZE = 65_536
+BULK_FORMATS = ('ndjson', 'binary')
+
+# Little-endian wire types for the binary format
+BINARY_DTYPES = {
+    'int': np.dtype('<i8'),
+    'float': np.dtype('<f8')
+}
 
 @functions_framework.http
 def generate_random_number(request):
@@ -171,6 +185,181 @@ def generate_random_choice(request):
         
         return json.dumps(response_data), 200, headers
         
+    except Exception as e:
+        error_response = {
+            'error': str(e),
+            'status': 'error',
+            'timestamp': datetime.utcnow().isoformat() + 'Z'
+        }
+        return json.dumps(error_response), 500, headers
+
+
+def _bulk_chunks(
+    min_value: int,
+    max_value: int,
+    count: int,
+    decimal_places: int,
+    seed: Optional[int] = None,
+    chunk_size: int = BULK_CHUNK_SIZE
+) -> Iterator[np.ndarray]:
+    """
+    Generate random numbers as NumPy arrays of at most `chunk_size` values.
+    
+    Integers are drawn from [min, max] inclusive; floats are drawn uniformly
+    and rounded to `decimal_places`. The same seed and chunk size always
+    yield the same sequence.
+    
+    Args:
+        min_value: Minimum value (inclusive)
+        max_value: Maximum value (inclusive)
+        count: Total number of values
+        decimal_places: 0 for integers, otherwise float precision
+        seed: Optional seed for reproducible output
+        chunk_size: Maximum values per array
+        
+    Yields:
+        Arrays of int64 or float64 values
+    """
+    rng = np.random.default_rng(seed)
+    remaining = count
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        if decimal_places == 0:
+            chunk = rng.integers(min_value, max_value, size=size, endpoint=True, dtype=np.int64)
+        else:
+            chunk = np.round(rng.uniform(min_value, max_value, size=size), decimal_places)
+        remaining -= size
+        yield chunk
+
+
+def _ndjson_stream(parameters: Dict[str, Any], chunks: Iterator[np.ndarray]) -> Iterator[str]:
+    """Yield a header line followed by one number per line."""
+    header = {
+        'status': 'success',
+        'parameters': parameters,
+        'timestamp': datetime.utcnow().isoformat() + 'Z'
+    }
+    yield json.dumps(header) + '\n'
+    for chunk in chunks:
+        yield '\n'.join(map(str, chunk.tolist())) + '\n'
+
+
+def _binary_stream(chunks: Iterator[np.ndarray], dtype: np.dtype) -> Iterator[bytes]:
+    """Yield the raw little-endian bytes of each chunk."""
+    for chunk in chunks:
+        yield chunk.astype(dtype, copy=False).tobytes()
+
+
+@functions_framework.http
+def generate_random_numbers_bulk(request):
+    """
+    HTTP Cloud Function that streams large batches of random numbers.
+    
+    Accepts the same min/max/decimal_places parameters as
+    generate_random_number, a count of up to BULK_MAX_COUNT, an optional
+    integer seed, and a format:
+    
+    - ndjson: a JSON header line with status and parameters, then one
+      number per line
+    - binary: packed little-endian int64 (decimal_places == 0) or float64
+      values; the dtype and count are returned in X-Random-Dtype and
+      X-Random-Count headers
+    
+    Args:
+        request (flask.Request): The request object.
+        
+    Returns:
+        A streaming Response, or a JSON error.
+    """
+    
+    headers = {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET, POST',
+        'Access-Control-Allow-Headers': 'Content-Type',
+        'Access-Control-Expose-Headers': 'X-Random-Count, X-Random-Dtype',
+        'Content-Type': 'application/json'
+    }
+    
+    if request.method == 'OPTIONS':
+        return ('', 204, headers)
+    
+    try:
+        request_json = request.get_json(silent=True)
+        request_args = request.args
+        
+        min_value = 1
+        max_value = 100
+        count = 1000
+        decimal_places = 0
+        seed = None
+        output_format = 'ndjson'
+        
+        if request_json:
+            min_value = request_json.get('min', min_value)
+            max_value = request_json.get('max', max_value)
+            count = request_json.get('count', count)
+            decimal_places = request_json.get('decimal_places', decimal_places)
+            seed = request_json.get('seed', seed)
+            output_format = request_json.get('format', output_format)
+        elif request_args:
+            min_value = int(request_args.get('min', min_value))
+            max_value = int(request_args.get('max', max_value))
+            count = int(request_args.get('count', count))
+            decimal_places = int(request_args.get('decimal_places', decimal_places))
+            if 'seed' in request_args:
+                seed = int(request_args['seed'])
+            output_format = request_args.get('format', output_format)
+        
+        # Validate parameters before any generation starts streaming
+        if min_value >= max_value:
+            return json.dumps({
+                'error': 'min must be less than max',
+                'status': 'error'
+            }), 400, headers
+        
+        if count < 1 or count > BULK_MAX_COUNT:
+            return json.dumps({
+                'error': f'count must be between 1 and {BULK_MAX_COUNT}',
+                'status': 'error'
+            }), 400, headers
+        
+        if decimal_places < 0 or decimal_places > 10:
+            return json.dumps({
+                'error': 'decimal_places must be between 0 and 10',
+                'status': 'error'
+            }), 400, headers
+        
+        if seed is not None and (not isinstance(seed, int) or seed < 0):
+            return json.dumps({
+                'error': 'seed must be a non-negative integer',
+                'status': 'error'
+            }), 400, headers
+        
+        if output_format not in BULK_FORMATS:
+            return json.dumps({
+                'error': f'format must be one of {", ".join(BULK_FORMATS)}',
+                'status': 'error'
+            }), 400, headers
+        
+        parameters = {
+            'min': min_value,
+            'max': max_value,
+            'count': count,
+            'decimal_places': decimal_places,
+            'seed': seed
+        }
+        chunks = _bulk_chunks(min_value, max_value, count, decimal_places, seed)
+        
+        if output_format == 'binary':
+            dtype = BINARY_DTYPES['int' if decimal_places == 0 else 'float']
+            headers['Content-Type'] = 'application/octet-stream'
+            headers['X-Random-Count'] = str(count)
+            headers['X-Random-Dtype'] = dtype.str
+            return Response(_binary_stream(chunks, dtype), status=200, headers=headers)
+        
+        headers['Content-Type'] = 'application/x-ndjson'
+        return Response(_ndjson_stream(parameters, chunks), status=200, headers=headers)
+        
     except Exception as e:
         error_response = {
             'error': str(e),
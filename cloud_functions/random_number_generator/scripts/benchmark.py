@@ -0,0 +1,101 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compare loop-based and vectorized random number generation throughput.
+
+Usage:
+    python scripts/benchmark.py [--counts 100 10000 1000000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+
+
+def loop_generate(count, decimal_places, min_value=1, max_value=100):
+    """Generate numbers the way generate_random_number does."""
+    numbers = []
+    for _ in range(count):
+        if decimal_places == 0:
+            number = random.randint(min_value, max_value)
+        else:
+            number = round(random.uniform(min_value, max_value), decimal_places)
+        numbers.append(number)
+    return numbers
+
+
+def vectorized_generate(count, decimal_places, min_value=1, max_value=100):
+    """Generate numbers with the bulk mode's NumPy path."""
+    return np.concatenate(list(main._bulk_chunks(min_value, max_value, count, decimal_places)))
+
+
+def ndjson_generate(count, decimal_places, min_value=1, max_value=100):
+    """Generate and fully serialize the bulk mode's NDJSON body."""
+    parameters = {'min': min_value, 'max': max_value, 'count': count}
+    chunks = main._bulk_chunks(min_value, max_value, count, decimal_places)
+    return ''.join(main._ndjson_stream(parameters, chunks))
+
+
+def binary_generate(count, decimal_places, min_value=1, max_value=100):
+    """Generate and fully serialize the bulk mode's binary body."""
+    dtype = main.BINARY_DTYPES['int' if decimal_places == 0 else 'float']
+    chunks = main._bulk_chunks(min_value, max_value, count, decimal_places)
+    return b''.join(main._binary_stream(chunks, dtype))
+
+
+def best_of(func, repeat, *args):
+    """Return the fastest wall-clock time of `repeat` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=[100, 10_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    variants = [
+        ('loop', loop_generate),
+        ('vectorized', vectorized_generate),
+        ('ndjson', ndjson_generate),
+        ('binary', binary_generate),
+    ]
+
+    print(f"{'count':>10} {'decimals':>8} " + ' '.join(f'{name + " M/s":>15}' for name, _ in variants))
+    for count in args.counts:
+        for decimal_places in (0, 2):
+            rates = []
+            for _, func in variants:
+                seconds = best_of(func, args.repeat, count, decimal_places)
+                rates.append(count / seconds / 1e6)
+            print(f'{count:>10} {decimal_places:>8} ' + ' '.join(f'{rate:>15.2f}' for rate in rates))
+
+
+if __name__ == '__main__':
+    main_cli()
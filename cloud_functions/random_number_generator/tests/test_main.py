@@ -0,0 +1,76 @@
+"""Unit tests for the random number generator Cloud Functions."""
+
+import json
+import os
+import sys
+import unittest
+
+import numpy as np
+from flask import Flask, request
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+
+app = Flask(__name__)
+
+
+class TestBulkGeneration(unittest.TestCase):
+    """Test cases for generate_random_numbers_bulk."""
+
+    def post(self, body):
+        with app.test_request_context('/', method='POST', json=body):
+            response = main.generate_random_numbers_bulk(request)
+            if isinstance(response, tuple):
+                return response
+            return response.status_code, response.headers, response.get_data()
+
+    def test_ndjson_streams_header_then_values(self):
+        """NDJSON output starts with a header line and has one value per line."""
+        status, headers, body = self.post({'min': 1, 'max': 6, 'count': 100_000, 'seed': 7})
+        lines = body.decode().splitlines()
+        header = json.loads(lines[0])
+        values = [int(line) for line in lines[1:]]
+
+        self.assertEqual(status, 200)
+        self.assertEqual(headers['Content-Type'], 'application/x-ndjson')
+        self.assertEqual(header['status'], 'success')
+        self.assertEqual(header['parameters']['count'], 100_000)
+        self.assertEqual(len(values), 100_000)
+        self.assertEqual(set(values), {1, 2, 3, 4, 5, 6})
+
+    def test_binary_round_trips_floats(self):
+        """Binary output decodes with the advertised dtype and count."""
+        status, headers, body = self.post(
+            {'min': 0, 'max': 1, 'count': 1000, 'decimal_places': 3, 'format': 'binary'}
+        )
+        values = np.frombuffer(body, dtype=headers['X-Random-Dtype'])
+
+        self.assertEqual(status, 200)
+        self.assertEqual(len(values), int(headers['X-Random-Count']))
+        self.assertTrue(((values >= 0) & (values <= 1)).all())
+        np.testing.assert_array_equal(values, np.round(values, 3))
+
+    def test_seed_is_reproducible(self):
+        """The same seed yields the same numbers."""
+        body = {'min': 1, 'max': 1000, 'count': 5000, 'seed': 42, 'format': 'binary'}
+        self.assertEqual(self.post(body)[2], self.post(body)[2])
+        self.assertNotEqual(self.post(body)[2], self.post(dict(body, seed=43))[2])
+
+    def test_validation_errors(self):
+        """Invalid parameters are rejected before streaming."""
+        cases = [
+            ({'min': 5, 'max': 1}, 'min must be less than max'),
+            ({'count': main.BULK_MAX_COUNT + 1}, 'count must be between'),
+            ({'seed': -1}, 'seed must be a non-negative integer'),
+            ({'format': 'csv'}, 'format must be one of'),
+        ]
+        for body, message in cases:
+            payload, status, _ = self.post(body)
+            self.assertEqual(status, 400)
+            self.assertIn(message, json.loads(payload)['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
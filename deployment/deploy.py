@@ -19,10 +19,9 @@ import os
 
 import vertexai
 from absl import app, flags
-from mas_system.agent import root_agent
+from mas_system.agent import app as mas_app
 from dotenv import load_dotenv
 from vertexai import agent_engines
-from vertexai.preview.reasoning_engines import AdkApp
 
 FLAGS = flags.FLAGS
 flags.DEFINE_string("project_id", None, "GCP project ID.")
@@ -38,21 +37,23 @@ flags.mark_bool_flags_as_mutual_exclusive(["create", "delete"])
 
 def create() -> None:
     """Creates an agent engine for Multi-Agent System."""
-    adk_app = AdkApp(agent=root_agent, enable_tracing=True)
+    # Deploy the App, not just its root agent, so Agent Engine compacts long
+    # conversations the same way local runs do
+    adk_app = agent_engines.AdkApp(app=mas_app, enable_tracing=True)
 
     AGENT_WHL_FILE = "multi_agent_system-0.1.0-py3-none-any.whl"
     
     remote_agent = agent_engines.create(
         adk_app,
-        display_name=root_agent.name,
+        display_name=mas_app.root_agent.name,
         requirements=[
             AGENT_WHL_FILE,
-            "google-adk>=0.0.2",
-            "google-cloud-aiplatform[agent_engines]>=1.91.0,!=1.92.0",
-            "google-genai>=1.5.0,<2.0.0",
-            "pydantic>=2.10.6,<3.0.0",
+            "google-adk>=2.11.0,<3.0.0",
+            "google-cloud-aiplatform[agent_engines]>=1.157.0,<3.0.0",
+            "google-genai>=2.19.0,<3.0.0",
+            "pydantic>=2.12.0,<3.0.0",
             "absl-py>=2.2.1,<3.0.0",
-            "requests>=2.31.0,<3.0.0",
+            "requests>=2.32.4,<3.0.0",
             "httpx>=0.28.1,<1.0.0",
         ],
         extra_packages=[AGENT_WHL_FILE],
@@ -0,0 +1,184 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Import-time report for the MAS package.
+
+Imports a module in fresh interpreters with `python -X importtime` and
+reports the median cold import time, the slowest imports and the time
+spent per package. It also lists heavy client libraries that should only
+load on first use (Vertex AI RAG, Firestore, PyPDF2, NumPy) but were
+imported anyway.
+
+Usage:
+    python eval/import_time_report.py [--module mas_system.agent]
+        [--repeat 5] [--top 15] [--budget-ms 2500] [--json]
+
+With --budget-ms the script exits with status 1 when the median import
+time is over budget or a deferred library was imported.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Libraries that are imported lazily, on first use, and must not be pulled in
+# by importing the agent tree
+DEFERRED_MODULES = [
+    "vertexai",
+    "google.cloud.aiplatform",
+    "google.cloud.firestore",
+    "PyPDF2",
+    "numpy",
+]
+
+
+def run_importtime(module, python=sys.executable, cwd=None):
+    """
+    Import `module` in a fresh interpreter with -X importtime.
+
+    The interpreter runs in `cwd`, relative to the repository root (the root
+    itself by default).
+
+    Returns:
+        A list of (self_us, cumulative_us, depth, name) rows in the order
+        the interpreter printed them, and the set of every loaded module.
+    """
+    code = f"import sys, {module}; print('\\n'.join(sorted(sys.modules)))"
+    env = dict(os.environ, PYTHONWARNINGS="ignore", PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        cwd=os.path.join(REPO_ROOT, cwd or ""),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr), set(result.stdout.split())
+
+
+def parse_importtime(stderr):
+    """Parse `-X importtime` lines into (self_us, cumulative_us, depth, name) rows."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return rows
+
+
+def package_of(name):
+    """Group modules by distribution: google.cloud.aiplatform.x -> google.cloud.aiplatform."""
+    parts = name.split(".")
+    if parts[0] == "google" and len(parts) > 1:
+        return ".".join(parts[:3] if parts[1] == "cloud" and len(parts) > 2 else parts[:2])
+    return parts[0]
+
+
+def profile_import(module, python=sys.executable, cwd=None):
+    """
+    Profile one cold import of `module`.
+
+    Returns:
+        A dict with total_ms, the rows, per-package self time in ms and the
+        deferred libraries that were loaded.
+    """
+    rows, loaded = run_importtime(module, python, cwd)
+    total_us = next(cumulative for _, cumulative, _, name in reversed(rows) if name == module)
+    packages = defaultdict(int)
+    for self_us, _, _, name in rows:
+        packages[package_of(name)] += self_us
+    return {
+        "module": module,
+        "total_ms": total_us / 1000,
+        "rows": rows,
+        "packages_ms": {name: us / 1000 for name, us in packages.items()},
+        "deferred_loaded": [name for name in DEFERRED_MODULES if name in loaded],
+    }
+
+
+def summarize(profiles, top):
+    """Median total and the slowest imports and packages across several runs."""
+    last = profiles[-1]
+    # Skip the module itself and its parent packages, which only wrap it
+    module = last["module"]
+    heaviest = sorted(
+        (row for row in last["rows"] if row[3] != module and not module.startswith(row[3] + ".")),
+        key=lambda row: row[1],
+        reverse=True,
+    )
+    packages = sorted(last["packages_ms"].items(), key=lambda item: item[1], reverse=True)
+    return {
+        "total_ms": {
+            "median": statistics.median(p["total_ms"] for p in profiles),
+            "min": min(p["total_ms"] for p in profiles),
+            "max": max(p["total_ms"] for p in profiles),
+        },
+        "slowest_imports_ms": [
+            {"module": name, "cumulative": cumulative / 1000, "self": self_us / 1000}
+            for self_us, cumulative, _, name in heaviest[:top]
+        ],
+        "packages_ms": dict(packages[:top]),
+        "deferred_loaded": last["deferred_loaded"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold import time report")
+    parser.add_argument("--module", default="mas_system.agent")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Fail when the median import time is over this budget")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    # The first run warms the filesystem cache and compiles bytecode
+    run_importtime(args.module)
+    summary = summarize([profile_import(args.module) for _ in range(args.repeat)], args.top)
+    over_budget = args.budget_ms is not None and summary["total_ms"]["median"] > args.budget_ms
+    failed = over_budget or (args.budget_ms is not None and summary["deferred_loaded"])
+
+    if args.json:
+        print(json.dumps(dict(summary, module=args.module, budget_ms=args.budget_ms), indent=2))
+    else:
+        total = summary["total_ms"]
+        print(f"import {args.module}: median {total['median']:.0f} ms "
+              f"(min {total['min']:.0f}, max {total['max']:.0f}) over {args.repeat} runs")
+        if args.budget_ms is not None:
+            print(f"Budget: {args.budget_ms:.0f} ms ({'over' if over_budget else 'ok'})")
+        print("\nSlowest imports (cumulative / self, ms)")
+        for row in summary["slowest_imports_ms"]:
+            print(f"  {row['cumulative']:8.1f} {row['self']:8.1f}  {row['module']}")
+        print("\nSelf time per package (ms)")
+        for name, ms in summary["packages_ms"].items():
+            print(f"  {ms:8.1f}  {name}")
+        print("\nDeferred libraries loaded at import: "
+              f"{', '.join(summary['deferred_loaded']) or 'none'}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Accuracy and latency report for the fast-path and semantic routers.
+
+Scores the keyword rules, the nearest-centroid router and the two combined
+against the frontend's TEST_SCENARIOS (leave-one-out, since those
+messages also build the centroids) and a held-out routing eval set.
+
+Usage:
+    python eval/semantic_router_report.py [--embedder hashing|vertex]
+        [--min-score 0.2] [--min-margin 0.1] [--repeat 200] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import warnings
+
+warnings.filterwarnings("ignore")
+
+# Add repository root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mas_system.agent import build_semantic_index, mas_coordinator
+from mas_system.router import classify_intent, normalize_message
+from mas_system.semantic_router import create_embedder, load_test_scenarios
+
+EVALSET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "routing_evalset.json")
+
+SCENARIO_AGENTS = {
+    "greeter": "greeter_agent",
+    "weather": "weather_agent",
+    "rag": "rag_agent",
+    "academic": mas_coordinator.name,
+}
+FALLBACK = mas_coordinator.name
+
+
+def keyword_route(message):
+    decision = classify_intent(message)
+    if decision["agent"] and decision["confidence"] >= 0.8:
+        return decision["agent"]
+    return None
+
+
+def semantic_route(index, message):
+    return index.classify(normalize_message(message))["agent"]
+
+
+def score(cases, routes):
+    """Summarizes (expected, routed) pairs; None and the coordinator mean fallback."""
+    total = len(cases)
+    routed = [route if route not in (None, FALLBACK) else FALLBACK for route in routes]
+    correct = sum(1 for case, route in zip(cases, routed) if route == case["expected_agent"])
+    fast = sum(1 for route in routed if route != FALLBACK)
+    misroutes = sum(
+        1 for case, route in zip(cases, routed) if route != FALLBACK and route != case["expected_agent"]
+    )
+    return {
+        "accuracy": correct / total,
+        "fast_path_rate": fast / total,
+        "misroutes": misroutes,
+        "cases": total,
+    }
+
+
+def leave_one_out(scenarios, index_kwargs):
+    """Routes each scenario message with an index built from all the others."""
+    cases, keyword, semantic, combined = [], [], [], []
+    for name, examples in scenarios.items():
+        for position, example in enumerate(examples):
+            held_out = {key: list(value) for key, value in scenarios.items()}
+            del held_out[name][position]
+            index = build_semantic_index(scenarios=held_out, **index_kwargs)
+            cases.append({"message": example["message"], "expected_agent": SCENARIO_AGENTS[name]})
+            keyword.append(keyword_route(example["message"]))
+            semantic.append(semantic_route(index, example["message"]))
+            combined.append(keyword[-1] or semantic[-1])
+    return cases, keyword, semantic, combined
+
+
+def held_out(scenarios, cases, index_kwargs):
+    """Routes the held-out eval set with an index built from every scenario."""
+    index = build_semantic_index(scenarios=scenarios, **index_kwargs)
+    keyword = [keyword_route(case["message"]) for case in cases]
+    semantic = [semantic_route(index, case["message"]) for case in cases]
+    combined = [k or s for k, s in zip(keyword, semantic)]
+    return index, keyword, semantic, combined
+
+
+def latency(scenarios, index_kwargs, messages, repeat):
+    """Times the centroid build, single-message routing and one vectorized batch."""
+    index = build_semantic_index(scenarios=scenarios, **index_kwargs)
+    start = time.perf_counter()
+    index.classify("warm up")
+    build_ms = (time.perf_counter() - start) * 1000
+
+    def per_call(func):
+        samples = []
+        for _ in range(repeat):
+            for message in messages:
+                start = time.perf_counter()
+                func(message)
+                samples.append((time.perf_counter() - start) * 1e6)
+        samples.sort()
+        return statistics.median(samples), samples[int(len(samples) * 0.95)]
+
+    keyword_p50, keyword_p95 = per_call(keyword_route)
+    semantic_p50, semantic_p95 = per_call(lambda message: semantic_route(index, message))
+    start = time.perf_counter()
+    for _ in range(repeat):
+        index.classify_batch(messages)
+    batch_us = (time.perf_counter() - start) * 1e6 / (repeat * len(messages))
+    return {
+        "build_ms": build_ms,
+        "keyword": (keyword_p50, keyword_p95),
+        "semantic": (semantic_p50, semantic_p95),
+        "batch_per_message_us": batch_us,
+    }
+
+
+def print_scores(title, cases, keyword, semantic, combined):
+    print(f"\n{title} ({len(cases)} messages)")
+    print(f"{'router':<20} {'accuracy':>9} {'fast path':>10} {'misroutes':>10}")
+    for name, routes in (("keyword", keyword), ("semantic", semantic), ("keyword+semantic", combined)):
+        result = score(cases, routes)
+        print(
+            f"{name:<20} {result['accuracy']:>9.1%} {result['fast_path_rate']:>10.1%} "
+            f"{result['misroutes']:>10}"
+        )
+
+
+def print_misses(cases, routes):
+    misses = [(case, route or FALLBACK) for case, route in zip(cases, routes) if (route or FALLBACK) != case["expected_agent"]]
+    if misses:
+        print("\nkeyword+semantic misses on the held-out set:")
+        for case, route in misses:
+            print(f"  {case['message']!r}: expected {case['expected_agent']}, routed {route}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Routing accuracy and latency report")
+    parser.add_argument("--embedder", default="hashing", choices=["hashing", "vertex"])
+    parser.add_argument("--min-score", type=float, default=None)
+    parser.add_argument("--min-margin", type=float, default=None)
+    parser.add_argument("--evalset", default=EVALSET_PATH)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    index_kwargs = {"embedder": create_embedder(args.embedder)}
+    if args.min_score is not None:
+        index_kwargs["min_score"] = args.min_score
+    if args.min_margin is not None:
+        index_kwargs["min_margin"] = args.min_margin
+
+    scenarios = load_test_scenarios()
+    if not scenarios:
+        sys.exit("TEST_SCENARIOS not found; set MAS_SEMANTIC_ROUTER_SCENARIOS")
+    with open(args.evalset, encoding="utf-8") as f:
+        evalset = json.load(f)["cases"]
+
+    loo = leave_one_out(scenarios, index_kwargs)
+    index, *held = held_out(scenarios, evalset, index_kwargs)
+    timings = latency(scenarios, index_kwargs, [case["message"] for case in evalset], args.repeat)
+
+    if args.json:
+        print(json.dumps({
+            "leave_one_out": {name: score(loo[0], routes) for name, routes in zip(("keyword", "semantic", "combined"), loo[1:])},
+            "held_out": {name: score(evalset, routes) for name, routes in zip(("keyword", "semantic", "combined"), held)},
+            "latency": timings,
+        }, indent=2))
+        return
+
+    print(f"Embedder: {args.embedder}  min_score: {index.min_score}  min_margin: {index.min_margin}")
+    print_scores("TEST_SCENARIOS, leave-one-out", *loo)
+    print_scores("Held-out routing eval set", evalset, *held)
+    print_misses(evalset, held[2])
+    print(f"\nLatency ({args.repeat} passes over the held-out set)")
+    print(f"  centroid build (first use): {timings['build_ms']:.1f} ms")
+    print(f"  keyword rules:    p50 {timings['keyword'][0]:.1f} us  p95 {timings['keyword'][1]:.1f} us")
+    print(f"  semantic lookup:  p50 {timings['semantic'][0]:.1f} us  p95 {timings['semantic'][1]:.1f} us")
+    print(f"  semantic batch:   {timings['batch_per_message_us']:.1f} us per message")
+
+
+if __name__ == "__main__":
+    main()
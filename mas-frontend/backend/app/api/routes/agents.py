@@ -20,4 +20,14 @@ async def get_agent_metrics(tracking_service: TrackingService = Depends(get_trac
 @router.get("/tools")
 async def get_tool_usage(tracking_service: TrackingService = Depends(get_tracking_service)) -> Dict[str, int]:
     """Get tool usage statistics"""
-    return await tracking_service.get_tool_usage_stats()
\ No newline at end of file
+    return await tracking_service.get_tool_usage_stats()
+
+@router.get("/cache")
+async def get_response_cache_stats(mas_service: MASService = Depends(get_mas_service)) -> Dict[str, Any]:
+    """Get response cache size and hit rate"""
+    return mas_service.mas_client.get_cache_stats()
+
+@router.get("/sessions")
+async def get_session_pool_stats(mas_service: MASService = Depends(get_mas_service)) -> Dict[str, Any]:
+    """Get ADK session pool size and concurrent run counts"""
+    return mas_service.mas_client.get_pool_stats()
@@ -127,7 +127,7 @@ async def validate_tools(
     agent_info = await mas_service.get_agent_info()
     
     expected_tools = {
-        "Weather Agent": ["get_current_weather", "get_weather_forecast", "get_random_lucky_number", "get_random_temperature_adjustment"],
+        "Weather Agent": ["get_current_weather", "get_weather_forecast", "get_current_weather_and_forecast", "get_weather_for_locations", "get_random_lucky_number", "get_random_temperature_adjustment"],
         "RAG Agent": ["create_corpus", "list_corpora", "add_data", "rag_query", "get_corpus_info", "delete_document", "delete_corpus"],
         "Academic WebSearch": ["google_search"],
         "Academic NewResearch": [],
@@ -124,9 +124,11 @@ async def websocket_endpoint(
                     
                     # Send the agent response to the client
                     print(f"Sending agent response: {response[:100] if response else 'None'}...")
+                    # Completion frame: replaces the text streamed in agent_response_delta frames
                     await websocket.send_json({
                         "type": "agent_response",
                         "message_id": assistant_message.id,
+                        "request_id": execution_trace.request_id,
                         "content": response,
                         "agent_responses": execution_trace.agent_responses
                     })
@@ -19,10 +19,16 @@ class Settings(BaseSettings):
     # Session Settings
     SESSION_TIMEOUT_MINUTES: int = 60
     MAX_SESSIONS_PER_USER: int = 5
+    # ADK sessions kept in memory; the least recently used is dropped past this
+    MAS_SESSION_POOL_SIZE: int = 256
+    # Agent turns allowed to run at once across all sessions
+    MAS_MAX_CONCURRENT_RUNS: int = 8
     
     # WebSocket Settings
     WS_HEARTBEAT_INTERVAL: int = 30
     WS_MESSAGE_QUEUE_SIZE: int = 100
+    # Send agent_response_delta frames while the model is still generating
+    WS_STREAM_RESPONSES: bool = True
     
     # Export Settings
     EXPORT_MAX_MESSAGES: int = 1000
@@ -3,9 +3,9 @@
 import sys
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncGenerator
 import asyncio
-import vertexai
+import uuid
 from dotenv import load_dotenv
 import logging
 
@@ -31,10 +31,10 @@ for env_path in env_paths:
     if env_path.exists():
         load_dotenv(env_path)
 
-# Initialize Vertex AI before importing agents
+# Point ADK at Vertex AI. vertexai itself is not imported here: it takes
+# seconds to load, and the RAG tools import and initialize it on first use
 project = os.getenv("GOOGLE_CLOUD_PROJECT", "pickuptruckapp")
 location = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
-vertexai.init(project=project, location=location)
 
 # Set environment variable to ensure ADK uses Vertex AI
 os.environ['GOOGLE_GENAI_USE_VERTEXAI'] = 'true'
@@ -47,16 +47,48 @@ os.environ['GOOGLE_CLOUD_LOCATION'] = location
 class MASClient:
     """Client for interacting with the MAS system"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_sessions: int = 256,
+        session_idle_seconds: float = 3600.0,
+        max_concurrent_runs: int = 8
+    ):
         self.coordinator = None
         self._connected = False
+        self._response_cache = None
+        self._runner = None
+        self._pool = None
+        self._pool_options = {
+            "max_sessions": max_sessions,
+            "idle_seconds": session_idle_seconds,
+            "max_concurrent_runs": max_concurrent_runs,
+        }
         
-    async def connect(self):
-        """Initialize connection to MAS system"""
+    async def connect(self, mas_app=None):
+        """Initialize connection to MAS system
+
+        Args:
+            mas_app: ADK App to run (defaults to mas_system.agent.app)
+        """
         try:
-            # Import MAS coordinator
-            from mas_system.agent import mas_coordinator
-            self.coordinator = mas_coordinator
+            if mas_app is None:
+                # Import the MAS app (fast-path router ahead of the coordinator)
+                from mas_system.agent import app as mas_app
+            root_agent = mas_app.root_agent
+            from mas_system.config import MAS_RESPONSE_CACHE_ENABLED
+            from mas_system.response_cache import ResponseCache, collect_agent_names
+            from google.adk.runners import InMemoryRunner
+            from app.core.session_pool import SessionPool
+            self.coordinator = root_agent
+            # One runner for all users; each frontend session gets its own ADK session.
+            # Built from the app so long conversations are compacted
+            self._runner = InMemoryRunner(app=mas_app)
+            self._pool = SessionPool(self._runner.session_service, self._runner.app_name, **self._pool_options)
+            if MAS_RESPONSE_CACHE_ENABLED:
+                self._response_cache = ResponseCache()
+                self._agent_names = collect_agent_names(root_agent)
+                # The root router and the coordinator only pick who answers
+                self._routers = {root_agent.name, getattr(root_agent, "fallback_agent", root_agent.name)}
             self._connected = True
             logger.info("Successfully connected to MAS system")
         except Exception as e:
@@ -67,6 +99,9 @@ class MASClient:
     async def disconnect(self):
         """Cleanup connection"""
         self.coordinator = None
+        self._response_cache = None
+        self._runner = None
+        self._pool = None
         self._connected = False
         
     async def is_healthy(self) -> bool:
@@ -79,49 +114,132 @@ class MASClient:
             raise RuntimeError("MAS client not connected")
         return self.coordinator
         
-    async def send_message(self, message: str) -> str:
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get response cache size and hit-rate counters"""
+        if self._response_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._response_cache.stats()}
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get session pool size and concurrency counters"""
+        if self._pool is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._pool.stats()}
+
+    async def _record_cached_turn(self, session, content, cached) -> None:
+        """Append a cached exchange to the session so follow-ups keep their context"""
+        from google.adk.events import Event
+        from google.genai import types
+
+        invocation_id = f"e-{uuid.uuid4()}"
+        await self._runner.session_service.append_event(
+            session, Event(invocation_id=invocation_id, author="user", content=content)
+        )
+        await self._runner.session_service.append_event(
+            session,
+            Event(
+                invocation_id=invocation_id,
+                author=cached.author,
+                content=types.ModelContent(parts=[types.Part(text=cached.response)]),
+            ),
+        )
+
+    async def send_message(self, message: str, session_id: str = "default") -> str:
         """Send a message to the MAS coordinator"""
+        response_text = ""
+        async for chunk in self.stream_message(message, session_id, stream=False):
+            if chunk["type"] == "complete":
+                response_text = chunk["text"]
+        return response_text
+
+    async def stream_message(
+        self,
+        message: str,
+        session_id: str = "default",
+        stream: bool = True
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Send a message to the MAS coordinator and yield the answer as it arrives
+
+        Each frontend session_id runs in its own ADK session, one turn at a
+        time. Yields {"type": "delta", "text", "author"} for each new piece
+        of text and finally {"type": "complete", "text", "cached"} with the
+        full answer. With stream=False the model answers in one piece, so
+        each agent's text arrives as a single delta.
+        """
         if not self._connected:
             raise RuntimeError("MAS client not connected")
-            
+
+        async with self._pool.session(session_id) as pooled:
+            async for chunk in self._run_turn(message, pooled, stream):
+                yield chunk
+
+    async def _run_turn(self, message: str, pooled, stream: bool) -> AsyncGenerator[Dict[str, Any], None]:
+        """Run one turn in a pooled ADK session"""
         try:
-            # Replicate the exact pattern from test_local.py
-            from google.adk.runners import InMemoryRunner
+            from google.adk.agents.run_config import RunConfig, StreamingMode
             from google.genai import types
-            
-            if not hasattr(self, '_runner'):
-                # Create runner exactly like in test_local.py
-                self._runner = InMemoryRunner(agent=self.coordinator)
-                self._session = await self._runner.session_service.create_session(
-                    app_name=self._runner.app_name, user_id="test_user"
-                )
-                logger.info(f"Created MAS runner and session: {self._session.id}")
-            
+
             # Create user content exactly like in test_local.py
             content = types.UserContent(parts=[types.Part(text=message)])
-            logger.info(f"Sending message to MAS: {message}")
+
+            # Serve repeated questions from the response cache. The cache is shared
+            # by all sessions, so only keyword-routed, self-contained requests use
+            # it; follow-ups answered from the conversation never do
+            cache_key = None
+            route = None
+            if self._response_cache is not None and hasattr(self.coordinator, "keyword_target"):
+                route = self.coordinator.keyword_target(content)
+            if route is not None:
+                from mas_system.response_cache import response_cache_key
+
+                session = await self._pool.get_session(pooled)
+                cache_key = response_cache_key(message, route.name, session.state)
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    await self._record_cached_turn(session, content, cached)
+                    logger.info(f"Response cache hit ({', '.join(cached.agents)}): {message}")
+                    yield {"type": "delta", "text": cached.response, "author": cached.author}
+                    yield {"type": "complete", "text": cached.response, "cached": True}
+                    return
+                generations = self._response_cache.snapshot()
+
+            logger.info(f"Sending message to MAS (session {pooled.frontend_id}): {message}")
             
             # Execute through runner exactly like in test_local.py
             response_text = ""
             event_count = 0
             
-            # Collect all events first
+            # Partial (streamed) events are forwarded as deltas. The response is
+            # built from the delivered text, so it always matches the deltas
             events = []
+            streamed = ""
+            run_config = RunConfig(streaming_mode=StreamingMode.SSE if stream else StreamingMode.NONE)
             async for event in self._runner.run_async(
-                user_id=self._session.user_id,
-                session_id=self._session.id,
+                user_id=pooled.user_id,
+                session_id=pooled.adk_session_id,
                 new_message=content,
+                run_config=run_config,
             ):
+                text = _event_text(event)
+                if event.partial:
+                    if text:
+                        streamed += text
+                        yield {"type": "delta", "text": text, "author": event.author}
+                    continue
+
                 events.append(event)
                 event_count += 1
-            
-            # Process events to extract text
-            for event in events:
-                if event.content and event.content.parts:
-                    for part in event.content.parts:
-                        if hasattr(part, 'text') and part.text:
-                            response_text += part.text
-                            logger.info(f"Got text from MAS: {part.text[:100]}...")
+                if text:
+                    logger.info(f"Got text from MAS: {text[:100]}...")
+                # The complete event repeats its partials; only send what they have
+                # not delivered. If it disagrees with them, the streamed text stands
+                remainder = text[len(streamed):] if text.startswith(streamed) else ""
+                if remainder:
+                    yield {"type": "delta", "text": remainder, "author": event.author}
+                response_text += streamed + remainder
+                streamed = ""
+            # Partials the stream ended on without a complete event
+            response_text += streamed
             
             # If no text found but we have events, the response might be in the last event
             if not response_text and events:
@@ -138,7 +256,25 @@ class MASClient:
                                 response_text += part.text
             
             logger.info(f"MAS processing complete. Events: {event_count}, Response length: {len(response_text)}")
-            return response_text if response_text else "No response generated"
+
+            if cache_key is not None and response_text and not any(event.error_code for event in events):
+                from mas_system.response_cache import responding_agents
+
+                author = next(
+                    (event.author for event in reversed(events) if _event_text(event)),
+                    self.coordinator.name,
+                )
+                agents = responding_agents(events, self._agent_names, self._routers)
+                if agents == [route.name]:
+                    self._response_cache.put(cache_key, response_text, author, agents, generations)
+            yield {"type": "complete", "text": response_text if response_text else "No response generated", "cached": False}
         except Exception as e:
             logger.error(f"Error sending message to MAS: {e}")
-            raise
\ No newline at end of file
+            raise
+
+
+def _event_text(event) -> str:
+    """Concatenate the text parts of an ADK event"""
+    if not event.content or not event.content.parts:
+        return ""
+    return "".join(part.text for part in event.content.parts if getattr(part, "text", None))
@@ -0,0 +1,152 @@
+"""Pool of ADK sessions keyed by frontend session ID"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PooledSession:
+    """An ADK session bound to one frontend session"""
+    frontend_id: str
+    user_id: str
+    adk_session_id: str
+    last_used: float
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    runs: int = 0
+    pending: int = 0
+
+    @property
+    def in_use(self) -> bool:
+        return self.pending > 0 or self.lock.locked()
+
+
+class SessionPool:
+    """Maps frontend session IDs to ADK sessions on a shared runner
+
+    Each frontend session gets its own ADK session, so conversations never
+    share context. Turns within one session run one at a time, and at most
+    max_concurrent_runs turns run across all sessions at once. Sessions idle
+    for longer than idle_seconds are dropped. Past max_sessions, the least
+    recently used session is dropped; sessions with a turn in progress are
+    never dropped.
+    """
+
+    def __init__(
+        self,
+        session_service: Any,
+        app_name: str,
+        max_sessions: int = 256,
+        idle_seconds: float = 3600.0,
+        max_concurrent_runs: int = 8,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.session_service = session_service
+        self.app_name = app_name
+        self.max_sessions = max_sessions
+        self.idle_seconds = idle_seconds
+        self.max_concurrent_runs = max_concurrent_runs
+        self._clock = clock
+        self._sessions: "OrderedDict[str, PooledSession]" = OrderedDict()
+        self._pool_lock = asyncio.Lock()
+        self._run_slots = asyncio.Semaphore(max_concurrent_runs)
+        self._active_runs = 0
+        self._waiting = 0
+        self.created = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @asynccontextmanager
+    async def session(self, frontend_id: str) -> AsyncIterator[PooledSession]:
+        """Hold a frontend session's ADK session for the duration of one turn"""
+        pooled = await self._get_or_create(frontend_id)
+        self._waiting += 1
+        try:
+            await pooled.lock.acquire()
+            try:
+                await self._run_slots.acquire()
+            except BaseException:
+                pooled.lock.release()
+                raise
+        finally:
+            self._waiting -= 1
+            pooled.pending -= 1
+
+        self._active_runs += 1
+        try:
+            yield pooled
+        finally:
+            self._active_runs -= 1
+            pooled.runs += 1
+            pooled.last_used = self._clock()
+            self._run_slots.release()
+            pooled.lock.release()
+
+    async def get_session(self, pooled: PooledSession) -> Any:
+        """Fetch the current ADK session; the session service hands out copies"""
+        return await self.session_service.get_session(
+            app_name=self.app_name, user_id=pooled.user_id, session_id=pooled.adk_session_id
+        )
+
+    async def _get_or_create(self, frontend_id: str) -> PooledSession:
+        async with self._pool_lock:
+            now = self._clock()
+            await self._drop(self._expired(now), expired=True)
+
+            pooled = self._sessions.get(frontend_id)
+            if pooled is None:
+                session = await self.session_service.create_session(app_name=self.app_name, user_id=frontend_id)
+                pooled = PooledSession(frontend_id, frontend_id, session.id, now)
+                self._sessions[frontend_id] = pooled
+                self.created += 1
+                logger.info(f"Created ADK session {session.id} for frontend session {frontend_id}")
+            pooled.last_used = now
+            pooled.pending += 1
+            self._sessions.move_to_end(frontend_id)
+
+            await self._drop(self._over_capacity(), expired=False)
+            return pooled
+
+    def _expired(self, now: float) -> List[PooledSession]:
+        return [
+            pooled for pooled in self._sessions.values()
+            if not pooled.in_use and now - pooled.last_used > self.idle_seconds
+        ]
+
+    def _over_capacity(self) -> List[PooledSession]:
+        excess = len(self._sessions) - self.max_sessions
+        idle = [pooled for pooled in self._sessions.values() if not pooled.in_use]
+        return idle[:max(excess, 0)]
+
+    async def _drop(self, sessions: List[PooledSession], expired: bool) -> None:
+        for pooled in sessions:
+            del self._sessions[pooled.frontend_id]
+            if expired:
+                self.expirations += 1
+            else:
+                self.evictions += 1
+            try:
+                await self.session_service.delete_session(
+                    app_name=self.app_name, user_id=pooled.user_id, session_id=pooled.adk_session_id
+                )
+            except Exception as e:
+                logger.warning(f"Failed to delete ADK session {pooled.adk_session_id}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size and concurrency counters for monitoring"""
+        return {
+            "sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "active_runs": self._active_runs,
+            "waiting": self._waiting,
+            "max_concurrent_runs": self.max_concurrent_runs,
+            "created": self.created,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
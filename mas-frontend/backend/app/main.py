@@ -3,8 +3,6 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import uvicorn
 from datetime import datetime
-import os
-import vertexai
 
 from app.api.routes import chat, agents, sessions, websocket, test
 from app.core.config import settings
@@ -13,11 +11,6 @@ from app.services.mas_service import MASService
 from app.services.tracking_service import TrackingService
 from app.api.dependencies import init_services
 
-# Initialize Vertex AI at module level, just like test_local.py
-project = os.getenv("GOOGLE_CLOUD_PROJECT", "pickuptruckapp")
-location = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
-vertexai.init(project=project, location=location)
-
 # Initialize services
 session_service = SessionService()
 mas_service = MASService()
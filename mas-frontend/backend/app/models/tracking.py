@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 from .agent import AgentResponse
 
@@ -10,6 +10,7 @@ class ExecutionTrace(BaseModel):
     coordinator_response: str
     agent_sequence: List[str]
     total_time_ms: float
+    time_to_first_token_ms: Optional[float] = None
     agent_responses: List[AgentResponse]
     timestamp: datetime
     
@@ -9,10 +9,15 @@ from app.models.agent import AgentResponse, ToolCall
 from app.models.tracking import ExecutionTrace
 from app.core.tracking import TrackingInterceptor
 from app.core.mas_client import MASClient
+from app.core.config import settings
 
 class MASService:
     def __init__(self):
-        self.mas_client = MASClient()
+        self.mas_client = MASClient(
+            max_sessions=settings.MAS_SESSION_POOL_SIZE,
+            session_idle_seconds=settings.SESSION_TIMEOUT_MINUTES * 60,
+            max_concurrent_runs=settings.MAS_MAX_CONCURRENT_RUNS
+        )
         self.tracking_interceptor = TrackingInterceptor()
         self._initialized = False
         
@@ -29,6 +34,19 @@ class MASService:
         """Check if MAS is connected and healthy"""
         return self._initialized and await self.mas_client.is_healthy()
         
+    async def _notify(self, websocket_callback: Optional[Callable], payload: Dict) -> None:
+        """Send an update through the callback, whether it is sync or async"""
+        if not websocket_callback:
+            return
+        try:
+            import inspect
+            if inspect.iscoroutinefunction(websocket_callback):
+                await websocket_callback(payload)
+            else:
+                websocket_callback(payload)
+        except Exception as e:
+            print(f"Error in websocket callback: {e}")
+
     async def process_message(
         self, 
         message: str, 
@@ -52,30 +70,33 @@ class MASService:
         self.tracking_interceptor.start_request(request_id, session_id)
         
         # Notify start
-        if websocket_callback:
-            try:
-                # Check if callback is async
-                import inspect
-                if inspect.iscoroutinefunction(websocket_callback):
-                    await websocket_callback({
-                        "type": "execution_start",
-                        "request_id": request_id,
-                        "timestamp": datetime.now().isoformat()
-                    })
-                else:
-                    # Call synchronously
-                    websocket_callback({
-                        "type": "execution_start",
-                        "request_id": request_id,
-                        "timestamp": datetime.now().isoformat()
-                    })
-            except Exception as e:
-                print(f"Error in websocket callback: {e}")
+        await self._notify(websocket_callback, {
+            "type": "execution_start",
+            "request_id": request_id,
+            "timestamp": datetime.now().isoformat()
+        })
         
         try:
             # Execute request directly through MAS client
             start_time = time.time()
-            response = await self.mas_client.send_message(message)
+            first_token_time = None
+            if websocket_callback:
+                # Forward text as it arrives so the first words show up early
+                response = ""
+                async for chunk in self.mas_client.stream_message(message, session_id, stream=settings.WS_STREAM_RESPONSES):
+                    if chunk["type"] == "delta":
+                        if first_token_time is None:
+                            first_token_time = (time.time() - start_time) * 1000
+                        await self._notify(websocket_callback, {
+                            "type": "agent_response_delta",
+                            "request_id": request_id,
+                            "delta": chunk["text"],
+                            "author": chunk["author"]
+                        })
+                    else:
+                        response = chunk["text"]
+            else:
+                response = await self.mas_client.send_message(message, session_id)
             total_time = (time.time() - start_time) * 1000
             
             # Get tracking data
@@ -90,56 +111,30 @@ class MASService:
                 coordinator_response=response,
                 agent_sequence=agent_sequence,
                 total_time_ms=total_time,
+                time_to_first_token_ms=first_token_time,
                 agent_responses=agent_responses,
                 timestamp=datetime.now()
             )
             
             # Notify completion
-            if websocket_callback:
-                try:
-                    import inspect
-                    if inspect.iscoroutinefunction(websocket_callback):
-                        await websocket_callback({
-                            "type": "execution_complete",
-                            "request_id": request_id,
-                            "response": response,
-                            "execution_trace": json.loads(execution_trace.json()),
-                            "timestamp": datetime.now().isoformat()
-                        })
-                    else:
-                        websocket_callback({
-                            "type": "execution_complete",
-                            "request_id": request_id,
-                            "response": response,
-                            "execution_trace": json.loads(execution_trace.json()),
-                            "timestamp": datetime.now().isoformat()
-                        })
-                except Exception as e:
-                    print(f"Error in websocket callback: {e}")
+            await self._notify(websocket_callback, {
+                "type": "execution_complete",
+                "request_id": request_id,
+                "response": response,
+                "execution_trace": json.loads(execution_trace.json()),
+                "timestamp": datetime.now().isoformat()
+            })
             
             return response, execution_trace
             
         except Exception as e:
             # Notify error
-            if websocket_callback:
-                try:
-                    import inspect
-                    if inspect.iscoroutinefunction(websocket_callback):
-                        await websocket_callback({
-                            "type": "execution_error",
-                            "request_id": request_id,
-                            "error": str(e),
-                            "timestamp": datetime.now().isoformat()
-                        })
-                    else:
-                        websocket_callback({
-                            "type": "execution_error",
-                            "request_id": request_id,
-                            "error": str(e),
-                            "timestamp": datetime.now().isoformat()
-                        })
-                except Exception as e2:
-                    print(f"Error in websocket callback: {e2}")
+            await self._notify(websocket_callback, {
+                "type": "execution_error",
+                "request_id": request_id,
+                "error": str(e),
+                "timestamp": datetime.now().isoformat()
+            })
             raise
         finally:
             # Cleanup tracking
@@ -158,7 +153,7 @@ class MASService:
                     "name": "Weather Agent",
                     "type": "weather_agent",
                     "description": "Provides weather information and forecasts",
-                    "tools": ["get_current_weather", "get_weather_forecast", "get_random_lucky_number", "get_random_temperature_adjustment"],
+                    "tools": ["get_current_weather", "get_weather_forecast", "get_current_weather_and_forecast", "get_weather_for_locations", "get_random_lucky_number", "get_random_temperature_adjustment"],
                     "color": "#3498db",
                     "icon": "🌤️"
                 },
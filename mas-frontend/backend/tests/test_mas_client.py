@@ -0,0 +1,213 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the MAS client's turn handling."""
+
+from types import SimpleNamespace
+from typing import AsyncGenerator, List
+
+import pytest
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.apps import App
+from google.adk.events import Event
+from google.genai import types
+
+from app.core.mas_client import MASClient
+from app.core.session_pool import PooledSession
+from mas_system.router import FastPathRouter
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+class ScriptedAgent(BaseAgent):
+    """Answers with its name, the asking user and how often it has run."""
+
+    calls: int = 0
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        self.calls += 1
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            branch=ctx.branch,
+            content=types.ModelContent(parts=[types.Part(text=f"{self.name} for {ctx.session.user_id} #{self.calls}")]),
+        )
+
+
+def make_app() -> App:
+    router = FastPathRouter(
+        name="mas_router",
+        fallback_agent="mas_coordinator",
+        enabled=True,
+        sub_agents=[
+            ScriptedAgent(name="mas_coordinator"),
+            ScriptedAgent(name="weather_agent"),
+        ],
+    )
+    return App(name="mas_system", root_agent=router)
+
+
+class FakeRunner:
+    """Replays a fixed list of events for every turn."""
+
+    def __init__(self, events: List[Event]):
+        self.events = events
+        self.calls = []
+
+    async def run_async(self, **kwargs) -> AsyncGenerator[Event, None]:
+        self.calls.append(kwargs)
+        for event in self.events:
+            yield event
+
+
+def text_event(author: str, text: str, partial: bool = False) -> Event:
+    parts = [types.Part(text=text)] if text else []
+    return Event(author=author, partial=partial, content=types.Content(role="model", parts=parts))
+
+
+def tool_call_event(author: str, name: str) -> Event:
+    call = types.Part(function_call=types.FunctionCall(name=name, args={}))
+    return Event(author=author, content=types.Content(role="model", parts=[call]))
+
+
+async def run_turn(events: List[Event], stream: bool = True) -> tuple:
+    client = MASClient()
+    client.coordinator = SimpleNamespace(name="mas_router")
+    client._runner = FakeRunner(events)
+    pooled = PooledSession("alice", "alice", "adk-1", 0.0)
+    chunks = [chunk async for chunk in client._run_turn("hi", pooled, stream)]
+    deltas = chunks[:-1]
+    assert all(chunk["type"] == "delta" for chunk in deltas)
+    assert chunks[-1]["type"] == "complete"
+    return deltas, chunks[-1]["text"]
+
+
+@pytest.fixture
+async def client():
+    client = MASClient()
+    await client.connect(make_app())
+    yield client
+    await client.disconnect()
+
+
+async def ask(client: MASClient, session_id: str, message: str) -> dict:
+    chunks = [chunk async for chunk in client.stream_message(message, session_id, stream=False)]
+    return chunks[-1]
+
+
+@pytest.mark.asyncio
+async def test_keyword_routed_answer_is_shared(client):
+    weather = client.coordinator.find_agent("weather_agent")
+
+    first = await ask(client, "alice", "What is the weather in London?")
+    second = await ask(client, "bob", "What is the weather in London?")
+
+    assert first["cached"] is False
+    assert second == {"type": "complete", "text": first["text"], "cached": True}
+    assert weather.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_follow_up_is_not_served_across_sessions(client):
+    await ask(client, "alice", "What is the weather in London?")
+    await ask(client, "bob", "What is the weather in London?")
+
+    alice = await ask(client, "alice", "and tomorrow?")
+    bob = await ask(client, "bob", "and tomorrow?")
+
+    assert alice["cached"] is False
+    assert bob["cached"] is False
+    assert alice["text"] == "mas_coordinator for alice #1"
+    assert bob["text"] == "mas_coordinator for bob #2"
+    assert client.get_cache_stats()["size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_document_questions_are_not_cached(client):
+    first = await ask(client, "alice", "What does the docs corpus say about onboarding?")
+    second = await ask(client, "bob", "What does the docs corpus say about onboarding?")
+
+    assert first["cached"] is False
+    assert second["cached"] is False
+    assert client.get_cache_stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_only_what_partials_missed():
+    deltas, final = await run_turn([
+        text_event("weather_agent", "It is ", partial=True),
+        text_event("weather_agent", "sunny", partial=True),
+        text_event("weather_agent", "It is sunny in Oslo."),
+    ])
+
+    assert [delta["text"] for delta in deltas] == ["It is ", "sunny", " in Oslo."]
+    assert "".join(delta["text"] for delta in deltas) == final == "It is sunny in Oslo."
+
+
+@pytest.mark.asyncio
+async def test_stream_keeps_partials_when_final_disagrees():
+    deltas, final = await run_turn([
+        text_event("weather_agent", "It is sunny", partial=True),
+        text_event("weather_agent", "Sunny skies in Oslo."),
+    ])
+
+    assert "".join(delta["text"] for delta in deltas) == final == "It is sunny"
+
+
+@pytest.mark.asyncio
+async def test_stream_with_several_authors():
+    deltas, final = await run_turn([
+        tool_call_event("mas_coordinator", "weather_agent"),
+        text_event("weather_agent", "Sunny. ", partial=True),
+        text_event("weather_agent", "Sunny. "),
+        text_event("rag_agent", "Found ", partial=True),
+        text_event("rag_agent", "Found 2 files."),
+        text_event("mas_coordinator", "Done."),
+    ])
+
+    assert [(delta["author"], delta["text"]) for delta in deltas] == [
+        ("weather_agent", "Sunny. "),
+        ("rag_agent", "Found "),
+        ("rag_agent", "2 files."),
+        ("mas_coordinator", "Done."),
+    ]
+    assert "".join(delta["text"] for delta in deltas) == final == "Sunny. Found 2 files.Done."
+
+
+@pytest.mark.asyncio
+async def test_stream_with_empty_final_text():
+    deltas, final = await run_turn([
+        text_event("greeter_agent", "Hello", partial=True),
+        text_event("greeter_agent", "", partial=False),
+        text_event("greeter_agent", " again", partial=True),
+    ])
+
+    assert "".join(delta["text"] for delta in deltas) == final == "Hello again"
+
+
+@pytest.mark.asyncio
+async def test_turn_without_text_reports_no_response():
+    deltas, final = await run_turn([tool_call_event("mas_coordinator", "weather_agent")])
+
+    assert deltas == []
+    assert final == "No response generated"
+
+
+@pytest.mark.asyncio
+async def test_non_streaming_turn_sends_each_answer_once():
+    deltas, final = await run_turn([text_event("greeter_agent", "Hi there!")], stream=False)
+
+    assert [delta["text"] for delta in deltas] == ["Hi there!"]
+    assert final == "Hi there!"
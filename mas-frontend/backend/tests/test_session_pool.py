@@ -0,0 +1,159 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ADK session pool."""
+
+import asyncio
+
+import pytest
+from google.adk.sessions import InMemorySessionService
+
+from app.core.session_pool import SessionPool
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_pool(**kwargs):
+    clock = FakeClock()
+    service = InMemorySessionService()
+    return SessionPool(service, "mas_system", clock=clock, **kwargs), service, clock
+
+
+async def use(pool: SessionPool, frontend_id: str):
+    async with pool.session(frontend_id) as pooled:
+        return pooled
+
+
+async def adk_session_ids(service, user_id: str) -> list:
+    response = await service.list_sessions(app_name="mas_system", user_id=user_id)
+    return [session.id for session in response.sessions]
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_reused_per_frontend_id():
+    pool, _, _ = make_pool()
+
+    first = await use(pool, "alice")
+    again = await use(pool, "alice")
+    other = await use(pool, "bob")
+
+    assert again is first
+    assert other.adk_session_id != first.adk_session_id
+    assert first.runs == 2
+    assert pool.stats()["created"] == 2
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_session_is_evicted_at_capacity():
+    pool, service, clock = make_pool(max_sessions=2)
+    alice = await use(pool, "alice")
+    clock.now = 1
+    await use(pool, "bob")
+    clock.now = 2
+    await use(pool, "alice")
+
+    clock.now = 3
+    await use(pool, "carol")
+
+    assert pool.stats()["sessions"] == 2
+    assert pool.stats()["evictions"] == 1
+    assert await adk_session_ids(service, "bob") == []
+    assert await adk_session_ids(service, "alice") == [alice.adk_session_id]
+    # Bob comes back to a fresh conversation
+    assert (await use(pool, "bob")).runs == 1
+
+
+@pytest.mark.asyncio
+async def test_session_with_turn_in_progress_is_not_evicted():
+    pool, _, _ = make_pool(max_sessions=1)
+
+    async with pool.session("alice") as alice:
+        await use(pool, "bob")
+        assert pool.stats()["sessions"] == 2
+
+    # Over capacity until a later turn finds alice idle
+    await use(pool, "carol")
+    assert pool.stats()["sessions"] == 1
+    assert (await use(pool, "alice")) is not alice
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_expire():
+    pool, service, clock = make_pool(idle_seconds=10)
+    await use(pool, "alice")
+    clock.now = 5
+    await use(pool, "bob")
+
+    clock.now = 12
+    await use(pool, "bob")
+    assert pool.stats()["expirations"] == 1
+    assert pool.stats()["sessions"] == 1
+    assert await adk_session_ids(service, "alice") == []
+
+    clock.now = 20
+    await use(pool, "bob")
+    assert pool.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_turns_in_one_session_run_one_at_a_time():
+    pool, _, _ = make_pool()
+    log = []
+
+    async def turn(name: str):
+        async with pool.session("alice"):
+            log.append(f"start {name}")
+            await asyncio.sleep(0.01)
+            log.append(f"end {name}")
+
+    await asyncio.gather(turn("a"), turn("b"), turn("c"))
+
+    assert log == ["start a", "end a", "start b", "end b", "start c", "end c"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_are_capped_across_sessions():
+    pool, _, _ = make_pool(max_concurrent_runs=2)
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def turn(frontend_id: str):
+        nonlocal running, peak
+        async with pool.session(frontend_id):
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+    tasks = [asyncio.create_task(turn(f"user-{i}")) for i in range(5)]
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+    assert pool.stats()["active_runs"] == 2
+    assert pool.stats()["waiting"] == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert peak == 2
+    assert pool.stats()["active_runs"] == 0
+    assert pool.stats()["waiting"] == 0
@@ -13,12 +13,15 @@ export const MessageList: React.FC<MessageListProps> = ({ messages, isLoading })
   console.log('[MessageList] Rendering with:', messages.length, 'messages, loading:', isLoading);
   console.log('[MessageList] Messages:', messages);
   
+  // Once an answer starts streaming in, it replaces the loading indicator
+  const isStreaming = messages.length > 0 && messages[messages.length - 1].role === 'assistant';
+
   return (
     <Box className="message-list">
       {messages.map((message) => (
         <Message key={message.id} message={message} />
       ))}
-      {isLoading && <LoadingMessage />}
+      {isLoading && !isStreaming && <LoadingMessage />}
     </Box>
   );
 };
\ No newline at end of file
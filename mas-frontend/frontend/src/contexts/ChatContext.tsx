@@ -4,6 +4,7 @@ import { ChatMessage } from '../types/chat';
 interface ChatContextType {
   messages: ChatMessage[];
   addMessage: (message: ChatMessage) => void;
+  upsertMessage: (id: string, build: (existing?: ChatMessage) => ChatMessage) => void;
   clearMessages: () => void;
   isLoading: boolean;
   setLoading: (loading: boolean) => void;
@@ -25,6 +26,19 @@ export const ChatProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     });
   }, []);
 
+  // Replaces the message with the given id, or appends one if there is none
+  const upsertMessage = useCallback((id: string, build: (existing?: ChatMessage) => ChatMessage) => {
+    setMessages(prev => {
+      const index = prev.findIndex(message => message.id === id);
+      if (index === -1) {
+        return [...prev, build()];
+      }
+      const next = [...prev];
+      next[index] = build(prev[index]);
+      return next;
+    });
+  }, []);
+
   const clearMessages = useCallback(() => {
     setMessages([]);
   }, []);
@@ -37,6 +51,7 @@ export const ChatProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     <ChatContext.Provider value={{
       messages,
       addMessage,
+      upsertMessage,
       clearMessages,
       isLoading,
       setLoading
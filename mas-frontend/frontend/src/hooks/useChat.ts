@@ -3,7 +3,7 @@ import { useWebSocketContext } from '../contexts/WebSocketContext';
 import { useChat as useChatContext } from '../contexts/ChatContext';
 
 export const useChat = () => {
-  const { messages, addMessage, clearMessages, isLoading, setLoading } = useChatContext();
+  const { messages, addMessage, upsertMessage, clearMessages, isLoading, setLoading } = useChatContext();
   const [sessionId] = useState(() => 
     localStorage.getItem('sessionId') || crypto.randomUUID()
   );
@@ -15,6 +15,16 @@ export const useChat = () => {
     const handlerId = Math.random().toString(36).substring(7);
     console.log(`[useChat] Registering handlers with ID: ${handlerId}`);
     
+    // Grow a placeholder assistant message as streamed text arrives
+    const unregisterAgentResponseDelta = registerHandler('agent_response_delta', (data: any) => {
+      upsertMessage(`stream-${data.request_id}`, (existing) => ({
+        id: `stream-${data.request_id}`,
+        role: 'assistant' as const,
+        content: (existing?.content || '') + data.delta,
+        timestamp: existing?.timestamp || new Date()
+      }));
+    });
+
     // Handle agent responses
     const unregisterAgentResponse = registerHandler('agent_response', (data: any) => {
       console.log(`[useChat ${handlerId}] Received agent response:`, data);
@@ -30,7 +40,12 @@ export const useChat = () => {
       };
       
       console.log(`[useChat ${handlerId}] Adding assistant message:`, assistantMessage);
-      addMessage(assistantMessage);
+      if (data.request_id) {
+        // Replace the streamed placeholder with the final answer
+        upsertMessage(`stream-${data.request_id}`, () => assistantMessage);
+      } else {
+        addMessage(assistantMessage);
+      }
       console.log(`[useChat ${handlerId}] Setting loading to false`);
       setLoading(false);
     });
@@ -59,11 +74,12 @@ export const useChat = () => {
     
     return () => {
       console.log(`[useChat] Cleaning up handlers with ID: ${handlerId}`);
+      unregisterAgentResponseDelta();
       unregisterAgentResponse();
       unregisterError();
       unregisterAck();
     };
-  }, [registerHandler, addMessage, setLoading]);
+  }, [registerHandler, addMessage, upsertMessage, setLoading]);
   
   return {
     messages,
@@ -74,6 +74,12 @@ export const useWebSocket = () => {
             } else {
               console.log('No agent_response handlers registered!');
             }
+          } else if (data.type === 'agent_response_delta') {
+            // Streamed text; the agent_response that follows carries the full answer
+            const handlers = messageHandlers.current.get('agent_response_delta');
+            if (handlers) {
+              handlers.forEach(handler => handler(data));
+            }
           } else if (data.type === 'error') {
             console.error('WebSocket error:', data.error);
             const handlers = messageHandlers.current.get('error');
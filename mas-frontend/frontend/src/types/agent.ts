@@ -24,6 +24,7 @@ export interface ExecutionTrace {
   coordinator_response: string;
   agent_sequence: string[];
   total_time_ms: number;
+  time_to_first_token_ms?: number | null;
   agent_responses: AgentResponse[];
   timestamp: Date;
 }
@@ -14,18 +14,34 @@
 
 """Multi-Agent System: Coordinator that routes requests to specialized sub-agents."""
 
+from typing import TYPE_CHECKING, Dict, List, Optional
+
 from google.adk.agents import LlmAgent
+from google.adk.apps import App
 from google.adk.tools.agent_tool import AgentTool
 
 from . import prompt
+from .cache_generations import bump_for_tool
+from .compaction import build_compaction_config
+from .config import MAS_COMPACTION_ENABLED, MAS_PARALLEL_SYNTHESIS, MAS_SEMANTIC_ROUTER_ENABLED
+from .router import FastPathRouter
 from .sub_agents.weather_agent import weather_agent
 from .sub_agents.greeter_agent import greeter_agent
 from .sub_agents.academic_wrapper import academic_websearch_wrapper, academic_newresearch_wrapper
 from .sub_agents.rag_agent import rag_agent
 
+if TYPE_CHECKING:
+    from .semantic_router import CentroidIndex
+
 MODEL = "gemini-2.0-flash-001"
 
 
+# Corpus changes and random numbers invalidate cached answers, whether the
+# tools run on the fast path or through the coordinator's AgentTools
+for _agent in (weather_agent, rag_agent):
+    _agent.after_tool_callback = bump_for_tool
+
+
 mas_coordinator = LlmAgent(
     name="mas_coordinator",
     model=MODEL,
@@ -47,4 +63,68 @@ mas_coordinator = LlmAgent(
     ],
 )
 
-root_agent = mas_coordinator
\ No newline at end of file
+# Rewrites the answers of a parallel dispatch into one reply (MAS_PARALLEL_SYNTHESIS=llm)
+mas_synthesizer = LlmAgent(
+    name="mas_synthesizer",
+    model=MODEL,
+    description="Combines answers from several specialist agents into one reply",
+    instruction=prompt.MAS_SYNTHESIZER_PROMPT,
+)
+
+
+def build_semantic_index(scenarios: Optional[Dict[str, List[Dict[str, str]]]] = None, **kwargs) -> "CentroidIndex":
+    """Builds routing centroids from agent descriptions and example utterances.
+
+    Academic requests have no fast-path target (the coordinator chooses
+    between the two academic wrappers), so they form the coordinator's
+    centroid and keep nearby messages from being misrouted.
+
+    Args:
+        scenarios: Example messages per scenario (defaults to the frontend's
+            TEST_SCENARIOS)
+        **kwargs: Passed to CentroidIndex (embedder, min_score, min_margin)
+
+    Returns:
+        CentroidIndex: The index; centroids are computed on first use
+    """
+    from .semantic_router import CentroidIndex, build_routing_examples, load_test_scenarios
+
+    return CentroidIndex(
+        build_routing_examples(
+            descriptions={
+                greeter_agent.name: [greeter_agent.description],
+                weather_agent.name: [weather_agent.description],
+                rag_agent.name: [rag_agent.description],
+                mas_coordinator.name: [
+                    academic_newresearch_wrapper.description,
+                    academic_websearch_wrapper.description,
+                ],
+            },
+            scenarios=load_test_scenarios() if scenarios is None else scenarios,
+            scenario_agents={
+                "greeter": greeter_agent.name,
+                "weather": weather_agent.name,
+                "rag": rag_agent.name,
+                "academic": mas_coordinator.name,
+            },
+        ),
+        **kwargs,
+    )
+
+
+# Obvious intents skip the coordinator LLM; everything else goes through it
+root_agent = FastPathRouter(
+    name="mas_router",
+    description="Routes obvious requests straight to a sub-agent and the rest to the coordinator",
+    fallback_agent=mas_coordinator.name,
+    sub_agents=[mas_coordinator, greeter_agent, weather_agent, rag_agent],
+    semantic_index=build_semantic_index() if MAS_SEMANTIC_ROUTER_ENABLED else None,
+    synthesizer=mas_synthesizer if MAS_PARALLEL_SYNTHESIS == "llm" else None,
+)
+
+# Runners built from the app compact long conversations (see compaction.py)
+app = App(
+    name="mas_system",
+    root_agent=root_agent,
+    events_compaction_config=build_compaction_config() if MAS_COMPACTION_ENABLED else None,
+)
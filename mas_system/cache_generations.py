@@ -0,0 +1,78 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generation counters that tell response caches when cached answers go stale.
+
+A scope's generation advances whenever a tool changes shared state (RAG
+corpus mutations) or produces an answer that must not be replayed (random
+numbers). The tools themselves know nothing about caching: the root agent
+module attaches bump_for_tool to the sub-agents as an after_tool_callback.
+Caches snapshot the counters before a run and compare afterwards.
+
+The counters are process-local: changes made by other processes never
+advance them.
+"""
+
+import threading
+from collections import Counter
+from typing import Any, Dict, Optional
+
+# Scope bumped by tools that create, modify or delete RAG corpora
+CORPUS = "rag_corpus"
+# Scope bumped by tools whose output differs on every call
+VOLATILE = "volatile"
+
+# Tools whose calls advance a scope, by tool name
+TOOL_SCOPES: Dict[str, str] = {
+    "create_corpus": CORPUS,
+    "add_data": CORPUS,
+    "delete_document": CORPUS,
+    "delete_corpus": CORPUS,
+    "get_random_lucky_number": VOLATILE,
+    "get_random_temperature_adjustment": VOLATILE,
+}
+
+_lock = threading.Lock()
+_generations: Counter = Counter()
+
+
+def bump_generation(scope: str) -> int:
+    """Advances a scope's generation and returns the new value."""
+    with _lock:
+        _generations[scope] += 1
+        return _generations[scope]
+
+
+def get_generation(scope: str) -> int:
+    """Returns a scope's current generation."""
+    with _lock:
+        return _generations[scope]
+
+
+def snapshot_generations() -> Dict[str, int]:
+    """Returns the current generation of every scope."""
+    with _lock:
+        return {CORPUS: _generations[CORPUS], VOLATILE: _generations[VOLATILE]}
+
+
+def bump_for_tool(tool: Any, args: Dict[str, Any], tool_context: Any, tool_response: Any) -> Optional[Dict[str, Any]]:
+    """after_tool_callback that advances the scope a tool affects (see TOOL_SCOPES).
+
+    Returns:
+        None, so the tool's own response is kept
+    """
+    scope = TOOL_SCOPES.get(tool.name)
+    if scope is not None:
+        bump_generation(scope)
+    return None
@@ -0,0 +1,77 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Context compaction for long conversations.
+
+Every turn is stored in the ADK session, so without compaction the prompt
+sent to the coordinator and its sub-agents grows with the conversation.
+Compaction uses ADK's events compaction. Before each model call, if that
+agent's last prompt reached the token threshold, the older events are
+replaced by one LLM-written summary. The summary is rolling: it folds in
+the previous one. The most recent events are kept verbatim.
+"""
+
+from typing import Optional
+
+from google.adk.apps.app import EventsCompactionConfig
+from google.adk.apps.base_events_summarizer import BaseEventsSummarizer
+from google.adk.apps.llm_event_summarizer import LlmEventSummarizer
+from google.adk.models.registry import LLMRegistry
+
+from .config import (
+    MAS_COMPACTION_MODEL,
+    MAS_COMPACTION_RETAIN_EVENTS,
+    MAS_COMPACTION_TOKEN_THRESHOLD,
+)
+
+SUMMARY_PROMPT = (
+    "The following is a conversation between a user and a multi-agent "
+    "assistant (coordinator, greeter, weather, RAG and academic research "
+    "agents). It may start with the summary of an earlier part of the "
+    "conversation. Write a concise summary that keeps: the user's name and "
+    "stated preferences, locations and units they asked about, corpus and "
+    "document names, papers discussed, decisions made, and any open "
+    "questions or tasks. List the tools that were called by name. State the "
+    "user's language at the top.\n\n{conversation_history}"
+)
+
+
+def build_compaction_config(
+    token_threshold: int = MAS_COMPACTION_TOKEN_THRESHOLD,
+    retain_events: int = MAS_COMPACTION_RETAIN_EVENTS,
+    model: str = MAS_COMPACTION_MODEL,
+    summarizer: Optional[BaseEventsSummarizer] = None,
+) -> EventsCompactionConfig:
+    """Build the events compaction config for the MAS app.
+
+    The root agent is a router rather than an LlmAgent, so ADK cannot pick a
+    summarizer model on its own; one is always set here.
+
+    Args:
+        token_threshold: Prompt size, in tokens, that triggers compaction.
+        retain_events: Number of most recent events kept verbatim.
+        model: Model that writes the summaries.
+        summarizer: Summarizer to use instead of one built from `model`.
+
+    Returns:
+        An EventsCompactionConfig for App(events_compaction_config=...).
+    """
+    if summarizer is None:
+        summarizer = LlmEventSummarizer(llm=LLMRegistry.new_llm(model), prompt_template=SUMMARY_PROMPT)
+    return EventsCompactionConfig(
+        summarizer=summarizer,
+        token_threshold=token_threshold,
+        event_retention_size=retain_events,
+    )
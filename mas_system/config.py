@@ -0,0 +1,64 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Configuration settings for the top-level MAS routing stage."""
+
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Keyword fast-path router settings
+MAS_FAST_PATH_ENABLED = os.getenv("MAS_FAST_PATH_ENABLED", "True").lower() == "true"
+MAS_FAST_PATH_MIN_CONFIDENCE = float(os.getenv("MAS_FAST_PATH_MIN_CONFIDENCE", "0.8"))
+MAS_FAST_PATH_MAX_CHARS = int(os.getenv("MAS_FAST_PATH_MAX_CHARS", "160"))
+
+# Embedding-based semantic router settings (second stage after the keyword rules)
+MAS_SEMANTIC_ROUTER_ENABLED = os.getenv("MAS_SEMANTIC_ROUTER_ENABLED", "False").lower() == "true"
+# "hashing" is a deterministic local embedder; "vertex" uses Vertex AI text embeddings
+MAS_SEMANTIC_ROUTER_EMBEDDER = os.getenv("MAS_SEMANTIC_ROUTER_EMBEDDER", "hashing")
+MAS_SEMANTIC_ROUTER_MODEL = os.getenv("MAS_SEMANTIC_ROUTER_MODEL", "text-embedding-005")
+MAS_SEMANTIC_ROUTER_DIMENSIONS = int(os.getenv("MAS_SEMANTIC_ROUTER_DIMENSIONS", "1024"))
+# Score thresholds depend on the embedder; eval/semantic_router_report.py helps tune them
+MAS_SEMANTIC_ROUTER_MIN_SCORE = float(os.getenv("MAS_SEMANTIC_ROUTER_MIN_SCORE", "0.2"))
+MAS_SEMANTIC_ROUTER_MIN_MARGIN = float(os.getenv("MAS_SEMANTIC_ROUTER_MIN_MARGIN", "0.1"))
+# Example utterances per agent; defaults to the frontend's TEST_SCENARIOS
+MAS_SEMANTIC_ROUTER_SCENARIOS = os.getenv("MAS_SEMANTIC_ROUTER_SCENARIOS", "")
+
+# Response cache in front of the root agent (used by the frontend's MAS client)
+MAS_RESPONSE_CACHE_ENABLED = os.getenv("MAS_RESPONSE_CACHE_ENABLED", "True").lower() == "true"
+MAS_RESPONSE_CACHE_SIZE = int(os.getenv("MAS_RESPONSE_CACHE_SIZE", "512"))
+MAS_RESPONSE_CACHE_GREETER_TTL_SECONDS = float(os.getenv("MAS_RESPONSE_CACHE_GREETER_TTL_SECONDS", "86400"))
+MAS_RESPONSE_CACHE_WEATHER_TTL_SECONDS = float(os.getenv("MAS_RESPONSE_CACHE_WEATHER_TTL_SECONDS", "300"))
+# RAG answers are also dropped when this process changes a corpus. Corpora changed
+# elsewhere (ingestion function, other instances) are only noticed at expiry
+MAS_RESPONSE_CACHE_RAG_TTL_SECONDS = float(os.getenv("MAS_RESPONSE_CACHE_RAG_TTL_SECONDS", "60"))
+# Answers from any other agent (0 disables caching them)
+MAS_RESPONSE_CACHE_DEFAULT_TTL_SECONDS = float(os.getenv("MAS_RESPONSE_CACHE_DEFAULT_TTL_SECONDS", "0"))
+
+# Parallel dispatch of compound requests ("greet me, weather in London and list my corpora")
+MAS_PARALLEL_DISPATCH_ENABLED = os.getenv("MAS_PARALLEL_DISPATCH_ENABLED", "True").lower() == "true"
+MAS_PARALLEL_MAX_TASKS = int(os.getenv("MAS_PARALLEL_MAX_TASKS", "4"))
+MAS_PARALLEL_TASK_TIMEOUT_SECONDS = float(os.getenv("MAS_PARALLEL_TASK_TIMEOUT_SECONDS", "60"))
+# "merge" joins the partial answers in request order; "llm" rewrites them into one reply
+MAS_PARALLEL_SYNTHESIS = os.getenv("MAS_PARALLEL_SYNTHESIS", "merge")
+
+# Conversation context compaction: once a model call's prompt reaches the token
+# threshold, older session events are rolled into an LLM-written summary and
+# only the most recent events are kept verbatim
+MAS_COMPACTION_ENABLED = os.getenv("MAS_COMPACTION_ENABLED", "True").lower() == "true"
+MAS_COMPACTION_TOKEN_THRESHOLD = int(os.getenv("MAS_COMPACTION_TOKEN_THRESHOLD", "8000"))
+MAS_COMPACTION_RETAIN_EVENTS = int(os.getenv("MAS_COMPACTION_RETAIN_EVENTS", "12"))
+MAS_COMPACTION_MODEL = os.getenv("MAS_COMPACTION_MODEL", "gemini-2.0-flash-001")
@@ -0,0 +1,201 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fan-out/fan-in execution of compound requests.
+
+Each sub-task runs its agent through an AgentTool, which gives it an
+isolated child session that sees only its own clause, exactly as when the
+coordinator calls the agent as a tool. The tasks run concurrently and
+their answers are merged in a single synthesis step, so a multi-intent
+message costs roughly the slowest agent instead of the sum of all of them.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.tools.agent_tool import AgentTool
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+# Key of the timing trace in the final event's custom_metadata
+TRACE_KEY = "parallel_dispatch"
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+async def _run_task(
+    ctx: InvocationContext,
+    agent: BaseAgent,
+    call: types.FunctionCall,
+    started: float,
+    timeout: float,
+) -> Dict[str, Any]:
+    tool_context = ToolContext(ctx, function_call_id=call.id)
+    task = {"agent": agent.name, "request": call.args["request"], "start_ms": _elapsed_ms(started)}
+    try:
+        result = await asyncio.wait_for(
+            AgentTool(agent=agent).run_async(args=call.args, tool_context=tool_context), timeout
+        )
+        task.update(status="ok", result=str(result))
+    except asyncio.TimeoutError:
+        task.update(status="timeout", result=f"{agent.name} did not answer within {timeout:g} seconds.")
+    except Exception as e:
+        logger.error(f"Parallel task {agent.name} failed: {e}")
+        task.update(status="error", result=f"{agent.name} failed: {e}")
+    task["end_ms"] = _elapsed_ms(started)
+    task["duration_ms"] = round(task["end_ms"] - task["start_ms"], 1)
+    task["state_delta"] = dict(tool_context.actions.state_delta)
+    return task
+
+
+def merge_answers(tasks: List[Dict[str, Any]]) -> str:
+    """Joins the partial answers in the order the user asked for them."""
+    return "\n\n".join(task["result"].strip() for task in tasks if task["result"].strip())
+
+
+def _synthesis_request(message: str, tasks: List[Dict[str, Any]]) -> str:
+    sections = [f"User message: {message}"]
+    for position, task in enumerate(tasks, 1):
+        sections.append(f"Answer {position} ({task['agent']}, for \"{task['request']}\"):\n{task['result']}")
+    return "\n\n".join(sections)
+
+
+def build_trace(tasks: List[Dict[str, Any]], fan_out_ms: float, synthesis_ms: float) -> Dict[str, Any]:
+    """Summarizes task timings and the critical path of a dispatch.
+
+    Args:
+        tasks: Finished tasks from the fan-out
+        fan_out_ms: Time until the last task finished
+        synthesis_ms: Time spent merging the answers
+
+    Returns:
+        dict: Per-task timings, the critical path (slowest task, then
+            synthesis) and what running the tasks back to back would cost
+    """
+    slowest = max(tasks, key=lambda task: task["end_ms"])
+    return {
+        "tasks": [
+            {key: task[key] for key in ("agent", "request", "status", "start_ms", "end_ms", "duration_ms")}
+            for task in tasks
+        ],
+        "critical_path": [slowest["agent"], "synthesis"],
+        "fan_out_ms": fan_out_ms,
+        "synthesis_ms": synthesis_ms,
+        "total_ms": round(fan_out_ms + synthesis_ms, 1),
+        "sequential_ms": round(sum(task["duration_ms"] for task in tasks) + synthesis_ms, 1),
+    }
+
+
+async def run_parallel_dispatch(
+    router: BaseAgent,
+    ctx: InvocationContext,
+    plan: List[Dict[str, Any]],
+    message: str,
+    synthesizer: Optional[BaseAgent] = None,
+    timeout: float = 60.0,
+) -> AsyncGenerator[Event, None]:
+    """Runs planned sub-tasks concurrently and yields one merged answer.
+
+    The events mirror a coordinator turn: one event with a function call
+    per sub-agent, one with all the function responses (carrying any state
+    the sub-agents wrote), then the final text answer with the timing
+    trace in custom_metadata[TRACE_KEY].
+
+    Args:
+        router: The agent the events are attributed to
+        ctx: The current invocation context
+        plan: Tasks as {"agent": BaseAgent, "request": str}
+        message: The user's original message (for LLM synthesis)
+        synthesizer: Optional agent that rewrites the answers into one
+            reply; without it the answers are joined in order
+        timeout: Seconds each sub-task may take
+
+    Yields:
+        Event: function calls, function responses and the final answer
+    """
+    calls = [
+        types.FunctionCall(id=f"adk-{uuid.uuid4()}", name=task["agent"].name, args={"request": task["request"]})
+        for task in plan
+    ]
+    yield Event(
+        invocation_id=ctx.invocation_id,
+        author=router.name,
+        branch=ctx.branch,
+        content=types.ModelContent(parts=[types.Part(function_call=call) for call in calls]),
+    )
+
+    started = time.perf_counter()
+    tasks = await asyncio.gather(
+        *(_run_task(ctx, task["agent"], call, started, timeout) for task, call in zip(plan, calls))
+    )
+    fan_out_ms = _elapsed_ms(started)
+
+    state_delta: Dict[str, Any] = {}
+    for task in tasks:
+        state_delta.update(task["state_delta"])
+    yield Event(
+        invocation_id=ctx.invocation_id,
+        author=router.name,
+        branch=ctx.branch,
+        actions=EventActions(state_delta=state_delta),
+        content=types.Content(
+            role="user",
+            parts=[
+                types.Part(
+                    function_response=types.FunctionResponse(
+                        id=call.id, name=call.name, response={"result": task["result"]}
+                    )
+                )
+                for call, task in zip(calls, tasks)
+            ],
+        ),
+    )
+
+    synthesis_started = time.perf_counter()
+    answer = merge_answers(tasks)
+    if synthesizer is not None:
+        synthesis = await _run_task(
+            ctx,
+            synthesizer,
+            types.FunctionCall(
+                id=f"adk-{uuid.uuid4()}", name=synthesizer.name, args={"request": _synthesis_request(message, tasks)}
+            ),
+            synthesis_started,
+            timeout,
+        )
+        if synthesis["status"] == "ok" and synthesis["result"].strip():
+            answer = synthesis["result"]
+    trace = build_trace(tasks, fan_out_ms, _elapsed_ms(synthesis_started))
+    logger.info(
+        f"Parallel dispatch: {len(tasks)} tasks in {trace['total_ms']} ms "
+        f"(sequential {trace['sequential_ms']} ms, critical path {' -> '.join(trace['critical_path'])})"
+    )
+
+    yield Event(
+        invocation_id=ctx.invocation_id,
+        author=router.name,
+        branch=ctx.branch,
+        content=types.ModelContent(parts=[types.Part(text=answer)]),
+        custom_metadata={TRACE_KEY: trace},
+    )
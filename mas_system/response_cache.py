@@ -0,0 +1,257 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Response cache for whole agent turns.
+
+Answers are keyed by the normalized message, the agent the router would
+pick and a fingerprint of the session state. The cache is shared by every
+session, so only turns a keyword rule routes (FastPathRouter.keyword_target)
+may be cached: their answers do not depend on the conversation so far.
+That covers greetings, weather for a named place and listing corpora.
+Questions answered from corpus documents (rag_query) go through the
+coordinator and are never cached.
+Each entry lives for the TTL of the agents that produced it. RAG answers are
+also dropped when a corpus changes. Turns that mutated a corpus or drew
+random numbers are never stored (see cache_generations).
+
+Invalidation only sees corpus changes made by tool calls in this process.
+Corpora changed by the rag_ingestion cloud function or by another backend
+instance are picked up when the entry expires, so the RAG TTL is kept short.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from google.adk.agents import BaseAgent
+from google.adk.events import Event
+from google.adk.tools.agent_tool import AgentTool
+
+from .cache_generations import CORPUS, get_generation, snapshot_generations
+from .config import (
+    MAS_RESPONSE_CACHE_DEFAULT_TTL_SECONDS,
+    MAS_RESPONSE_CACHE_GREETER_TTL_SECONDS,
+    MAS_RESPONSE_CACHE_RAG_TTL_SECONDS,
+    MAS_RESPONSE_CACHE_SIZE,
+    MAS_RESPONSE_CACHE_WEATHER_TTL_SECONDS,
+)
+from .router import normalize_message
+
+# Seconds a cached answer lives, by the agent that produced it
+AGENT_TTLS: Dict[str, float] = {
+    "greeter_agent": MAS_RESPONSE_CACHE_GREETER_TTL_SECONDS,
+    "weather_agent": MAS_RESPONSE_CACHE_WEATHER_TTL_SECONDS,
+    "rag_agent": MAS_RESPONSE_CACHE_RAG_TTL_SECONDS,
+}
+
+# Agents whose answers depend on the RAG corpora
+CORPUS_AGENTS = frozenset({"rag_agent"})
+
+
+class CachedResponse(NamedTuple):
+    response: str
+    author: str
+    agents: Tuple[str, ...]
+
+
+class _Entry(NamedTuple):
+    value: CachedResponse
+    expires_at: float
+    corpus_generation: Optional[int]
+
+
+def state_fingerprint(state: Optional[Dict[str, Any]]) -> str:
+    """Hashes session state so that answers never leak across different states."""
+    if not state:
+        return ""
+    encoded = json.dumps(state, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def response_cache_key(message: str, route: str, state: Optional[Dict[str, Any]] = None) -> Tuple[str, str, str]:
+    """Builds the cache key for a user message.
+
+    Args:
+        message: The raw user message
+        route: Name of the agent the router would hand the message to
+        state: The session state before the turn
+
+    Returns:
+        tuple: (normalized message, route, state fingerprint)
+    """
+    # "Hello!" and "hello" are the same question
+    return normalize_message(message).rstrip(" ?!."), route, state_fingerprint(state)
+
+
+def collect_agent_names(root: BaseAgent) -> Set[str]:
+    """Returns the names of every agent reachable as a sub-agent or AgentTool."""
+    names: Set[str] = set()
+    pending = [root]
+    while pending:
+        agent = pending.pop()
+        if agent.name in names:
+            continue
+        names.add(agent.name)
+        pending.extend(agent.sub_agents)
+        pending.extend(tool.agent for tool in getattr(agent, "tools", []) if isinstance(tool, AgentTool))
+    return names
+
+
+def responding_agents(events: Iterable[Event], agent_names: Set[str], routers: Set[str]) -> List[str]:
+    """Lists the agents that answered a turn, in order of first appearance.
+
+    Agents show up either as event authors (fast-path dispatch) or as
+    AgentTool calls made by the coordinator.
+
+    Args:
+        events: The events of one turn
+        agent_names: Names of all agents in the tree (see collect_agent_names)
+        routers: Agents that only route, such as the root and the coordinator
+
+    Returns:
+        list: The names of the answering agents; empty if only routers spoke
+    """
+    seen: List[str] = []
+    for event in events:
+        names = [event.author] + [call.name for call in event.get_function_calls()]
+        for name in names:
+            if name in agent_names and name not in routers and name not in seen:
+                seen.append(name)
+    return seen
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of agent answers with per-agent TTLs.
+
+    Hit, miss, eviction and invalidation counters are kept for monitoring.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = MAS_RESPONSE_CACHE_SIZE,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = MAS_RESPONSE_CACHE_DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            maxsize: Maximum number of answers to keep
+            ttls: Seconds to keep answers from each agent (defaults to AGENT_TTLS)
+            default_ttl: Seconds to keep answers from any other agent
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.maxsize = maxsize
+        self.ttls = dict(AGENT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._data: "OrderedDict[Tuple[str, str, str], _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.skipped = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        """Captures the generations to hand back to put() after the turn runs."""
+        return snapshot_generations()
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[CachedResponse]:
+        """
+        Look up a cached answer, counting the access as a hit or a miss.
+
+        Args:
+            key: Key from response_cache_key
+
+        Returns:
+            CachedResponse or None if missing, expired or invalidated
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stale = entry.corpus_generation is not None and entry.corpus_generation != get_generation(CORPUS)
+            if stale or entry.expires_at <= self._clock():
+                del self._data[key]
+                if stale:
+                    self.invalidations += 1
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(
+        self,
+        key: Tuple[str, str, str],
+        response: str,
+        author: str,
+        agents: List[str],
+        generations: Dict[str, int]
+    ) -> bool:
+        """
+        Store an answer unless the turn was volatile or not cacheable.
+
+        Args:
+            key: Key from response_cache_key
+            response: The answer text
+            author: Author of the final answer event
+            agents: Agents that answered (see responding_agents)
+            generations: Result of snapshot() taken before the turn ran
+
+        Returns:
+            bool: True if the answer was stored
+        """
+        ttl = min((self.ttls.get(agent, self.default_ttl) for agent in agents), default=self.default_ttl)
+        if not response or ttl <= 0 or generations != snapshot_generations():
+            with self._lock:
+                self.skipped += 1
+            return False
+
+        corpus_generation = generations[CORPUS] if CORPUS_AGENTS.intersection(agents) else None
+        entry = _Entry(CachedResponse(response, author, tuple(agents)), self._clock() + ttl, corpus_generation)
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and hit-rate counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "skipped": self.skipped,
+            }
@@ -0,0 +1,419 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keyword fast-path router that runs ahead of the LLM coordinator.
+
+Obvious intents (a bare greeting, "weather in X", "list my corpora") are
+matched against a small compiled rule set and handed straight to the
+sub-agent that serves them. Messages the rules miss can optionally go
+through a nearest-centroid embedding classifier (see semantic_router).
+Compound requests ("greet me, weather in London and list my corpora")
+are split into clauses and run on several sub-agents in parallel.
+Everything else, including messages that also touch another agent's
+domain, falls back to the coordinator LLM.
+"""
+
+import logging
+import re
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Dict, List, Optional, Pattern, Tuple
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.genai import types
+
+from .config import (
+    MAS_FAST_PATH_ENABLED,
+    MAS_FAST_PATH_MAX_CHARS,
+    MAS_FAST_PATH_MIN_CONFIDENCE,
+    MAS_PARALLEL_DISPATCH_ENABLED,
+    MAS_PARALLEL_MAX_TASKS,
+    MAS_PARALLEL_TASK_TIMEOUT_SECONDS,
+)
+from .parallel_dispatch import run_parallel_dispatch
+
+if TYPE_CHECKING:
+    # Imported only when the semantic stage is enabled, since it pulls in NumPy
+    from .semantic_router import CentroidIndex
+
+logger = logging.getLogger(__name__)
+
+FALLBACK = "fallback"
+PARALLEL = "parallel"
+
+# Confidence multiplier for messages that also mention another agent's domain
+# or chain a second request
+CROSS_DOMAIN_PENALTY = 0.5
+
+# Keywords that tie a message to an agent; used to spot mixed requests
+DOMAIN_KEYWORDS: Dict[str, Pattern[str]] = {
+    "weather_agent": re.compile(
+        r"\b(?:weather|forecast|temperature|rain(?:ing)?|snow(?:ing)?|humidity|wind)\b"
+    ),
+    "rag_agent": re.compile(
+        r"\b(?:corp(?:us|ora|uses)|knowledge bases?|documents?|rag)\b"
+    ),
+    "academic": re.compile(
+        r"\b(?:papers?|research|arxiv|stud(?:y|ies)|citations?|scholar|literature|academic)\b"
+    ),
+}
+
+# A second clause ("... and find ...") means the message asks for more than one thing
+FOLLOW_ON_REQUEST = re.compile(
+    r"\b(?:and|then|also)(?: (?:can|could) you)? (?:find|search|get|show|tell|list|create|delete|add|"
+    r"look|give|explain|summari[sz]e|write|what|who|how|why)\b"
+)
+
+# Clause-level intent keywords for splitting compound requests; unlike the
+# whole-message rules these only need to identify the domain of a clause
+CLAUSE_KEYWORDS: Dict[str, Pattern[str]] = {
+    "greeter_agent": re.compile(r"\b(?:greet|hello|hi|hey|welcome|good (?:morning|afternoon|evening))\b"),
+    **DOMAIN_KEYWORDS,
+}
+
+CLAUSE_SEPARATOR = re.compile(
+    r"\s*[,;]\s*(?:(?:and|then|also)\s+)*|(?<=[.!?])\s+|\s+(?:and|then|also|plus)\s+(?:(?:then|also)\s+)?",
+    re.IGNORECASE,
+)
+
+_GREETING = r"(?:hi|hello|hey|hiya|howdy|greetings|good (?:morning|afternoon|evening|day))"
+_END = r"[\s?!.]*"
+
+# (rule name, agent name, confidence, pattern); patterns must match the whole
+# normalized message so that trailing requests never ride along a fast path
+FAST_PATH_RULES: List[Tuple[str, str, float, Pattern[str]]] = [
+    (
+        "greeting",
+        "greeter_agent",
+        0.95,
+        re.compile(_GREETING + r"(?: (?:there|everyone|all|team))?" + _END),
+    ),
+    (
+        "greeting_introduction",
+        "greeter_agent",
+        0.9,
+        re.compile(
+            _GREETING + r"[,!.]? (?:i'm|i am|my name is|this is) [a-z][a-z'\-]*(?: [a-z][a-z'\-]*)?" + _END
+        ),
+    ),
+    (
+        "weather_in_location",
+        "weather_agent",
+        0.9,
+        re.compile(
+            r"(?:(?:what's|whats|what is|how's|hows|how is|show me|get|tell me)(?: me)? )?"
+            r"(?:the )?(?:current )?(?:weather|forecast|temperature)(?: forecast)?(?: like)? "
+            r"(?:in|for|at) [a-z][a-z .,'\-]{0,60}?"
+            r"(?: (?:today|now|right now|tomorrow|this week))?" + _END
+        ),
+    ),
+    (
+        "precipitation_in_location",
+        "weather_agent",
+        0.85,
+        re.compile(
+            r"(?:is it|will it) (?:rain|snow)(?:ing)? (?:in|at) [a-z][a-z .,'\-]{0,60}?"
+            r"(?: (?:today|now|right now|tomorrow|this week))?" + _END
+        ),
+    ),
+    (
+        "list_corpora",
+        "rag_agent",
+        0.9,
+        re.compile(
+            r"(?:(?:can you|could you) )?(?:please )?(?:list|show(?: me)?|display|what are|which are) "
+            r"(?:all )?(?:(?:the|my|our|available|existing) )*(?:rag )?"
+            r"(?:corpora|corpuses|knowledge bases|document collections)"
+            r"(?: (?:available|we have|do we have|do i have|exist))?(?: please)?" + _END
+        ),
+    ),
+    (
+        "which_corpora",
+        "rag_agent",
+        0.9,
+        re.compile(
+            r"(?:what|which) (?:rag )?(?:corpora|corpuses|knowledge bases) "
+            r"(?:do (?:we|i) have|are (?:there|available)|exist)" + _END
+        ),
+    ),
+]
+
+# Agents the router may dispatch to without the coordinator
+FAST_PATH_AGENTS = frozenset(agent for _, agent, _, _ in FAST_PATH_RULES)
+
+_stats_lock = threading.Lock()
+_route_counts: Counter = Counter()
+
+
+def normalize_message(text: str) -> str:
+    """Lowercases a message and collapses its whitespace for rule matching."""
+    text = text.replace("’", "'")
+    return " ".join(text.lower().split())
+
+
+def classify_intent(text: str) -> Dict[str, Any]:
+    """Matches a user message against the fast-path rules.
+
+    Args:
+        text: The raw user message
+
+    Returns:
+        dict: The target agent name (None when no rule matched), the
+            confidence of the match and the name of the rule that fired
+    """
+    message = normalize_message(text)
+    if not message or len(message) > MAS_FAST_PATH_MAX_CHARS:
+        return {"agent": None, "confidence": 0.0, "rule": None}
+
+    for rule, agent, confidence, pattern in FAST_PATH_RULES:
+        if not pattern.fullmatch(message):
+            continue
+        mixed = FOLLOW_ON_REQUEST.search(message) or any(
+            domain != agent and keywords.search(message)
+            for domain, keywords in DOMAIN_KEYWORDS.items()
+        )
+        if mixed:
+            confidence *= CROSS_DOMAIN_PENALTY
+        return {"agent": agent, "confidence": confidence, "rule": rule}
+
+    return {"agent": None, "confidence": 0.0, "rule": None}
+
+
+def split_compound_request(text: str) -> List[str]:
+    """Splits a message into clauses at sentence ends, commas, semicolons and "and"/"then"/"also"."""
+    clauses = CLAUSE_SEPARATOR.split(" ".join(text.split()))
+    return [clause.strip(" .!?") for clause in clauses if clause.strip(" .!?")]
+
+
+def plan_compound_request(
+    text: str,
+    max_tasks: int = MAS_PARALLEL_MAX_TASKS,
+    classify_clause: Optional[Callable[[str], Optional[str]]] = None,
+) -> List[Dict[str, str]]:
+    """Breaks a compound request into independent sub-agent tasks.
+
+    A plan is only returned when every clause belongs to exactly one
+    fast-path agent; academic clauses, clauses matching several domains and
+    clauses matching none (e.g. the "London" in "weather in Paris and
+    London") all leave the message to the coordinator.
+
+    Args:
+        text: The raw user message
+        max_tasks: Largest number of tasks to fan out
+        classify_clause: Optional fallback that maps a clause with no
+            domain keywords to an agent name (or None)
+
+    Returns:
+        list: One {"agent", "request"} per clause in message order, or an
+            empty list if the message is not a plannable compound request
+    """
+    clauses = split_compound_request(text)
+    if not 2 <= len(clauses) <= max_tasks:
+        return []
+
+    plan = []
+    for clause in clauses:
+        message = normalize_message(clause)
+        domains = [name for name, keywords in CLAUSE_KEYWORDS.items() if keywords.search(message)]
+        if not domains and classify_clause is not None:
+            agent = classify_clause(message)
+            domains = [agent] if agent else []
+        if len(domains) != 1 or domains[0] not in FAST_PATH_AGENTS:
+            return []
+        plan.append({"agent": domains[0], "request": clause})
+    return plan
+
+
+def get_fast_path_stats() -> Dict[str, int]:
+    """Returns how many messages each route has served since the last reset."""
+    with _stats_lock:
+        return dict(_route_counts)
+
+
+def reset_fast_path_stats() -> None:
+    """Clears the route counters."""
+    with _stats_lock:
+        _route_counts.clear()
+
+
+def _message_text(content: Optional[types.Content]) -> Optional[str]:
+    """Returns the text of a user message, or None if it carries anything else."""
+    if content is None or not content.parts:
+        return None
+    texts = []
+    for part in content.parts:
+        if part.text is None:
+            return None
+        texts.append(part.text)
+    return "".join(texts)
+
+
+class FastPathRouter(BaseAgent):
+    """Dispatches obvious intents straight to a sub-agent.
+
+    The fallback agent and every fast-path target must be sub-agents of the
+    router. A semantic index, when given, is consulted for messages the
+    keyword rules do not match. Compound requests whose clauses each belong
+    to one fast-path agent are fanned out to those agents concurrently (see
+    parallel_dispatch). Because the router is not an LlmAgent, ADK adds no transfer
+    tools to them and resumes each new turn from the router.
+    """
+
+    fallback_agent: str
+    enabled: bool = MAS_FAST_PATH_ENABLED
+    min_confidence: float = MAS_FAST_PATH_MIN_CONFIDENCE
+    semantic_index: Optional[Any] = None
+    """Optional CentroidIndex: a nearest-centroid stage for messages the keyword rules miss."""
+    parallel_enabled: bool = MAS_PARALLEL_DISPATCH_ENABLED
+    """Fan compound requests out to several sub-agents at once."""
+    synthesizer: Optional[BaseAgent] = None
+    """Optional agent that rewrites parallel answers into one reply."""
+    task_timeout: float = MAS_PARALLEL_TASK_TIMEOUT_SECONDS
+
+    def select(self, content: Optional[types.Content]) -> BaseAgent:
+        """Picks the sub-agent that should answer a user message.
+
+        Args:
+            content: The user message of the current invocation
+
+        Returns:
+            BaseAgent: The fast-path target, or the fallback agent
+        """
+        text = _message_text(content) if self.enabled else None
+        if text is not None:
+            target = self._keyword_target(text) or self._semantic_target(text)
+            if target is not None:
+                return target
+        return self.find_sub_agent(self.fallback_agent)
+
+    def keyword_target(self, content: Optional[types.Content]) -> Optional[BaseAgent]:
+        """Picks the sub-agent a high-confidence keyword rule gives a message.
+
+        Keyword rules match whole, self-contained requests ("what's the
+        weather in London"), so their answers do not depend on earlier turns.
+        The semantic stage and the fallback are not consulted.
+
+        Args:
+            content: The user message of the current invocation
+
+        Returns:
+            BaseAgent or None if no keyword rule matched
+        """
+        text = _message_text(content) if self.enabled else None
+        return self._keyword_target(text) if text is not None else None
+
+    def plan(self, content: Optional[types.Content]) -> List[Dict[str, Any]]:
+        """Splits a compound message into sub-agent tasks to run in parallel.
+
+        Args:
+            content: The user message of the current invocation
+
+        Returns:
+            list: {"agent": BaseAgent, "request": str} per clause, or an
+                empty list when the message should be routed as a whole
+        """
+        text = _message_text(content) if self.enabled and self.parallel_enabled else None
+        if text is None:
+            return []
+        classify_clause = self._semantic_clause if self.semantic_index is not None else None
+        tasks = []
+        for step in plan_compound_request(text, classify_clause=classify_clause):
+            agent = self._sub_agent(step["agent"])
+            if agent is None:
+                return []
+            tasks.append({"agent": agent, "request": step["request"]})
+        return tasks
+
+    def route(self, content: Optional[types.Content]) -> BaseAgent:
+        """Picks the sub-agent for a message (see select) and counts the route."""
+        target = self.select(content)
+        if target.name != self.fallback_agent:
+            logger.info(f"Fast path: routed to {target.name}")
+        with _stats_lock:
+            _route_counts[FALLBACK if target.name == self.fallback_agent else target.name] += 1
+        return target
+
+    def _keyword_target(self, text: str) -> Optional[BaseAgent]:
+        decision = classify_intent(text)
+        if not decision["agent"] or decision["confidence"] < self.min_confidence:
+            return None
+        target = self._sub_agent(decision["agent"])
+        if target is not None:
+            logger.debug(
+                f"Fast path: {decision['rule']} -> {target.name} "
+                f"(confidence {decision['confidence']:.2f})"
+            )
+        return target
+
+    def _semantic_target(self, text: str) -> Optional[BaseAgent]:
+        if self.semantic_index is None:
+            return None
+        message = normalize_message(text)
+        if not message or len(message) > MAS_FAST_PATH_MAX_CHARS or FOLLOW_ON_REQUEST.search(message):
+            return None
+        try:
+            decision = self.semantic_index.classify(message)
+        except Exception as e:
+            logger.warning(f"Semantic routing failed, falling back: {e}")
+            return None
+        if decision["agent"] is None:
+            return None
+        target = self._sub_agent(decision["agent"])
+        if target is not None:
+            logger.debug(
+                f"Semantic route: {target.name} "
+                f"(score {decision['score']:.2f}, margin {decision['margin']:.2f})"
+            )
+        return target
+
+    def _semantic_clause(self, clause: str) -> Optional[str]:
+        try:
+            return self.semantic_index.classify(clause)["agent"]
+        except Exception as e:
+            logger.warning(f"Semantic clause classification failed: {e}")
+            return None
+
+    def _sub_agent(self, name: str) -> Optional[BaseAgent]:
+        target = self.find_sub_agent(name)
+        if target is None:
+            logger.warning(f"Fast-path target {name} is not a sub-agent of {self.name}")
+        return target
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        tasks = self.plan(ctx.user_content)
+        if tasks:
+            logger.info(f"Parallel dispatch to {', '.join(task['agent'].name for task in tasks)}")
+            with _stats_lock:
+                _route_counts[PARALLEL] += 1
+            async for event in run_parallel_dispatch(
+                self,
+                ctx,
+                tasks,
+                _message_text(ctx.user_content),
+                synthesizer=self.synthesizer,
+                timeout=self.task_timeout,
+            ):
+                yield event
+            return
+
+        agent = self.route(ctx.user_content)
+        async for event in agent.run_async(ctx):
+            yield event
+
+    async def _run_live_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        # Live sessions stream audio, so there is no text to classify up front
+        async for event in self.find_sub_agent(self.fallback_agent).run_live(ctx):
+            yield event
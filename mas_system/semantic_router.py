@@ -0,0 +1,271 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Embedding-based semantic routing with precomputed agent centroids.
+
+Each agent is represented by the mean embedding of its description and a
+handful of example utterances. A message is routed to the nearest centroid
+when it is both close enough and clearly closer than the runner-up;
+otherwise the caller falls back to the coordinator LLM.
+"""
+
+import ast
+import hashlib
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .config import (
+    MAS_SEMANTIC_ROUTER_DIMENSIONS,
+    MAS_SEMANTIC_ROUTER_EMBEDDER,
+    MAS_SEMANTIC_ROUTER_MIN_MARGIN,
+    MAS_SEMANTIC_ROUTER_MIN_SCORE,
+    MAS_SEMANTIC_ROUTER_MODEL,
+    MAS_SEMANTIC_ROUTER_SCENARIOS,
+)
+
+logger = logging.getLogger(__name__)
+
+# An embedder turns a batch of texts into a (len(texts), dimensions) array
+Embedder = Callable[[Sequence[str]], np.ndarray]
+
+DEFAULT_SCENARIOS_PATH = (
+    Path(__file__).resolve().parent.parent / "mas-frontend" / "backend" / "app" / "api" / "routes" / "test.py"
+)
+
+# Words that carry no routing signal for the hashing embedder
+STOPWORDS = frozenset(
+    "a an and are be can could do does for from give i in is it me my of on or please show "
+    "tell that the this to what what's whats with you your".split()
+)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+class HashingEmbedder:
+    """Deterministic local embedder for offline tests and keyless setups.
+
+    Words and their character trigrams are hashed into a fixed number of
+    signed buckets, then the vector is L2-normalized. There is no model to
+    download and the same text always maps to the same vector.
+    """
+
+    def __init__(self, dimensions: int = MAS_SEMANTIC_ROUTER_DIMENSIONS):
+        self.dimensions = dimensions
+        self._features: Dict[str, tuple] = {}
+
+    def _feature(self, token: str) -> tuple:
+        cached = self._features.get(token)
+        if cached is None:
+            digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            cached = (value % self.dimensions, 1.0 if value >> 63 else -1.0)
+            self._features[token] = cached
+        return cached
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in _TOKEN.findall(text.lower()):
+                if word in STOPWORDS:
+                    continue
+                index, sign = self._feature(word)
+                vectors[row, index] += 2.0 * sign
+                padded = f"#{word}#"
+                for start in range(len(padded) - 2):
+                    index, sign = self._feature(padded[start:start + 3])
+                    vectors[row, index] += sign
+        return _normalize(vectors)
+
+
+class VertexTextEmbedder:
+    """Embeds texts with a Vertex AI text embedding model."""
+
+    # Texts per request accepted by the Vertex AI embeddings API
+    BATCH_SIZE = 250
+
+    def __init__(self, model_name: str = MAS_SEMANTIC_ROUTER_MODEL):
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        from vertexai.language_models import TextEmbeddingInput, TextEmbeddingModel
+
+        with self._lock:
+            if self._model is None:
+                self._model = TextEmbeddingModel.from_pretrained(self.model_name)
+        rows = []
+        for start in range(0, len(texts), self.BATCH_SIZE):
+            batch = [
+                TextEmbeddingInput(text, task_type="CLASSIFICATION")
+                for text in texts[start:start + self.BATCH_SIZE]
+            ]
+            rows.extend(embedding.values for embedding in self._model.get_embeddings(batch))
+        return _normalize(np.asarray(rows, dtype=np.float32))
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def create_embedder(kind: str = MAS_SEMANTIC_ROUTER_EMBEDDER) -> Embedder:
+    """Creates the configured embedder.
+
+    Args:
+        kind: "hashing" for the local stand-in or "vertex" for Vertex AI
+
+    Returns:
+        Embedder: A callable mapping texts to normalized vectors
+    """
+    if kind == "hashing":
+        return HashingEmbedder()
+    if kind == "vertex":
+        return VertexTextEmbedder()
+    raise ValueError(f"Unknown semantic router embedder: {kind}")
+
+
+def load_test_scenarios(path: Optional[str] = None) -> Dict[str, List[Dict[str, str]]]:
+    """Reads TEST_SCENARIOS from the frontend test routes without importing them.
+
+    The backend module pulls in FastAPI and the MAS client, so the literal
+    is extracted from its source instead.
+
+    Args:
+        path: The Python file defining TEST_SCENARIOS (defaults to the
+            frontend's test routes)
+
+    Returns:
+        dict: Scenario name to a list of {"message", "expected_agent"}, or
+            an empty dict if the file is missing
+    """
+    source_path = Path(path or MAS_SEMANTIC_ROUTER_SCENARIOS or DEFAULT_SCENARIOS_PATH)
+    if not source_path.exists():
+        logger.warning(f"No routing scenarios at {source_path}; using agent descriptions only")
+        return {}
+
+    tree = ast.parse(source_path.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "TEST_SCENARIOS" for target in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    logger.warning(f"{source_path} does not define TEST_SCENARIOS")
+    return {}
+
+
+def build_routing_examples(
+    descriptions: Dict[str, List[str]],
+    scenarios: Dict[str, List[Dict[str, str]]],
+    scenario_agents: Dict[str, str],
+) -> Dict[str, List[str]]:
+    """Collects the texts each agent's centroid is built from.
+
+    Args:
+        descriptions: Agent name to its description strings
+        scenarios: Scenario name to example messages (see load_test_scenarios)
+        scenario_agents: Scenario name to the agent that should handle it
+
+    Returns:
+        dict: Agent name to its example texts
+    """
+    examples = {name: list(texts) for name, texts in descriptions.items()}
+    for scenario, cases in scenarios.items():
+        agent = scenario_agents.get(scenario)
+        if agent is None:
+            logger.warning(f"Routing scenario {scenario} is not mapped to an agent")
+            continue
+        examples.setdefault(agent, []).extend(case["message"] for case in cases)
+    return examples
+
+
+class CentroidIndex:
+    """Nearest-centroid classifier over agent embeddings.
+
+    Centroids are computed on first use so that importing the agent tree
+    never calls a remote embedding model.
+    """
+
+    def __init__(
+        self,
+        examples: Dict[str, List[str]],
+        embedder: Optional[Embedder] = None,
+        min_score: float = MAS_SEMANTIC_ROUTER_MIN_SCORE,
+        min_margin: float = MAS_SEMANTIC_ROUTER_MIN_MARGIN,
+    ):
+        if len(examples) < 2:
+            raise ValueError("A centroid index needs at least two agents")
+        self.examples = {name: list(texts) for name, texts in examples.items()}
+        self.embedder = embedder or create_embedder()
+        self.min_score = min_score
+        self.min_margin = min_margin
+        self.labels: List[str] = list(self.examples)
+        self._centroids: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    def _ensure_built(self) -> np.ndarray:
+        if self._centroids is None:
+            with self._lock:
+                if self._centroids is None:
+                    texts = [text for name in self.labels for text in self.examples[name]]
+                    owners = np.repeat(
+                        np.arange(len(self.labels)), [len(self.examples[name]) for name in self.labels]
+                    )
+                    vectors = self.embedder(texts)
+                    sums = np.zeros((len(self.labels), vectors.shape[1]), dtype=np.float32)
+                    np.add.at(sums, owners, vectors)
+                    self._centroids = _normalize(sums)
+                    logger.info(f"Built {len(self.labels)} routing centroids from {len(texts)} examples")
+        return self._centroids
+
+    def classify_batch(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """Finds the nearest centroid for each text.
+
+        Args:
+            texts: The messages to classify
+
+        Returns:
+            list: One dict per text with the nearest agent (None when the
+                match is too weak or too close to call), the cosine score,
+                the margin over the runner-up and the nearest label
+        """
+        if not texts:
+            return []
+        centroids = self._ensure_built()
+        scores = self.embedder(texts) @ centroids.T
+        top_two = np.argpartition(-scores, 1, axis=1)[:, :2]
+        rows = np.arange(len(texts))[:, None]
+        ordered = np.take_along_axis(top_two, np.argsort(-scores[rows, top_two], axis=1), axis=1)
+        best = scores[rows[:, 0], ordered[:, 0]]
+        margins = best - scores[rows[:, 0], ordered[:, 1]]
+        confident = (best >= self.min_score) & (margins >= self.min_margin)
+
+        return [
+            {
+                "agent": self.labels[label] if ok else None,
+                "label": self.labels[label],
+                "score": float(score),
+                "margin": float(margin),
+            }
+            for label, score, margin, ok in zip(ordered[:, 0], best, margins, confident)
+        ]
+
+    def classify(self, text: str) -> Dict[str, Any]:
+        """Finds the nearest centroid for a single message (see classify_batch)."""
+        return self.classify_batch([text])[0]
@@ -16,8 +16,7 @@
 
 from typing import List
 from google.adk.tools import ToolContext
-from vertexai.preview import rag
-from ..utils import check_corpus_exists, get_corpus_resource_name, convert_docs_url_to_drive
+from ..utils import check_corpus_exists, get_corpus_resource_name, convert_docs_url_to_drive, get_rag
 
 
 def add_data(corpus_name: str, paths: List[str], tool_context: ToolContext = None) -> dict:
@@ -42,6 +41,8 @@ def add_data(corpus_name: str, paths: List[str], tool_context: ToolContext = Non
         - message: Human-readable message about the operation
         - data: Details about the added files
     """
+    rag = get_rag()
+
     try:
         # Use current corpus if corpus_name is empty
         if not corpus_name:
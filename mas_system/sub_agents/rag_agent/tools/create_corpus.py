@@ -16,9 +16,8 @@
 
 from typing import Optional
 from google.adk.tools import ToolContext
-from vertexai.preview import rag
 from ..config import DEFAULT_EMBEDDING_MODEL
-from ..utils import sanitize_corpus_name, check_corpus_exists
+from ..utils import sanitize_corpus_name, check_corpus_exists, get_rag
 
 
 def create_corpus(corpus_name: str, description: Optional[str] = None, tool_context: ToolContext = None) -> dict:
@@ -36,6 +35,8 @@ def create_corpus(corpus_name: str, description: Optional[str] = None, tool_cont
         - message: Human-readable message about the operation
         - data: Additional information about the created corpus
     """
+    rag = get_rag()
+
     try:
         # Sanitize the corpus name
         display_name = sanitize_corpus_name(corpus_name)
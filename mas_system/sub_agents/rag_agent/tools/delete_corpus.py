@@ -15,8 +15,7 @@
 """Delete a Vertex AI RAG corpus."""
 
 from google.adk.tools import ToolContext
-from vertexai.preview import rag
-from ..utils import check_corpus_exists, get_corpus_resource_name
+from ..utils import check_corpus_exists, get_corpus_resource_name, get_rag
 
 
 def delete_corpus(corpus_name: str, confirm: bool, tool_context: ToolContext = None) -> dict:
@@ -34,6 +33,8 @@ def delete_corpus(corpus_name: str, confirm: bool, tool_context: ToolContext = N
         - message: Human-readable message about the operation
         - data: Details about the deletion
     """
+    rag = get_rag()
+
     # Remove initialization of tool_context - can't create without invocation_context
     
     try:
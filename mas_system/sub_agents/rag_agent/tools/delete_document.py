@@ -15,8 +15,7 @@
 """Delete a specific document from a Vertex AI RAG corpus."""
 
 from google.adk.tools import ToolContext
-from vertexai.preview import rag
-from ..utils import check_corpus_exists, get_corpus_resource_name
+from ..utils import check_corpus_exists, get_corpus_resource_name, get_rag
 
 
 def delete_document(corpus_name: str, document_id: str, tool_context: ToolContext = None) -> dict:
@@ -34,6 +33,8 @@ def delete_document(corpus_name: str, document_id: str, tool_context: ToolContex
         - message: Human-readable message about the operation
         - data: Details about the deletion
     """
+    rag = get_rag()
+
     # Initialize tool_context if not provided
     if tool_context is None:
         tool_context = ToolContext()
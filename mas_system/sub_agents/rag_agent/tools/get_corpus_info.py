@@ -15,8 +15,7 @@
 """Get detailed information about a specific RAG corpus."""
 
 from google.adk.tools import ToolContext
-from vertexai.preview import rag
-from ..utils import check_corpus_exists, get_corpus_resource_name, format_document_info
+from ..utils import check_corpus_exists, get_corpus_resource_name, format_document_info, get_rag
 
 
 def get_corpus_info(corpus_name: str, tool_context: ToolContext = None) -> dict:
@@ -33,6 +32,8 @@ def get_corpus_info(corpus_name: str, tool_context: ToolContext = None) -> dict:
         - message: Human-readable message about the corpus
         - data: Detailed corpus information including files
     """
+    rag = get_rag()
+
     # Remove initialization of tool_context - can't create without invocation_context
     
     try:
@@ -15,7 +15,7 @@
 """List all available Vertex AI RAG corpora."""
 
 from google.adk.tools import ToolContext
-from vertexai.preview import rag
+from ..utils import get_rag
 
 
 def list_corpora(tool_context: ToolContext = None) -> dict:
@@ -31,6 +31,8 @@ def list_corpora(tool_context: ToolContext = None) -> dict:
         - message: Human-readable message about the operation
         - data: List of available corpora with their details
     """
+    rag = get_rag()
+
     try:
         # List all corpora
         corpora = rag.list_corpora()
@@ -15,9 +15,8 @@
 """Query a Vertex AI RAG corpus with a user question."""
 
 from google.adk.tools import ToolContext
-from vertexai.preview import rag
 from ..config import DEFAULT_TOP_K, DEFAULT_DISTANCE_THRESHOLD
-from ..utils import check_corpus_exists, get_corpus_resource_name
+from ..utils import check_corpus_exists, get_corpus_resource_name, get_rag
 
 
 def rag_query(corpus_name: str, query: str, tool_context: ToolContext = None) -> dict:
@@ -35,6 +34,8 @@ def rag_query(corpus_name: str, query: str, tool_context: ToolContext = None) ->
         - message: Human-readable message with the answer or error
         - data: Query results including source documents and relevance scores
     """
+    rag = get_rag()
+
     try:
         # Use current corpus if corpus_name is empty
         if not corpus_name:
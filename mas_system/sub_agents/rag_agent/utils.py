@@ -15,10 +15,37 @@
 """Utility functions for the RAG agent."""
 
 import re
-from typing import Optional
-from vertexai.preview import rag
+import threading
 from typing import Optional
 from google.adk.tools import ToolContext
+from .config import GOOGLE_CLOUD_LOCATION, GOOGLE_CLOUD_PROJECT
+
+_rag = None
+_rag_lock = threading.Lock()
+
+
+def get_rag():
+    """
+    Import the Vertex AI RAG module on first use.
+
+    vertexai.preview.rag takes seconds to import, so it is loaded when a RAG
+    tool first runs rather than when the agent is built. Vertex AI is
+    initialized with the configured project and location at the same time.
+
+    Returns:
+        The vertexai.preview.rag module
+    """
+    global _rag
+    if _rag is None:
+        with _rag_lock:
+            if _rag is None:
+                import vertexai
+                from vertexai.preview import rag
+
+                if GOOGLE_CLOUD_PROJECT:
+                    vertexai.init(project=GOOGLE_CLOUD_PROJECT, location=GOOGLE_CLOUD_LOCATION)
+                _rag = rag
+    return _rag
 
 
 def sanitize_corpus_name(name: str) -> str:
@@ -56,6 +83,8 @@ def check_corpus_exists(corpus_name: str, tool_context: Optional[ToolContext] =
     Returns:
         True if the corpus exists, False otherwise
     """
+    rag = get_rag()
+
     # First check state if tool_context is available
     if tool_context:
         state_key = f"corpus_exists_{corpus_name}"
@@ -87,6 +116,8 @@ def get_corpus_resource_name(corpus_name: str) -> Optional[str]:
     Returns:
         The full resource name if found, otherwise the original name
     """
+    rag = get_rag()
+
     # If it already looks like a full resource name, return it
     if corpus_name.startswith("projects/"):
         return corpus_name
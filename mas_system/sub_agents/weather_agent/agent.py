@@ -18,7 +18,7 @@ from google.adk import Agent
 from google.adk.tools import FunctionTool
 
 from . import prompt
-from .tools import weather, random_number
+from .tools import weather_async, random_number
 
 MODEL = "gemini-2.0-flash-001"
 
@@ -29,8 +29,10 @@ weather_agent = Agent(
     description="Handles all weather-related queries including current conditions, forecasts, and weather data for any location",
     instruction=prompt.WEATHER_AGENT_PROMPT,
     tools=[
-        FunctionTool(func=weather.get_current_weather),
-        FunctionTool(func=weather.get_weather_forecast),
+        FunctionTool(func=weather_async.get_current_weather),
+        FunctionTool(func=weather_async.get_weather_forecast),
+        FunctionTool(func=weather_async.get_current_weather_and_forecast),
+        FunctionTool(func=weather_async.get_weather_for_locations),
         FunctionTool(func=random_number.get_random_lucky_number),
         FunctionTool(func=random_number.get_random_temperature_adjustment),
     ],
@@ -0,0 +1,92 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Configuration settings for the weather agent."""
+
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Geocoding cache settings
+GEOCODE_CACHE_SIZE = int(os.getenv("GEOCODE_CACHE_SIZE", "1024"))
+GEOCODE_CACHE_TTL_SECONDS = float(os.getenv("GEOCODE_CACHE_TTL_SECONDS", "86400"))
+GEOCODE_NEGATIVE_TTL_SECONDS = float(os.getenv("GEOCODE_NEGATIVE_TTL_SECONDS", "300"))
+
+# Upstream endpoints (override to point the tools at a local stub server)
+OPEN_METEO_FORECAST_URL = os.getenv("OPEN_METEO_FORECAST_URL", "https://api.open-meteo.com/v1/forecast")
+OPEN_METEO_GEOCODING_URL = os.getenv("OPEN_METEO_GEOCODING_URL", "https://geocoding-api.open-meteo.com/v1/search")
+RANDOM_NUMBER_FUNCTION_URL = os.getenv(
+    "RANDOM_NUMBER_FUNCTION_URL",
+    "https://us-central1-pickuptruckapp.cloudfunctions.net/generate-random-number"
+)
+
+# Shared HTTP client settings
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.25"))
+HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "2"))
+
+# Forecast cache settings
+FORECAST_CACHE_SIZE = int(os.getenv("FORECAST_CACHE_SIZE", "512"))
+FORECAST_CACHE_GRID_DEGREES = float(os.getenv("FORECAST_CACHE_GRID_DEGREES", "0.1"))
+FORECAST_CACHE_FETCH_DAYS = int(os.getenv("FORECAST_CACHE_FETCH_DAYS", "7"))
+FORECAST_REFRESH_INTERVAL_SECONDS = float(os.getenv("FORECAST_REFRESH_INTERVAL_SECONDS", "3600"))
+FORECAST_REFRESH_DELAY_SECONDS = float(os.getenv("FORECAST_REFRESH_DELAY_SECONDS", "0"))
+FORECAST_STALE_SECONDS = float(os.getenv("FORECAST_STALE_SECONDS", "900"))
+
+# Multi-location weather settings
+WEATHER_BATCH_MAX_LOCATIONS = int(os.getenv("WEATHER_BATCH_MAX_LOCATIONS", "10"))
+WEATHER_BATCH_MAX_WORKERS = int(os.getenv("WEATHER_BATCH_MAX_WORKERS", "8"))
+
+# Weather storage write-behind settings
+WEATHER_WRITE_BEHIND_ENABLED = os.getenv("WEATHER_WRITE_BEHIND_ENABLED", "True").lower() == "true"
+WEATHER_WRITE_BATCH_SIZE = min(int(os.getenv("WEATHER_WRITE_BATCH_SIZE", "500")), 500)
+WEATHER_WRITE_FLUSH_INTERVAL_SECONDS = float(os.getenv("WEATHER_WRITE_FLUSH_INTERVAL_SECONDS", "1.0"))
+WEATHER_WRITE_QUEUE_SIZE = int(os.getenv("WEATHER_WRITE_QUEUE_SIZE", "10000"))
+WEATHER_WRITE_PUT_TIMEOUT_SECONDS = float(os.getenv("WEATHER_WRITE_PUT_TIMEOUT_SECONDS", "0.05"))
+WEATHER_WRITE_MAX_RETRIES = int(os.getenv("WEATHER_WRITE_MAX_RETRIES", "3"))
+WEATHER_WRITE_RETRY_BACKOFF_SECONDS = float(os.getenv("WEATHER_WRITE_RETRY_BACKOFF_SECONDS", "0.5"))
+
+# Deduplicate current observations by (location, api_timestamp) on write
+WEATHER_DEDUP_ENABLED = os.getenv("WEATHER_DEDUP_ENABLED", "True").lower() == "true"
+WEATHER_DEDUP_CACHE_SIZE = int(os.getenv("WEATHER_DEDUP_CACHE_SIZE", "4096"))
+WEATHER_DEDUP_TTL_SECONDS = float(os.getenv("WEATHER_DEDUP_TTL_SECONDS", "3600"))
+
+# Weather storage cleanup settings
+WEATHER_CLEANUP_PAGE_SIZE = min(int(os.getenv("WEATHER_CLEANUP_PAGE_SIZE", "500")), 500)
+
+# Default page size for paging through weather history
+WEATHER_HISTORY_PAGE_SIZE = int(os.getenv("WEATHER_HISTORY_PAGE_SIZE", "50"))
+
+# Weather storage backend: "firestore" or "sqlite"
+WEATHER_STORAGE_BACKEND = os.getenv("WEATHER_STORAGE_BACKEND", "firestore").lower()
+WEATHER_SQLITE_PATH = os.getenv("WEATHER_SQLITE_PATH", "weather.db")
+
+# Random number generation: "local" (in-process) or "remote" (Cloud Function
+# with local fallback)
+RANDOM_NUMBER_MODE = os.getenv("RANDOM_NUMBER_MODE", "local").lower()
+RANDOM_NUMBER_BREAKER_FAILURES = int(os.getenv("RANDOM_NUMBER_BREAKER_FAILURES", "3"))
+RANDOM_NUMBER_BREAKER_RESET_SECONDS = float(os.getenv("RANDOM_NUMBER_BREAKER_RESET_SECONDS", "30"))
+
+# Reservoir of pre-fetched random numbers for the fun tools (size is capped
+# at the generator's per-request count limit)
+RANDOM_NUMBER_RESERVOIR_ENABLED = os.getenv("RANDOM_NUMBER_RESERVOIR_ENABLED", "True").lower() == "true"
+RANDOM_NUMBER_RESERVOIR_SIZE = min(int(os.getenv("RANDOM_NUMBER_RESERVOIR_SIZE", "100")), 100)
+RANDOM_NUMBER_RESERVOIR_LOW_WATER = int(os.getenv("RANDOM_NUMBER_RESERVOIR_LOW_WATER", "25"))
@@ -0,0 +1,273 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Forecast cache keyed by coordinate grid cell, aligned to upstream model refreshes."""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from .cache import TTLCache
+from ..config import (
+    FORECAST_CACHE_FETCH_DAYS,
+    FORECAST_CACHE_GRID_DEGREES,
+    FORECAST_CACHE_SIZE,
+    FORECAST_REFRESH_DELAY_SECONDS,
+    FORECAST_REFRESH_INTERVAL_SECONDS,
+    FORECAST_STALE_SECONDS,
+)
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DailyData = Dict[str, List[Any]]
+CacheKey = Tuple[float, float, str]
+
+
+class ForecastCache:
+    """
+    Cache of Open-Meteo daily forecast arrays.
+
+    Entries are keyed by (latitude, longitude) rounded to a grid cell and the
+    temperature unit, and stay fresh until the next upstream model refresh.
+    Requests for fewer days than were fetched are served by slicing. After
+    expiry an entry is served stale for a short window while a background
+    refresh runs.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = FORECAST_CACHE_SIZE,
+        grid_degrees: float = FORECAST_CACHE_GRID_DEGREES,
+        fetch_days: int = FORECAST_CACHE_FETCH_DAYS,
+        refresh_interval: float = FORECAST_REFRESH_INTERVAL_SECONDS,
+        refresh_delay: float = FORECAST_REFRESH_DELAY_SECONDS,
+        stale_seconds: float = FORECAST_STALE_SECONDS,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Args:
+            maxsize: Maximum number of grid cells to keep
+            grid_degrees: Size of a grid cell in degrees
+            fetch_days: Minimum number of days fetched on a miss
+            refresh_interval: Upstream model refresh period, in seconds
+            refresh_delay: Delay after each refresh boundary before new data is expected
+            stale_seconds: How long an expired entry may still be served
+            clock: Wall-clock time source (overridable for tests)
+        """
+        self.grid_degrees = grid_degrees
+        self.fetch_days = fetch_days
+        self.refresh_interval = refresh_interval
+        self.refresh_delay = refresh_delay
+        self.stale_seconds = stale_seconds
+        self._clock = clock
+        self._entries = TTLCache(maxsize=maxsize, clock=clock)
+        self._refreshing: Set[CacheKey] = set()
+        self._refreshing_lock = threading.Lock()
+        self._background_tasks: Set["asyncio.Task[None]"] = set()
+        self.fresh_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def key(self, lat: float, lon: float, unit: str) -> CacheKey:
+        """Round coordinates to the grid cell that identifies a cache entry."""
+        cell = self.grid_degrees
+        return (round(round(lat / cell) * cell, 6), round(round(lon / cell) * cell, 6), unit)
+
+    def next_refresh(self, now: float) -> float:
+        """Wall-clock time at which data fetched at `now` is superseded upstream."""
+        boundary = math.floor((now - self.refresh_delay) / self.refresh_interval) + 1
+        return boundary * self.refresh_interval + self.refresh_delay
+
+    def _lookup(self, key: CacheKey, days: int) -> Tuple[Optional[DailyData], bool]:
+        """Return (sliced daily data, is_stale), or (None, False) on a miss."""
+        entry = self._entries.get(key)
+        if entry is None or entry["days"] < days:
+            self.misses += 1
+            return None, False
+
+        daily = {name: values[:days] for name, values in entry["daily"].items()}
+        if self._clock() < entry["fresh_until"]:
+            self.fresh_hits += 1
+            return daily, False
+        self.stale_hits += 1
+        return daily, True
+
+    def _store(self, key: CacheKey, daily: DailyData, days: int) -> None:
+        # Upstream may return fewer days than asked for; only claim what we hold
+        days = min(days, len(daily.get("time", [])))
+        now = self._clock()
+        fresh_until = self.next_refresh(now)
+        self._entries.set(
+            key,
+            {"daily": daily, "days": days, "fresh_until": fresh_until},
+            ttl=fresh_until - now + self.stale_seconds
+        )
+
+    def put(self, lat: float, lon: float, days: int, unit: str, daily: DailyData) -> None:
+        """
+        Seed the cache with daily data fetched by another code path.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            days: Number of days the daily block covers
+            unit: Temperature unit
+            daily: The API "daily" block
+        """
+        self._store(self.key(lat, lon, unit), daily, days)
+
+    def _claim_refresh(self, key: CacheKey) -> bool:
+        """Mark a key as refreshing; False if a refresh is already running."""
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _release_refresh(self, key: CacheKey) -> None:
+        with self._refreshing_lock:
+            self._refreshing.discard(key)
+
+    def _fetch_days(self, days: int) -> int:
+        return max(days, self.fetch_days)
+
+    def get(
+        self,
+        lat: float,
+        lon: float,
+        days: int,
+        unit: str,
+        fetch: Callable[[int], DailyData]
+    ) -> DailyData:
+        """
+        Get daily forecast arrays, fetching synchronously on a miss.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            days: Number of days wanted
+            unit: Temperature unit
+            fetch: Called with a day count; returns the API "daily" block
+
+        Returns:
+            Daily forecast arrays trimmed to `days`
+        """
+        key = self.key(lat, lon, unit)
+        daily, stale = self._lookup(key, days)
+        if daily is not None:
+            if stale and self._claim_refresh(key):
+                threading.Thread(
+                    target=self._refresh, args=(key, days, fetch), daemon=True
+                ).start()
+            return daily
+
+        fetch_days = self._fetch_days(days)
+        fetched = fetch(fetch_days)
+        self._store(key, fetched, fetch_days)
+        return {name: values[:days] for name, values in fetched.items()}
+
+    def _refresh(self, key: CacheKey, days: int, fetch: Callable[[int], DailyData]) -> None:
+        fetch_days = self._fetch_days(days)
+        try:
+            self._store(key, fetch(fetch_days), fetch_days)
+            self.refreshes += 1
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.warning(f"Background forecast refresh failed for {key}: {e}")
+        finally:
+            self._release_refresh(key)
+
+    async def aget(
+        self,
+        lat: float,
+        lon: float,
+        days: int,
+        unit: str,
+        fetch: Callable[[int], Awaitable[DailyData]]
+    ) -> DailyData:
+        """
+        Async variant of get(); stale refreshes run as event loop tasks.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            days: Number of days wanted
+            unit: Temperature unit
+            fetch: Awaitable called with a day count; returns the API "daily" block
+
+        Returns:
+            Daily forecast arrays trimmed to `days`
+        """
+        key = self.key(lat, lon, unit)
+        daily, stale = self._lookup(key, days)
+        if daily is not None:
+            if stale and self._claim_refresh(key):
+                task = asyncio.create_task(self._arefresh(key, days, fetch))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+            return daily
+
+        fetch_days = self._fetch_days(days)
+        fetched = await fetch(fetch_days)
+        self._store(key, fetched, fetch_days)
+        return {name: values[:days] for name, values in fetched.items()}
+
+    async def _arefresh(
+        self,
+        key: CacheKey,
+        days: int,
+        fetch: Callable[[int], Awaitable[DailyData]]
+    ) -> None:
+        fetch_days = self._fetch_days(days)
+        try:
+            self._store(key, await fetch(fetch_days), fetch_days)
+            self.refreshes += 1
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.warning(f"Background forecast refresh failed for {key}: {e}")
+        finally:
+            self._release_refresh(key)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self.fresh_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with fresh/stale hits, misses, refreshes and size
+        """
+        return {
+            "fresh_hits": self.fresh_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "size": len(self._entries),
+            "maxsize": self._entries.maxsize
+        }
@@ -0,0 +1,311 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Shared pooled HTTP client for the weather agent tools."""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config import (
+    HTTP_BACKOFF_FACTOR,
+    HTTP_BACKOFF_MAX,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_MAX_RETRIES,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_READ_TIMEOUT,
+)
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying: rate limiting and transient upstream failures
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _full_jitter_backoff(attempt: int, backoff_factor: float, backoff_max: float) -> float:
+    """Full-jitter delay before retry number `attempt` (0-based)."""
+    ceiling = min(backoff_max, backoff_factor * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+class HTTPClient:
+    """
+    Keep-alive HTTP client with per-host connection pooling and retries.
+
+    Wraps a requests.Session so TCP and TLS connections are reused across
+    tool calls. Failed requests are retried with full-jitter exponential
+    backoff.
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = HTTP_READ_TIMEOUT,
+        pool_connections: int = HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_factor: float = HTTP_BACKOFF_FACTOR,
+        backoff_max: float = HTTP_BACKOFF_MAX,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            session: Pre-built session to use instead of a pooled one
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait for a response
+            pool_connections: Number of per-host pools to keep
+            pool_maxsize: Maximum connections kept open per host
+            max_retries: Retries after the first attempt
+            backoff_factor: Base delay for exponential backoff, in seconds
+            backoff_max: Upper bound for a single backoff delay, in seconds
+            sleep: Sleep function (overridable for tests)
+        """
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=True
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self._sleep = sleep
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request, retrying connection errors and retryable statuses.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to requests.Session.request
+
+        Returns:
+            The final response (callers should still call raise_for_status)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                logger.warning(f"{method} {url} failed ({e}), retrying")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    return response
+                logger.warning(f"{method} {url} returned {response.status_code}, retrying")
+                response.close()
+
+            self._sleep(_full_jitter_backoff(attempt, self.backoff_factor, self.backoff_max))
+            attempt += 1
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+
+class AsyncHTTPClient:
+    """
+    Async counterpart of HTTPClient built on httpx.AsyncClient.
+
+    Lets async tools await upstream I/O instead of blocking the event loop,
+    with the same pooling, timeout and retry behaviour as HTTPClient.
+    """
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = HTTP_READ_TIMEOUT,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_factor: float = HTTP_BACKOFF_FACTOR,
+        backoff_max: float = HTTP_BACKOFF_MAX,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        """
+        Args:
+            client: Pre-built httpx client to use instead of a pooled one
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait for a response
+            pool_maxsize: Maximum connections kept open
+            max_retries: Retries after the first attempt
+            backoff_factor: Base delay for exponential backoff, in seconds
+            backoff_max: Upper bound for a single backoff delay, in seconds
+            sleep: Async sleep function (overridable for tests)
+        """
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=pool_maxsize,
+                    max_keepalive_connections=pool_maxsize
+                )
+            )
+        self.client = client
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self._sleep = sleep
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request, retrying transport errors and retryable statuses.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to httpx.AsyncClient.request
+
+        Returns:
+            The final response (callers should still call raise_for_status)
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= self.max_retries:
+                    raise
+                logger.warning(f"{method} {url} failed ({e}), retrying")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    return response
+                logger.warning(f"{method} {url} returned {response.status_code}, retrying")
+                await response.aclose()
+
+            await self._sleep(_full_jitter_backoff(attempt, self.backoff_factor, self.backoff_max))
+            attempt += 1
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self.client.aclose()
+
+
+# Shared client instances, created on first use
+_http_client = None
+_http_client_lock = threading.Lock()
+
+# httpx connection pools are bound to the event loop that opened them,
+# so the default async client is kept per running loop
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHTTPClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_http_client_override = None
+
+
+def get_http_client() -> HTTPClient:
+    """
+    Get or create the shared HTTP client instance.
+
+    Returns:
+        HTTPClient: Shared pooled HTTP client
+    """
+    global _http_client
+
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = HTTPClient()
+                logger.info("Shared HTTP client initialized")
+
+    return _http_client
+
+
+def set_http_client(client: Optional[HTTPClient]) -> None:
+    """
+    Replace the shared HTTP client, e.g. with one pointed at a stub server.
+
+    Args:
+        client: Client to install, or None to rebuild the default lazily
+
+    The previous client is not closed; callers that own it should close it.
+    """
+    global _http_client
+
+    with _http_client_lock:
+        _http_client = client
+
+
+def get_async_http_client() -> AsyncHTTPClient:
+    """
+    Get or create the shared async HTTP client for the running event loop.
+
+    Returns:
+        AsyncHTTPClient: Shared pooled async HTTP client
+    """
+    if _async_http_client_override is not None:
+        return _async_http_client_override
+
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+    if client is None:
+        client = AsyncHTTPClient()
+        _async_http_clients[loop] = client
+        logger.info("Shared async HTTP client initialized")
+    return client
+
+
+def set_async_http_client(client: Optional[AsyncHTTPClient]) -> None:
+    """
+    Install an async HTTP client used by every event loop, e.g. for tests.
+
+    Args:
+        client: Client to install, or None to go back to per-loop defaults
+    """
+    global _async_http_client_override
+
+    _async_http_client_override = client
+
+
+async def close_async_http_client() -> None:
+    """Close the default async HTTP client of the running event loop."""
+    client = _async_http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -14,20 +14,159 @@
 
 import requests
 import os
-from typing import Dict, Any, Optional, List, Union
+import random
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple, Union
 import logging
+from .circuit_breaker import CircuitBreaker
+from .http_client import get_http_client
+from .reservoir import RandomNumberReservoir
+from ..config import (
+    RANDOM_NUMBER_BREAKER_FAILURES,
+    RANDOM_NUMBER_BREAKER_RESET_SECONDS,
+    RANDOM_NUMBER_FUNCTION_URL,
+    RANDOM_NUMBER_MODE,
+    RANDOM_NUMBER_RESERVOIR_ENABLED,
+)
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 # Cloud Function URL
-CLOUD_FUNCTION_URL = "https://us-central1-pickuptruckapp.cloudfunctions.net/generate-random-number"
+CLOUD_FUNCTION_URL = RANDOM_NUMBER_FUNCTION_URL
+
+# Guards the optional remote generator; when open, numbers are generated locally
+_remote_breaker = CircuitBreaker(
+    failure_threshold=RANDOM_NUMBER_BREAKER_FAILURES,
+    reset_timeout=RANDOM_NUMBER_BREAKER_RESET_SECONDS
+)
+
+_random = random.Random()
+
+
+def _validate_parameters(min_value, max_value, count, decimal_places) -> Optional[str]:
+    """Apply the Cloud Function's parameter checks; return an error message or None."""
+    if min_value >= max_value:
+        return "min must be less than max"
+    if count < 1 or count > 100:
+        return "count must be between 1 and 100"
+    if decimal_places < 0 or decimal_places > 10:
+        return "decimal_places must be between 0 and 10"
+    return None
+
+
+def generate_random_numbers(
+    min_value: int = 1,
+    max_value: int = 100,
+    count: int = 1,
+    decimal_places: int = 0
+) -> Dict[str, Any]:
+    """
+    Generate random number(s) in-process.
+    
+    Follows the contract of the generate-random-number Cloud Function
+    (cloud_functions/random_number_generator/main.py): same validation and
+    the same response body.
+    
+    Args:
+        min_value: Minimum value (inclusive)
+        max_value: Maximum value (inclusive)
+        count: Number of random numbers to generate (1-100)
+        decimal_places: Number of decimal places (0 for integers, up to 10 for floats)
+        
+    Returns:
+        Dictionary shaped like the Cloud Function response
+    """
+    error = _validate_parameters(min_value, max_value, count, decimal_places)
+    if error:
+        return {"error": error, "status": "error"}
+    
+    if decimal_places == 0:
+        numbers = [_random.randint(min_value, max_value) for _ in range(count)]
+    else:
+        numbers = [round(_random.uniform(min_value, max_value), decimal_places) for _ in range(count)]
+    
+    return {
+        "status": "success",
+        "numbers": numbers if count > 1 else numbers[0],
+        "parameters": {
+            "min": min_value,
+            "max": max_value,
+            "count": count,
+            "decimal_places": decimal_places
+        },
+        "timestamp": datetime.utcnow().isoformat() + "Z"
+    }
+
 
 def get_random_number(
     min_value: int = 1, 
     max_value: int = 100, 
     count: int = 1,
     decimal_places: int = 0
+) -> Dict[str, Any]:
+    """
+    Get random number(s), locally or from the Cloud Function.
+    
+    In "remote" mode the Cloud Function is called while its circuit
+    breaker is closed; failures fall back to local generation.
+    
+    Args:
+        min_value: Minimum value (inclusive)
+        max_value: Maximum value (inclusive)
+        count: Number of random numbers to generate (1-100)
+        decimal_places: Number of decimal places (0 for integers, up to 10 for floats)
+        
+    Returns:
+        Dictionary containing the random number(s) and metadata
+    """
+    error = _validate_parameters(min_value, max_value, count, decimal_places)
+    if error:
+        # Rejected before any remote call so bad input never trips the breaker
+        return {
+            "success": False,
+            "error": error
+        }
+    
+    if RANDOM_NUMBER_MODE == "remote" and _remote_breaker.allow():
+        result = _get_remote_random_number(min_value, max_value, count, decimal_places)
+        if result.get("success"):
+            _remote_breaker.record_success()
+            return result
+        _remote_breaker.record_failure()
+        logger.warning(f"Falling back to local random numbers: {result.get('error')}")
+    
+    data = generate_random_numbers(min_value, max_value, count, decimal_places)
+    if data.get("status") == "success":
+        return {
+            "success": True,
+            "numbers": data["numbers"],
+            "parameters": data["parameters"],
+            "timestamp": data["timestamp"],
+            "source": "local"
+        }
+    return {
+        "success": False,
+        "error": data["error"]
+    }
+
+
+def get_remote_breaker_stats() -> Dict[str, Any]:
+    """
+    Get the state of the remote generator's circuit breaker.
+    
+    Returns:
+        Dictionary with breaker state
+    """
+    return _remote_breaker.stats()
+
+
+def _get_remote_random_number(
+    min_value: int = 1, 
+    max_value: int = 100, 
+    count: int = 1,
+    decimal_places: int = 0
 ) -> Dict[str, Any]:
     """
     Get random number(s) from the Cloud Function.
@@ -51,11 +190,10 @@ def get_random_number(
         }
         
         # Make request to Cloud Function
-        response = requests.post(
+        response = get_http_client().post(
             CLOUD_FUNCTION_URL,
             json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=10
+            headers={"Content-Type": "application/json"}
         )
         
         # Check response status
@@ -70,7 +208,8 @@ def get_random_number(
                 "success": True,
                 "numbers": data.get("numbers"),
                 "parameters": data.get("parameters"),
-                "timestamp": data.get("timestamp")
+                "timestamp": data.get("timestamp"),
+                "source": "remote"
             }
         else:
             logger.error(f"Cloud Function error: {data.get('error')}")
@@ -93,6 +232,82 @@ def get_random_number(
         }
 
 
+# One reservoir per (min_value, max_value, decimal_places) profile
+_reservoirs: Dict[Tuple[int, int, int], RandomNumberReservoir] = {}
+_reservoirs_lock = threading.Lock()
+
+
+def _reservoir_fetch(min_value: int, max_value: int, decimal_places: int):
+    """Build a reservoir fetch function that requests numbers in bulk."""
+    def fetch(count: int) -> List[Union[int, float]]:
+        result = get_random_number(min_value, max_value, count, decimal_places)
+        if not result.get("success"):
+            raise RuntimeError(result.get("error", "Unknown error"))
+        numbers = result["numbers"]
+        return numbers if isinstance(numbers, list) else [numbers]
+    return fetch
+
+
+def get_reservoir(min_value: int, max_value: int, decimal_places: int = 0) -> RandomNumberReservoir:
+    """
+    Get the shared reservoir for a number profile, creating it on first use.
+    
+    Args:
+        min_value: Minimum value (inclusive)
+        max_value: Maximum value (inclusive)
+        decimal_places: Number of decimal places
+        
+    Returns:
+        The profile's RandomNumberReservoir
+    """
+    key = (min_value, max_value, decimal_places)
+    reservoir = _reservoirs.get(key)
+    if reservoir is None:
+        with _reservoirs_lock:
+            reservoir = _reservoirs.get(key)
+            if reservoir is None:
+                reservoir = RandomNumberReservoir(_reservoir_fetch(*key))
+                _reservoirs[key] = reservoir
+    return reservoir
+
+
+def get_reservoir_stats() -> Dict[str, Any]:
+    """
+    Get counters for every reservoir profile.
+    
+    Returns:
+        Dictionary keyed by "min:max:decimal_places"
+    """
+    return {
+        f"{min_value}:{max_value}:{decimal_places}": reservoir.stats()
+        for (min_value, max_value, decimal_places), reservoir in list(_reservoirs.items())
+    }
+
+
+def clear_reservoirs() -> None:
+    """Drop all reservoirs and their buffered numbers."""
+    with _reservoirs_lock:
+        _reservoirs.clear()
+
+
+def _get_single_number(min_value: int, max_value: int) -> Dict[str, Any]:
+    """Get one integer, from the profile's reservoir when enabled."""
+    if not RANDOM_NUMBER_RESERVOIR_ENABLED:
+        return get_random_number(min_value=min_value, max_value=max_value, count=1)
+    
+    number = get_reservoir(min_value, max_value).take()
+    if number is None:
+        return {
+            "success": False,
+            "error": "Random number reservoir is empty"
+        }
+    return {
+        "success": True,
+        "numbers": number,
+        "timestamp": datetime.utcnow().isoformat() + "Z"
+    }
+
+
 def get_random_lucky_number() -> Dict[str, Any]:
     """
     Get a random lucky number between 1 and 100.
@@ -101,7 +316,7 @@ def get_random_lucky_number() -> Dict[str, Any]:
     Returns:
         Dictionary containing the lucky number
     """
-    result = get_random_number(min_value=1, max_value=100, count=1)
+    result = _get_single_number(1, 100)
     
     if result.get("success"):
         return {
@@ -124,7 +339,7 @@ def get_random_temperature_adjustment() -> Dict[str, Any]:
     Returns:
         Dictionary containing the temperature adjustment
     """
-    result = get_random_number(min_value=-5, max_value=5, count=1)
+    result = _get_single_number(-5, 5)
     
     if result.get("success"):
         adjustment = result["numbers"]
@@ -0,0 +1,158 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Pre-fetched pool of random numbers refilled in the background."""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+
+from ..config import RANDOM_NUMBER_RESERVOIR_LOW_WATER, RANDOM_NUMBER_RESERVOIR_SIZE
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+Number = Union[int, float]
+
+
+class RandomNumberReservoir:
+    """
+    Hands out random numbers from memory and refills them in bulk.
+
+    When the number of buffered values drops below `low_water`, a background
+    thread fetches enough values to fill the reservoir back to `capacity`.
+    If the reservoir is empty when a value is requested (it "ran dry"), the
+    caller refills it synchronously. Only one refill runs at a time; callers
+    that run dry meanwhile wait for it instead of fetching on their own.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], List[Number]],
+        capacity: int = RANDOM_NUMBER_RESERVOIR_SIZE,
+        low_water: int = RANDOM_NUMBER_RESERVOIR_LOW_WATER,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            fetch: Called with a count; returns that many random numbers
+            capacity: Values to hold after a refill
+            low_water: Buffered values below which a background refill starts
+            clock: Time source used for the refill rate
+        """
+        self._fetch = fetch
+        self.capacity = capacity
+        self.low_water = min(low_water, capacity)
+        self._clock = clock
+        self._values: Deque[Number] = deque()
+        self._lock = threading.Lock()
+        self._refill_lock = threading.Lock()
+        self._refilling = False
+        self._created = clock()
+        self.takes = 0
+        self.dry = 0
+        self.refills = 0
+        self.refilled_values = 0
+        self.refill_failures = 0
+
+    def take(self) -> Optional[Number]:
+        """
+        Take one random number.
+
+        Returns:
+            A random number, or None if the reservoir is empty and a
+            synchronous refill failed
+        """
+        self.takes += 1
+        try:
+            value = self._values.popleft()
+        except IndexError:
+            self.dry += 1
+            with self._refill_lock:
+                # A refill that finished while we waited may have topped it up
+                if not self._values:
+                    self._refill()
+            try:
+                value = self._values.popleft()
+            except IndexError:
+                return None
+
+        if len(self._values) < self.low_water and self._claim_refill():
+            threading.Thread(target=self._background_refill, daemon=True).start()
+        return value
+
+    def _claim_refill(self) -> bool:
+        with self._lock:
+            if self._refilling:
+                return False
+            self._refilling = True
+            return True
+
+    def _background_refill(self) -> None:
+        try:
+            with self._refill_lock:
+                self._refill()
+        finally:
+            with self._lock:
+                self._refilling = False
+
+    def _refill(self) -> None:
+        # Callers hold _refill_lock, so refills never overlap
+        count = self.capacity - len(self._values)
+        if count <= 0:
+            return
+        try:
+            values = self._fetch(count)
+        except Exception as e:
+            self.refill_failures += 1
+            logger.warning(f"Random number reservoir refill failed: {e}")
+            return
+        values = values[:max(self.capacity - len(self._values), 0)]
+        self._values.extend(values)
+        self.refills += 1
+        self.refilled_values += len(values)
+
+    def clear(self) -> None:
+        """Drop buffered values and reset counters."""
+        self._values.clear()
+        self._created = self._clock()
+        self.takes = 0
+        self.dry = 0
+        self.refills = 0
+        self.refilled_values = 0
+        self.refill_failures = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get reservoir counters.
+
+        Returns:
+            Dictionary with takes, dry runs, refills and refill rate
+        """
+        elapsed_minutes = max(self._clock() - self._created, 1e-9) / 60
+        return {
+            "size": len(self._values),
+            "capacity": self.capacity,
+            "low_water": self.low_water,
+            "takes": self.takes,
+            "dry": self.dry,
+            "dry_rate": self.dry / self.takes if self.takes else 0.0,
+            "refills": self.refills,
+            "refilled_values": self.refilled_values,
+            "refill_failures": self.refill_failures,
+            "refills_per_minute": self.refills / elapsed_minutes
+        }
@@ -0,0 +1,289 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Embedded SQLite weather storage for offline runs, CI and load tests."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from .weather_storage import (
+    WeatherStorageBackend,
+    build_weather_document,
+    decode_history_cursor,
+    encode_history_cursor,
+    observation_document_id,
+)
+from ..config import WEATHER_DEDUP_ENABLED, WEATHER_HISTORY_PAGE_SIZE
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS weather_current (
+    id TEXT PRIMARY KEY,
+    location TEXT NOT NULL,
+    latitude REAL,
+    longitude REAL,
+    timestamp REAL NOT NULL,
+    temperature REAL,
+    temperature_unit TEXT,
+    description TEXT,
+    humidity REAL,
+    wind_speed REAL,
+    feels_like REAL,
+    precipitation_probability REAL,
+    api_timestamp TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_weather_current_location_timestamp
+    ON weather_current (location, timestamp);
+CREATE INDEX IF NOT EXISTS idx_weather_current_timestamp
+    ON weather_current (timestamp);
+
+CREATE TABLE IF NOT EXISTS weather_forecasts (
+    id TEXT PRIMARY KEY,
+    location TEXT NOT NULL,
+    latitude REAL,
+    longitude REAL,
+    timestamp REAL NOT NULL,
+    forecast_days INTEGER,
+    temperature_unit TEXT,
+    forecasts TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_weather_forecasts_location_timestamp
+    ON weather_forecasts (location, timestamp);
+CREATE INDEX IF NOT EXISTS idx_weather_forecasts_timestamp
+    ON weather_forecasts (timestamp);
+"""
+
+_CURRENT_COLUMNS = (
+    "temperature", "temperature_unit", "description", "humidity", "wind_speed",
+    "feels_like", "precipitation_probability", "api_timestamp"
+)
+
+
+class SQLiteWeatherBackend(WeatherStorageBackend):
+    """
+    Weather storage in a local SQLite database running in WAL mode.
+
+    Each thread gets its own connection so readers never block behind the
+    writer. Queries are served by (location, timestamp) indexes.
+    """
+    
+    name = "sqlite"
+    
+    def __init__(self, path: str = "weather.db", clock=time.time):
+        """
+        Args:
+            path: Database file path (":memory:" is not supported across threads)
+            clock: Time source returning epoch seconds (overridable for tests)
+        """
+        self.path = path
+        self._clock = clock
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._connection().executescript(_SCHEMA)
+        logger.info(f"SQLite weather storage initialized at {path}")
+    
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+    
+    def save(self, weather_data: Dict[str, Any], data_type: str = "current") -> Optional[str]:
+        try:
+            # Skip if there's an error in the data
+            if "error" in weather_data:
+                logger.warning(f"Skipping save due to error: {weather_data['error']}")
+                return None
+            
+            doc = build_weather_document(weather_data, data_type)
+            # Repeated observations share a deterministic ID and are inserted once
+            observation_id = observation_document_id(doc) if WEATHER_DEDUP_ENABLED else None
+            doc_id = observation_id or uuid.uuid4().hex
+            coordinates = doc["coordinates"] or {}
+            common = (doc_id, doc["location"], coordinates.get("latitude"), coordinates.get("longitude"), self._clock())
+            
+            if data_type == "current":
+                self._connection().execute(
+                    "INSERT OR IGNORE INTO weather_current (id, location, latitude, longitude, timestamp, "
+                    f"{', '.join(_CURRENT_COLUMNS)}) VALUES ({', '.join('?' * (5 + len(_CURRENT_COLUMNS)))})",
+                    common + tuple(doc[column] for column in _CURRENT_COLUMNS)
+                )
+            else:
+                self._connection().execute(
+                    "INSERT INTO weather_forecasts (id, location, latitude, longitude, timestamp, "
+                    "forecast_days, temperature_unit, forecasts) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    common + (doc["forecast_days"], doc["temperature_unit"], json.dumps(doc["forecasts"]))
+                )
+            
+            logger.debug(f"Saved {data_type} weather data for {doc['location']} with ID: {doc_id}")
+            return doc_id
+            
+        except Exception as e:
+            logger.error(f"Failed to save weather data: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _current_record(row: sqlite3.Row) -> Dict[str, Any]:
+        """Shape a weather_current row like a Firestore weather document."""
+        record = {column: row[column] for column in _CURRENT_COLUMNS}
+        record.update({
+            "location": row["location"],
+            "coordinates": {"latitude": row["latitude"], "longitude": row["longitude"]},
+            "data_type": "current",
+            "timestamp": datetime.fromtimestamp(row["timestamp"], timezone.utc).isoformat(),
+            "doc_id": row["id"],
+        })
+        return record
+    
+    def get_history_page(
+        self,
+        location: str,
+        hours: int = 24,
+        page_size: int = WEATHER_HISTORY_PAGE_SIZE,
+        fields: Optional[List[str]] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        try:
+            sql = "SELECT * FROM weather_current WHERE location = ? AND timestamp >= ?"
+            params: List[Any] = [location, self._clock() - hours * 3600]
+            if cursor:
+                # Keyset pagination on (timestamp, id), matching the ORDER BY
+                position, doc_id = decode_history_cursor(cursor)
+                sql += " AND (timestamp < ? OR (timestamp = ? AND id < ?))"
+                params += [float(position), float(position), doc_id]
+            rows = self._connection().execute(
+                sql + " ORDER BY timestamp DESC, id DESC LIMIT ?", params + [page_size]
+            ).fetchall()
+            
+            records = [self._current_record(row) for row in rows]
+            if fields:
+                keep = set(fields) | {"timestamp", "doc_id"}
+                records = [{key: value for key, value in record.items() if key in keep} for record in records]
+            
+            next_cursor = None
+            if len(rows) == page_size:
+                next_cursor = encode_history_cursor(repr(rows[-1]["timestamp"]), rows[-1]["id"])
+            return {"records": records, "next_cursor": next_cursor}
+        except Exception as e:
+            logger.error(f"Failed to retrieve weather data: {str(e)}")
+            return {"records": [], "next_cursor": None, "error": str(e)}
+    
+    def get_statistics(self, location: str, days: int = 7) -> Dict[str, Any]:
+        try:
+            # Same window as the Firestore rollups: today and the preceding UTC days
+            today = datetime.fromtimestamp(self._clock(), timezone.utc).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            threshold = (today - timedelta(days=days - 1)).timestamp()
+            connection = self._connection()
+            
+            summary = connection.execute(
+                "SELECT COUNT(temperature) AS count, AVG(temperature) AS avg_temperature, "
+                "MIN(temperature) AS min_temperature, MAX(temperature) AS max_temperature, "
+                "AVG(humidity) AS avg_humidity FROM weather_current "
+                "WHERE location = ? AND timestamp >= ?",
+                (location, threshold)
+            ).fetchone()
+            
+            if not summary["count"]:
+                return {"error": f"No weather data found for {location} in the last {days} days"}
+            
+            conditions = {
+                row["description"]: row["count"]
+                for row in connection.execute(
+                    "SELECT description, COUNT(*) AS count FROM weather_current "
+                    "WHERE location = ? AND timestamp >= ? GROUP BY description",
+                    (location, threshold)
+                )
+            }
+            
+            return {
+                "location": location,
+                "period_days": days,
+                "data_points": summary["count"],
+                "temperature": {
+                    "avg": round(summary["avg_temperature"], 1),
+                    "min": summary["min_temperature"],
+                    "max": summary["max_temperature"]
+                },
+                "humidity": {
+                    "avg": round(summary["avg_humidity"], 1) if summary["avg_humidity"] is not None else None
+                },
+                "most_common_condition": max(conditions.items(), key=lambda x: x[1])[0] if conditions else None,
+                "conditions_breakdown": conditions
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to calculate weather statistics: {str(e)}")
+            return {"error": str(e)}
+    
+    def cleanup(self, days_to_keep: int = 30, dry_run: bool = False) -> Dict[str, Any]:
+        try:
+            start = time.monotonic()
+            cutoff = self._clock() - days_to_keep * 86400
+            count_key = "would_delete" if dry_run else "deleted"
+            connection = self._connection()
+            
+            collections = {}
+            for table in ("weather_current", "weather_forecasts"):
+                if dry_run:
+                    count = connection.execute(
+                        f"SELECT COUNT(*) FROM {table} WHERE timestamp < ?", (cutoff,)
+                    ).fetchone()[0]
+                else:
+                    count = connection.execute(
+                        f"DELETE FROM {table} WHERE timestamp < ?", (cutoff,)
+                    ).rowcount
+                collections[table] = {count_key: count, "completed": True}
+            
+            elapsed = time.monotonic() - start
+            total = sum(result[count_key] for result in collections.values())
+            logger.info(f"SQLite cleanup {'counted' if dry_run else 'deleted'} {total} old weather records")
+            return {
+                "dry_run": dry_run,
+                "cutoff": datetime.fromtimestamp(cutoff, timezone.utc).isoformat(),
+                count_key: total,
+                "collections": collections,
+                "completed": True,
+                "cursors": {},
+                "elapsed_seconds": round(elapsed, 3),
+                "docs_per_second": round(total / elapsed, 1) if elapsed > 0 else None
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to cleanup old data: {str(e)}")
+            return {"error": str(e)}
+    
+    def close(self) -> None:
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
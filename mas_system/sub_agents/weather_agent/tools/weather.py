@@ -12,10 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import requests
-from typing import Dict, Any, Tuple
-from datetime import datetime
-from .weather_store import save_weather_data
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Union
+from .cache import TTLCache
+from .forecast_cache import ForecastCache
+from .http_client import get_http_client
+from .weather_format import describe_weather_code, shape_daily_forecast
+from .weather_storage import save_weather_data
+from ..config import (
+    GEOCODE_CACHE_SIZE,
+    GEOCODE_CACHE_TTL_SECONDS,
+    GEOCODE_NEGATIVE_TTL_SECONDS,
+    OPEN_METEO_FORECAST_URL,
+    OPEN_METEO_GEOCODING_URL,
+    WEATHER_BATCH_MAX_LOCATIONS,
+    WEATHER_BATCH_MAX_WORKERS,
+)
 import logging
 
 # Set up logging
@@ -23,44 +36,285 @@ logger = logging.getLogger(__name__)
 
 # Open-Meteo API (free, no API key required)
 # This is a real weather API that provides actual weather data
-BASE_URL = "https://api.open-meteo.com/v1/forecast"
-GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
+BASE_URL = OPEN_METEO_FORECAST_URL
+GEOCODING_URL = OPEN_METEO_GEOCODING_URL
+
+# Only the variables the tools actually read are requested. Current
+# conditions come from the "current" block, so no hourly arrays are needed.
+CURRENT_VARIABLES = "temperature_2m,relative_humidity_2m,apparent_temperature,precipitation_probability,weather_code,wind_speed_10m"
+DAILY_VARIABLES = "weather_code,temperature_2m_max,temperature_2m_min,precipitation_sum,precipitation_probability_max"
+
+# Common shorthand names mapped to the query the geocoder understands
+LOCATION_ALIASES = {
+    "nyc": "new york",
+    "new york city": "new york",
+    "la": "los angeles",
+    "sf": "san francisco",
+    "san fran": "san francisco",
+    "dc": "washington",
+    "washington dc": "washington",
+    "washington d.c.": "washington",
+    "philly": "philadelphia",
+    "vegas": "las vegas",
+    "nola": "new orleans",
+}
+
+# Marker stored in the cache for locations the geocoder could not find
+_NOT_FOUND = object()
+
+_geocode_cache = TTLCache(maxsize=GEOCODE_CACHE_SIZE, ttl=GEOCODE_CACHE_TTL_SECONDS)
+
+_forecast_cache = ForecastCache()
+
+
+def normalize_location(location: str) -> str:
+    """
+    Normalize a location string so equivalent queries share a cache entry.
+    
+    Args:
+        location: City name or location as typed by the user
+        
+    Returns:
+        Lower-cased, whitespace-collapsed location with aliases resolved
+    """
+    normalized = re.sub(r"\s+", " ", location).strip().lower()
+    normalized = re.sub(r"\s*,\s*", ", ", normalized)
+    return LOCATION_ALIASES.get(normalized, normalized)
+
+
+def get_geocode_cache_stats() -> Dict[str, Any]:
+    """
+    Get hit/miss counters for the geocoding cache.
+    
+    Returns:
+        Dictionary with cache statistics
+    """
+    return _geocode_cache.stats()
+
+
+def clear_geocode_cache() -> None:
+    """Drop all cached geocoding results and reset the counters."""
+    _geocode_cache.clear()
+
+
+def get_forecast_cache_stats() -> Dict[str, Any]:
+    """
+    Get hit/miss/refresh counters for the forecast cache.
+    
+    Returns:
+        Dictionary with cache statistics
+    """
+    return _forecast_cache.stats()
+
+
+def clear_forecast_cache() -> None:
+    """Drop all cached forecasts and reset the counters."""
+    _forecast_cache.clear()
+
+
+def _lookup_cached_coordinates(location: str, cache_key: str) -> Optional[Tuple[float, float, str]]:
+    """Return cached coordinates, raise for a cached miss, or None if not cached."""
+    cached = _geocode_cache.get(cache_key)
+    if cached is _NOT_FOUND:
+        raise ValueError(f"Failed to geocode location: Location '{location}' not found")
+    return cached
+
+
+def _geocoding_params(cache_key: str) -> Dict[str, Any]:
+    """Build the geocoding API query for a normalized location."""
+    return {
+        "name": cache_key,
+        "count": 1,
+        "language": "en",
+        "format": "json"
+    }
+
+
+def _parse_geocoding_response(location: str, cache_key: str, data: Dict[str, Any]) -> Tuple[float, float, str]:
+    """Extract and cache coordinates from a geocoding API payload."""
+    if "results" in data and len(data["results"]) > 0:
+        result = data["results"][0]
+        if "latitude" not in result or "longitude" not in result:
+            raise ValueError(f"Failed to geocode location: No coordinates for '{location}'")
+        # Region and country are optional in geocoding results
+        place = (result.get("name", location), result.get("admin1"), result.get("country"))
+        coordinates = (
+            result["latitude"],
+            result["longitude"],
+            ", ".join(part for part in place if part)
+        )
+        _geocode_cache.set(cache_key, coordinates)
+        return coordinates
+    
+    _geocode_cache.set(cache_key, _NOT_FOUND, ttl=GEOCODE_NEGATIVE_TTL_SECONDS)
+    raise ValueError(f"Failed to geocode location: Location '{location}' not found")
+
+
+def _current_weather_params(lat: float, lon: float) -> Dict[str, Any]:
+    """Build the forecast API query for current conditions."""
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "current": CURRENT_VARIABLES,
+        "temperature_unit": "fahrenheit",
+        "wind_speed_unit": "mph",
+        "timezone": "auto"
+    }
+
+
+def _format_current_weather(
+    data: Dict[str, Any],
+    lat: float,
+    lon: float,
+    formatted_location: str
+) -> Dict[str, Any]:
+    """Shape a forecast API payload into the current weather result."""
+    current = data["current"]
+    
+    return {
+        "location": formatted_location,
+        "temperature": round(current["temperature_2m"]),
+        "unit": "fahrenheit",
+        "description": describe_weather_code(current.get("weather_code", 0)),
+        "humidity": current["relative_humidity_2m"],
+        "wind_speed": round(current["wind_speed_10m"]),
+        "feels_like": round(current["apparent_temperature"]),
+        "precipitation_probability": current["precipitation_probability"],
+        "timestamp": current["time"],
+        "coordinates": {"latitude": lat, "longitude": lon}
+    }
+
+
+def _forecast_params(lat: float, lon: float, days: int, unit: str = "fahrenheit") -> Dict[str, Any]:
+    """Build the forecast API query for daily data."""
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "daily": DAILY_VARIABLES,
+        "temperature_unit": unit,
+        "timezone": "auto",
+        "forecast_days": days
+    }
+
+
+def _multi_current_weather_params(coordinates: List[Tuple[float, float, str]]) -> Dict[str, Any]:
+    """Build one forecast API query for current conditions at several coordinates."""
+    params = _current_weather_params(0.0, 0.0)
+    params["latitude"] = ",".join(str(lat) for lat, _, _ in coordinates)
+    params["longitude"] = ",".join(str(lon) for _, lon, _ in coordinates)
+    return params
+
+
+def _split_multi_location_response(data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Open-Meteo returns a list for several coordinates and an object for one."""
+    return data if isinstance(data, list) else [data]
+
+
+def _format_locations_result(
+    locations: List[str],
+    geocoded: List[Union[Tuple[float, float, str], Exception]],
+    payloads: List[Dict[str, Any]]
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Combine per-location geocoding outcomes and forecast payloads.
+    
+    Returns:
+        Tuple of (tool result, successful current weather results to persist)
+    """
+    results = []
+    successes = []
+    remaining = iter(payloads)
+    for location, coordinates in zip(locations, geocoded):
+        if isinstance(coordinates, Exception):
+            results.append({
+                "error": f"Failed to fetch weather data: {str(coordinates)}",
+                "location": location
+            })
+            continue
+        lat, lon, formatted_location = coordinates
+        weather_result = _format_current_weather(next(remaining), lat, lon, formatted_location)
+        results.append(weather_result)
+        successes.append(weather_result)
+    
+    return {
+        "locations": results,
+        "count": len(results),
+        "unit": "fahrenheit"
+    }, successes
+
+
+def _combined_params(lat: float, lon: float, days: int) -> Dict[str, Any]:
+    """Build a single forecast API query for current conditions and daily data."""
+    params = _current_weather_params(lat, lon)
+    params.update({
+        "daily": DAILY_VARIABLES,
+        "forecast_days": days
+    })
+    return params
+
+
+def _fetch_forecast_daily(lat: float, lon: float, days: int, unit: str = "fahrenheit") -> Dict[str, Any]:
+    """Fetch the daily forecast block from the API, bypassing the cache."""
+    response = get_http_client().get(BASE_URL, params=_forecast_params(lat, lon, days, unit))
+    response.raise_for_status()
+    return response.json()["daily"]
+
+
+def _format_forecast(
+    data: Dict[str, Any],
+    lat: float,
+    lon: float,
+    formatted_location: str
+) -> Dict[str, Any]:
+    """Shape a daily forecast API payload into the forecast result."""
+    forecast_data = shape_daily_forecast(data["daily"])
+    
+    return {
+        "location": formatted_location,
+        "forecast": forecast_data,
+        "days": len(forecast_data),
+        "unit": "fahrenheit",
+        "coordinates": {"latitude": lat, "longitude": lon}
+    }
+
+
+def _persist_weather_result(weather_result: Dict[str, Any], data_type: str) -> None:
+    """Save a weather result to Firestore, logging rather than raising on failure."""
+    try:
+        doc_id = save_weather_data(weather_result, data_type)
+        if doc_id:
+            logger.info(f"Saved {data_type} weather data to Firestore: {doc_id}")
+    except Exception as e:
+        logger.error(f"Failed to save to Firestore: {e}")
+
 
 def get_coordinates(location: str) -> Tuple[float, float, str]:
     """
     Get coordinates for a location using Open-Meteo's geocoding API.
     
+    Results are cached per normalized location. Locations the geocoder
+    cannot find are cached for a shorter time; transport errors are not
+    cached.
+    
     Args:
         location: City name or location
         
     Returns:
         Tuple of (latitude, longitude, formatted_name)
     """
+    cache_key = normalize_location(location)
+    cached = _lookup_cached_coordinates(location, cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        response = requests.get(
-            GEOCODING_URL,
-            params={
-                "name": location,
-                "count": 1,
-                "language": "en",
-                "format": "json"
-            },
-            timeout=10
-        )
+        response = get_http_client().get(GEOCODING_URL, params=_geocoding_params(cache_key))
         response.raise_for_status()
         data = response.json()
-        
-        if "results" in data and len(data["results"]) > 0:
-            result = data["results"][0]
-            return (
-                result["latitude"],
-                result["longitude"],
-                f"{result['name']}, {result.get('admin1', '')}, {result['country']}"
-            )
-        else:
-            raise ValueError(f"Location '{location}' not found")
     except Exception as e:
         raise ValueError(f"Failed to geocode location: {str(e)}")
+    
+    return _parse_geocoding_response(location, cache_key, data)
 
 
 def get_current_weather(location: str) -> Dict[str, Any]:
@@ -78,80 +332,14 @@ def get_current_weather(location: str) -> Dict[str, Any]:
         lat, lon, formatted_location = get_coordinates(location)
         
         # Fetch weather data
-        response = requests.get(
-            BASE_URL,
-            params={
-                "latitude": lat,
-                "longitude": lon,
-                "current_weather": True,
-                "hourly": "temperature_2m,relative_humidity_2m,apparent_temperature,precipitation_probability,weather_code",
-                "temperature_unit": "fahrenheit",
-                "wind_speed_unit": "mph",
-                "timezone": "auto"
-            },
-            timeout=10
-        )
+        response = get_http_client().get(BASE_URL, params=_current_weather_params(lat, lon))
         response.raise_for_status()
         data = response.json()
         
-        current = data["current_weather"]
-        
-        # Get current hour's detailed data
-        current_time = datetime.fromisoformat(current["time"])
-        hourly_data = data["hourly"]
-        current_hour_index = 0
-        
-        # Map weather codes to descriptions
-        weather_descriptions = {
-            0: "Clear sky",
-            1: "Mainly clear",
-            2: "Partly cloudy",
-            3: "Overcast",
-            45: "Foggy",
-            48: "Depositing rime fog",
-            51: "Light drizzle",
-            53: "Moderate drizzle",
-            55: "Dense drizzle",
-            61: "Slight rain",
-            63: "Moderate rain",
-            65: "Heavy rain",
-            71: "Slight snow",
-            73: "Moderate snow",
-            75: "Heavy snow",
-            77: "Snow grains",
-            80: "Slight rain showers",
-            81: "Moderate rain showers",
-            82: "Violent rain showers",
-            85: "Slight snow showers",
-            86: "Heavy snow showers",
-            95: "Thunderstorm",
-            96: "Thunderstorm with slight hail",
-            99: "Thunderstorm with heavy hail"
-        }
-        
-        weather_code = current.get("weathercode", 0)
-        description = weather_descriptions.get(weather_code, "Unknown")
-        
-        weather_result = {
-            "location": formatted_location,
-            "temperature": round(current["temperature"]),
-            "unit": "fahrenheit",
-            "description": description,
-            "humidity": hourly_data["relative_humidity_2m"][current_hour_index],
-            "wind_speed": round(current["windspeed"]),
-            "feels_like": round(hourly_data["apparent_temperature"][current_hour_index]),
-            "precipitation_probability": hourly_data["precipitation_probability"][current_hour_index],
-            "timestamp": current["time"],
-            "coordinates": {"latitude": lat, "longitude": lon}
-        }
+        weather_result = _format_current_weather(data, lat, lon, formatted_location)
         
         # Save to Firestore
-        try:
-            doc_id = save_weather_data(weather_result, "current")
-            if doc_id:
-                logger.info(f"Saved current weather data to Firestore: {doc_id}")
-        except Exception as e:
-            logger.error(f"Failed to save to Firestore: {e}")
+        _persist_weather_result(weather_result, "current")
         
         return weather_result
     except Exception as e:
@@ -173,92 +361,145 @@ def get_weather_forecast(location: str, days: int = 5) -> Dict[str, Any]:
         Dictionary containing forecast information
     """
     try:
-        # Limit days to 7 (API maximum)
-        days = min(days, 7)
+        # Keep days within 1-7 (7 is the API maximum)
+        days = max(1, min(days, 7))
         
         # Get coordinates for the location
         lat, lon, formatted_location = get_coordinates(location)
         
-        # Fetch forecast data
-        response = requests.get(
-            BASE_URL,
-            params={
-                "latitude": lat,
-                "longitude": lon,
-                "daily": "weather_code,temperature_2m_max,temperature_2m_min,precipitation_sum,precipitation_probability_max",
-                "temperature_unit": "fahrenheit",
-                "timezone": "auto",
-                "forecast_days": days
-            },
-            timeout=10
+        # Fetch forecast data (served from the grid-cell cache when possible)
+        daily = _forecast_cache.get(
+            lat, lon, days, "fahrenheit",
+            lambda fetch_days: _fetch_forecast_daily(lat, lon, fetch_days)
         )
+        
+        forecast_result = _format_forecast({"daily": daily}, lat, lon, formatted_location)
+        
+        # Save to Firestore
+        _persist_weather_result(forecast_result, "forecast")
+        
+        return forecast_result
+    except Exception as e:
+        return {
+            "error": f"Failed to fetch forecast data: {str(e)}",
+            "location": location
+        }
+
+
+def _format_weather_overview(
+    current_result: Dict[str, Any],
+    forecast_result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Merge current conditions and a forecast into one tool result."""
+    current = {
+        key: value for key, value in current_result.items()
+        if key not in ("location", "unit", "coordinates")
+    }
+    return {
+        "location": current_result["location"],
+        "current": current,
+        "forecast": forecast_result["forecast"],
+        "days": forecast_result["days"],
+        "unit": current_result["unit"],
+        "coordinates": current_result["coordinates"]
+    }
+
+
+def get_current_weather_and_forecast(location: str, days: int = 5) -> Dict[str, Any]:
+    """
+    Get current weather and a daily forecast for a location in one API call.
+    
+    Use this when the user wants both current conditions and the outlook
+    (e.g. "weather now and this week").
+    
+    Args:
+        location: City name or location
+        days: Number of days to forecast (1-7)
+        
+    Returns:
+        Dictionary containing current conditions and forecast information
+    """
+    try:
+        # Keep days within 1-7 (7 is the API maximum)
+        days = max(1, min(days, 7))
+        
+        # Get coordinates for the location
+        lat, lon, formatted_location = get_coordinates(location)
+        
+        # Fetch current and daily data together; the longer daily block
+        # also seeds the forecast cache
+        fetch_days = max(days, _forecast_cache.fetch_days)
+        response = get_http_client().get(BASE_URL, params=_combined_params(lat, lon, fetch_days))
         response.raise_for_status()
         data = response.json()
+        _forecast_cache.put(lat, lon, fetch_days, "fahrenheit", data["daily"])
+        
+        daily = {name: values[:days] for name, values in data["daily"].items()}
+        current_result = _format_current_weather(data, lat, lon, formatted_location)
+        forecast_result = _format_forecast({"daily": daily}, lat, lon, formatted_location)
+        
+        # Save to Firestore
+        _persist_weather_result(current_result, "current")
+        _persist_weather_result(forecast_result, "forecast")
         
-        # Map weather codes to descriptions
-        weather_descriptions = {
-            0: "Clear sky",
-            1: "Mainly clear", 
-            2: "Partly cloudy",
-            3: "Overcast",
-            45: "Foggy",
-            48: "Depositing rime fog",
-            51: "Light drizzle",
-            53: "Moderate drizzle",
-            55: "Dense drizzle",
-            61: "Slight rain",
-            63: "Moderate rain",
-            65: "Heavy rain",
-            71: "Slight snow",
-            73: "Moderate snow",
-            75: "Heavy snow",
-            77: "Snow grains",
-            80: "Slight rain showers",
-            81: "Moderate rain showers",
-            82: "Violent rain showers",
-            85: "Slight snow showers",
-            86: "Heavy snow showers",
-            95: "Thunderstorm",
-            96: "Thunderstorm with slight hail",
-            99: "Thunderstorm with heavy hail"
+        return _format_weather_overview(current_result, forecast_result)
+    except Exception as e:
+        return {
+            "error": f"Failed to fetch weather data: {str(e)}",
+            "location": location
         }
+
+
+def _try_get_coordinates(location: str) -> Union[Tuple[float, float, str], Exception]:
+    """Geocode a location, returning the exception instead of raising it."""
+    try:
+        return get_coordinates(location)
+    except Exception as e:
+        return e
+
+
+def get_weather_for_locations(locations: List[str]) -> Dict[str, Any]:
+    """
+    Get current weather for several locations at once using Open-Meteo API.
+    
+    Use this instead of calling get_current_weather repeatedly when the user
+    asks about more than one place.
+    
+    Args:
+        locations: City names or locations (e.g., ["London", "Paris", "Tokyo"])
         
-        # Format forecast data
-        daily_data = data["daily"]
-        forecast_data = []
+    Returns:
+        Dictionary with one current weather result (or error) per location,
+        in the order requested
+    """
+    try:
+        # Limit the batch size
+        locations = list(locations)[:WEATHER_BATCH_MAX_LOCATIONS]
+        if not locations:
+            return {"locations": [], "count": 0, "unit": "fahrenheit"}
         
-        for i in range(len(daily_data["time"])):
-            weather_code = daily_data["weather_code"][i]
-            description = weather_descriptions.get(weather_code, "Unknown")
-            
-            forecast_data.append({
-                "date": daily_data["time"][i],
-                "temperature_high": round(daily_data["temperature_2m_max"][i]),
-                "temperature_low": round(daily_data["temperature_2m_min"][i]),
-                "description": description,
-                "precipitation_chance": daily_data["precipitation_probability_max"][i],
-                "precipitation_amount": daily_data["precipitation_sum"][i]
-            })
+        # Geocode all locations concurrently
+        workers = min(WEATHER_BATCH_MAX_WORKERS, len(locations))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            geocoded = list(pool.map(_try_get_coordinates, locations))
         
-        forecast_result = {
-            "location": formatted_location,
-            "forecast": forecast_data,
-            "days": len(forecast_data),
-            "unit": "fahrenheit",
-            "coordinates": {"latitude": lat, "longitude": lon}
-        }
+        # Fetch current conditions for every resolved location in one request
+        resolved = [coordinates for coordinates in geocoded if not isinstance(coordinates, Exception)]
+        payloads = []
+        if resolved:
+            response = get_http_client().get(BASE_URL, params=_multi_current_weather_params(resolved))
+            response.raise_for_status()
+            payloads = _split_multi_location_response(response.json())
+        
+        result, successes = _format_locations_result(locations, geocoded, payloads)
         
         # Save to Firestore
-        try:
-            doc_id = save_weather_data(forecast_result, "forecast")
-            if doc_id:
-                logger.info(f"Saved forecast data to Firestore: {doc_id}")
-        except Exception as e:
-            logger.error(f"Failed to save to Firestore: {e}")
+        for weather_result in successes:
+            _persist_weather_result(weather_result, "current")
         
-        return forecast_result
+        return result
     except Exception as e:
         return {
-            "error": f"Failed to fetch forecast data: {str(e)}",
-            "location": location
-        }
\ No newline at end of file
+            "error": f"Failed to fetch weather data: {str(e)}",
+            "locations": locations
+        }
@@ -0,0 +1,244 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Async weather tools that await upstream I/O instead of blocking the event loop."""
+
+import asyncio
+from typing import Dict, Any, List, Tuple, Union
+import logging
+
+from . import weather
+from .http_client import get_async_http_client
+from ..config import WEATHER_BATCH_MAX_LOCATIONS, WEATHER_BATCH_MAX_WORKERS
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+async def get_coordinates(location: str) -> Tuple[float, float, str]:
+    """
+    Get coordinates for a location using Open-Meteo's geocoding API.
+    
+    Shares the geocoding cache with the synchronous tools.
+    
+    Args:
+        location: City name or location
+        
+    Returns:
+        Tuple of (latitude, longitude, formatted_name)
+    """
+    cache_key = weather.normalize_location(location)
+    cached = weather._lookup_cached_coordinates(location, cache_key)
+    if cached is not None:
+        return cached
+    
+    try:
+        response = await get_async_http_client().get(
+            weather.GEOCODING_URL,
+            params=weather._geocoding_params(cache_key)
+        )
+        response.raise_for_status()
+        data = response.json()
+    except Exception as e:
+        raise ValueError(f"Failed to geocode location: {str(e)}")
+    
+    return weather._parse_geocoding_response(location, cache_key, data)
+
+
+async def _fetch_forecast_daily(lat: float, lon: float, days: int, unit: str = "fahrenheit") -> Dict[str, Any]:
+    """Fetch the daily forecast block from the API, bypassing the cache."""
+    response = await get_async_http_client().get(
+        weather.BASE_URL,
+        params=weather._forecast_params(lat, lon, days, unit)
+    )
+    response.raise_for_status()
+    return response.json()["daily"]
+
+
+async def get_current_weather(location: str) -> Dict[str, Any]:
+    """
+    Get current weather for a given location using Open-Meteo API.
+    
+    Args:
+        location: City name or location (e.g., "New York", "London", "Tokyo")
+        
+    Returns:
+        Dictionary containing weather information
+    """
+    try:
+        # Get coordinates for the location
+        lat, lon, formatted_location = await get_coordinates(location)
+        
+        # Fetch weather data
+        response = await get_async_http_client().get(
+            weather.BASE_URL,
+            params=weather._current_weather_params(lat, lon)
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        weather_result = weather._format_current_weather(data, lat, lon, formatted_location)
+        
+        # Save to Firestore off the event loop
+        await asyncio.to_thread(weather._persist_weather_result, weather_result, "current")
+        
+        return weather_result
+    except Exception as e:
+        return {
+            "error": f"Failed to fetch weather data: {str(e)}",
+            "location": location
+        }
+
+
+async def get_weather_forecast(location: str, days: int = 5) -> Dict[str, Any]:
+    """
+    Get weather forecast for a given location using Open-Meteo API.
+    
+    Args:
+        location: City name or location
+        days: Number of days to forecast (1-7)
+        
+    Returns:
+        Dictionary containing forecast information
+    """
+    try:
+        # Keep days within 1-7 (7 is the API maximum)
+        days = max(1, min(days, 7))
+        
+        # Get coordinates for the location
+        lat, lon, formatted_location = await get_coordinates(location)
+        
+        # Fetch forecast data (served from the grid-cell cache when possible)
+        daily = await weather._forecast_cache.aget(
+            lat, lon, days, "fahrenheit",
+            lambda fetch_days: _fetch_forecast_daily(lat, lon, fetch_days)
+        )
+        
+        forecast_result = weather._format_forecast({"daily": daily}, lat, lon, formatted_location)
+        
+        # Save to Firestore off the event loop
+        await asyncio.to_thread(weather._persist_weather_result, forecast_result, "forecast")
+        
+        return forecast_result
+    except Exception as e:
+        return {
+            "error": f"Failed to fetch forecast data: {str(e)}",
+            "location": location
+        }
+
+
+async def get_current_weather_and_forecast(location: str, days: int = 5) -> Dict[str, Any]:
+    """
+    Get current weather and a daily forecast for a location in one API call.
+    
+    Use this when the user wants both current conditions and the outlook
+    (e.g. "weather now and this week").
+    
+    Args:
+        location: City name or location
+        days: Number of days to forecast (1-7)
+        
+    Returns:
+        Dictionary containing current conditions and forecast information
+    """
+    try:
+        # Keep days within 1-7 (7 is the API maximum)
+        days = max(1, min(days, 7))
+        
+        # Get coordinates for the location
+        lat, lon, formatted_location = await get_coordinates(location)
+        
+        # Fetch current and daily data together; the longer daily block
+        # also seeds the forecast cache
+        fetch_days = max(days, weather._forecast_cache.fetch_days)
+        response = await get_async_http_client().get(
+            weather.BASE_URL,
+            params=weather._combined_params(lat, lon, fetch_days)
+        )
+        response.raise_for_status()
+        data = response.json()
+        weather._forecast_cache.put(lat, lon, fetch_days, "fahrenheit", data["daily"])
+        
+        daily = {name: values[:days] for name, values in data["daily"].items()}
+        current_result = weather._format_current_weather(data, lat, lon, formatted_location)
+        forecast_result = weather._format_forecast({"daily": daily}, lat, lon, formatted_location)
+        
+        # Save to Firestore off the event loop
+        await asyncio.to_thread(weather._persist_weather_result, current_result, "current")
+        await asyncio.to_thread(weather._persist_weather_result, forecast_result, "forecast")
+        
+        return weather._format_weather_overview(current_result, forecast_result)
+    except Exception as e:
+        return {
+            "error": f"Failed to fetch weather data: {str(e)}",
+            "location": location
+        }
+
+
+async def get_weather_for_locations(locations: List[str]) -> Dict[str, Any]:
+    """
+    Get current weather for several locations at once using Open-Meteo API.
+    
+    Use this instead of calling get_current_weather repeatedly when the user
+    asks about more than one place.
+    
+    Args:
+        locations: City names or locations (e.g., ["London", "Paris", "Tokyo"])
+        
+    Returns:
+        Dictionary with one current weather result (or error) per location,
+        in the order requested
+    """
+    try:
+        # Limit the batch size
+        locations = list(locations)[:WEATHER_BATCH_MAX_LOCATIONS]
+        if not locations:
+            return {"locations": [], "count": 0, "unit": "fahrenheit"}
+        
+        # Geocode all locations concurrently, bounded by the worker limit
+        semaphore = asyncio.Semaphore(WEATHER_BATCH_MAX_WORKERS)
+        
+        async def geocode(location: str) -> Union[Tuple[float, float, str], Exception]:
+            async with semaphore:
+                try:
+                    return await get_coordinates(location)
+                except Exception as e:
+                    return e
+        
+        geocoded = await asyncio.gather(*(geocode(location) for location in locations))
+        
+        # Fetch current conditions for every resolved location in one request
+        resolved = [coordinates for coordinates in geocoded if not isinstance(coordinates, Exception)]
+        payloads = []
+        if resolved:
+            response = await get_async_http_client().get(
+                weather.BASE_URL,
+                params=weather._multi_current_weather_params(resolved)
+            )
+            response.raise_for_status()
+            payloads = weather._split_multi_location_response(response.json())
+        
+        result, successes = weather._format_locations_result(locations, geocoded, payloads)
+        
+        # Save to Firestore off the event loop
+        for weather_result in successes:
+            await asyncio.to_thread(weather._persist_weather_result, weather_result, "current")
+        
+        return result
+    except Exception as e:
+        return {
+            "error": f"Failed to fetch weather data: {str(e)}",
+            "locations": locations
+        }
@@ -0,0 +1,94 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Precomputed weather-code table and single-pass shaping of Open-Meteo data."""
+
+from typing import Any, Dict, List
+
+# WMO weather interpretation codes used by Open-Meteo
+WEATHER_CODE_DESCRIPTIONS = {
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Foggy",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    71: "Slight snow",
+    73: "Moderate snow",
+    75: "Heavy snow",
+    77: "Snow grains",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail"
+}
+
+UNKNOWN_DESCRIPTION = "Unknown"
+
+def describe_weather_code(code: Any) -> str:
+    """
+    Get the description for a WMO weather code.
+    
+    Args:
+        code: Weather code from the API
+        
+    Returns:
+        Human-readable description, or "Unknown"
+    """
+    return WEATHER_CODE_DESCRIPTIONS.get(code, UNKNOWN_DESCRIPTION)
+
+
+def shape_daily_forecast(daily: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Turn Open-Meteo daily arrays into per-day forecast entries.
+    
+    The columns are zipped and walked once, so each day costs one tuple
+    unpack and one dict literal instead of six list indexings.
+    
+    Args:
+        daily: The API "daily" block
+        
+    Returns:
+        List of forecast days
+    """
+    lookup = WEATHER_CODE_DESCRIPTIONS.get
+    return [
+        {
+            "date": date,
+            "temperature_high": round(high),
+            "temperature_low": round(low),
+            "description": lookup(code, UNKNOWN_DESCRIPTION),
+            "precipitation_chance": chance,
+            "precipitation_amount": amount
+        }
+        for date, high, low, code, chance, amount in zip(
+            daily["time"],
+            daily["temperature_2m_max"],
+            daily["temperature_2m_min"],
+            daily["weather_code"],
+            daily["precipitation_probability_max"],
+            daily["precipitation_sum"]
+        )
+    ]
@@ -0,0 +1,396 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Pluggable storage for weather observations, selected by configuration."""
+
+import abc
+import base64
+import binascii
+import hashlib
+import itertools
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..config import WEATHER_HISTORY_PAGE_SIZE, WEATHER_SQLITE_PATH, WEATHER_STORAGE_BACKEND
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+def build_weather_document(weather_data: Dict[str, Any], data_type: str) -> Dict[str, Any]:
+    """
+    Map a weather tool result to the stored record fields.
+    
+    The storage timestamp is added by each backend.
+    
+    Args:
+        weather_data: Weather data from the API
+        data_type: Type of data - "current" or "forecast"
+    
+    Returns:
+        Dictionary of fields to store
+    """
+    doc_data = {
+        "location": weather_data.get("location", "Unknown"),
+        "coordinates": weather_data.get("coordinates", {}),
+        "data_type": data_type,
+    }
+    
+    if data_type == "current":
+        # Add current weather specific fields
+        doc_data.update({
+            "temperature": weather_data.get("temperature"),
+            "temperature_unit": weather_data.get("unit", "fahrenheit"),
+            "description": weather_data.get("description"),
+            "humidity": weather_data.get("humidity"),
+            "wind_speed": weather_data.get("wind_speed"),
+            "feels_like": weather_data.get("feels_like"),
+            "precipitation_probability": weather_data.get("precipitation_probability"),
+            "api_timestamp": weather_data.get("timestamp")
+        })
+    else:
+        # Add forecast specific fields
+        doc_data.update({
+            "forecast_days": weather_data.get("days"),
+            "temperature_unit": weather_data.get("unit", "fahrenheit"),
+            "forecasts": weather_data.get("forecast", [])
+        })
+    
+    return doc_data
+
+
+def observation_document_id(doc_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Derive a deterministic ID for a current observation.
+    
+    Open-Meteo refreshes current conditions on a fixed interval, so every
+    request for the same place within one interval returns the same
+    api_timestamp. Keying on (location, api_timestamp) makes those repeats
+    map to one record.
+    
+    Args:
+        doc_data: Document built by build_weather_document
+    
+    Returns:
+        Hex ID, or None if the observation has no API timestamp
+    """
+    if doc_data.get("data_type") != "current" or not doc_data.get("api_timestamp"):
+        return None
+    key = f"{doc_data['location']}|{doc_data['api_timestamp']}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+def encode_history_cursor(position: str, doc_id: str) -> str:
+    """
+    Build an opaque history cursor from the last record of a page.
+    
+    Args:
+        position: The record's sort timestamp, serialized by the backend
+        doc_id: The record's ID, which breaks ties between equal timestamps
+    
+    Returns:
+        URL-safe cursor token
+    """
+    raw = json.dumps([position, doc_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_history_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Split a history cursor into (position, doc_id).
+    
+    Raises:
+        ValueError: If the cursor was not produced by encode_history_cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position, doc_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError(f"Invalid history cursor: {cursor!r}")
+    return str(position), str(doc_id)
+
+
+def iter_history_pages(
+    get_page: Callable[[Optional[str]], Dict[str, Any]],
+    cursor: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield records page by page until the history (or a page fetch) ends.
+    
+    Pages are only fetched as the caller consumes records.
+    
+    Args:
+        get_page: Called with a cursor; returns a history page
+        cursor: Cursor to resume from
+    
+    Yields:
+        History records, newest first
+    """
+    while True:
+        page = get_page(cursor)
+        yield from page["records"]
+        cursor = page.get("next_cursor")
+        if not cursor:
+            return
+
+
+class WeatherStorageBackend(abc.ABC):
+    """Interface implemented by every weather storage backend."""
+    
+    name = "base"
+    
+    @abc.abstractmethod
+    def save(self, weather_data: Dict[str, Any], data_type: str = "current") -> Optional[str]:
+        """Store a weather result; returns the record ID or None on failure."""
+    
+    @abc.abstractmethod
+    def get_history_page(
+        self,
+        location: str,
+        hours: int = 24,
+        page_size: int = WEATHER_HISTORY_PAGE_SIZE,
+        fields: Optional[List[str]] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Return one page of current-weather records for a location, newest first.
+        
+        The result has "records" and "next_cursor" (None on the last page),
+        plus "error" if the page could not be read. Records always include
+        "timestamp" and "doc_id"; `fields` limits the other fields returned.
+        """
+    
+    def iter_history(
+        self,
+        location: str,
+        hours: int = 24,
+        page_size: int = WEATHER_HISTORY_PAGE_SIZE,
+        fields: Optional[List[str]] = None,
+        cursor: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield current-weather records for a location, fetching pages lazily."""
+        return iter_history_pages(
+            lambda page_cursor: self.get_history_page(location, hours, page_size, fields, page_cursor),
+            cursor
+        )
+    
+    def get_recent(self, location: str, hours: int = 24) -> List[Dict[str, Any]]:
+        """Return the most recent current-weather records for a location."""
+        return list(itertools.islice(self.iter_history(location, hours, page_size=10), 10))
+    
+    @abc.abstractmethod
+    def get_statistics(self, location: str, days: int = 7) -> Dict[str, Any]:
+        """Return temperature, humidity and condition statistics for a location."""
+    
+    @abc.abstractmethod
+    def cleanup(self, days_to_keep: int = 30, dry_run: bool = False) -> Dict[str, Any]:
+        """Delete (or count) records older than the retention period; returns a report."""
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for buffered writes; backends without buffering return at once."""
+        return True
+    
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+
+def create_weather_backend(name: str = WEATHER_STORAGE_BACKEND) -> WeatherStorageBackend:
+    """
+    Build a storage backend by name.
+    
+    Backend modules are imported on demand so the SQLite backend works
+    without cloud libraries or credentials.
+    
+    Args:
+        name: "firestore" or "sqlite"
+    
+    Returns:
+        WeatherStorageBackend: New backend instance
+    """
+    if name == "firestore":
+        from .weather_store import FirestoreWeatherBackend
+        return FirestoreWeatherBackend()
+    if name == "sqlite":
+        from .sqlite_store import SQLiteWeatherBackend
+        return SQLiteWeatherBackend(WEATHER_SQLITE_PATH)
+    raise ValueError(f"Unknown weather storage backend: {name}")
+
+
+# Configured backend, created on first use
+_weather_backend = None
+_weather_backend_lock = threading.Lock()
+
+
+def get_weather_backend() -> WeatherStorageBackend:
+    """
+    Get or create the configured weather storage backend.
+    
+    Returns:
+        WeatherStorageBackend: Shared backend instance
+    """
+    global _weather_backend
+    
+    if _weather_backend is None:
+        with _weather_backend_lock:
+            if _weather_backend is None:
+                _weather_backend = create_weather_backend()
+                logger.info(f"Weather storage backend initialized: {_weather_backend.name}")
+    
+    return _weather_backend
+
+
+def set_weather_backend(backend: Optional[WeatherStorageBackend]) -> None:
+    """
+    Replace the weather storage backend, e.g. for tests or benchmarks.
+    
+    Args:
+        backend: Backend to install, or None to rebuild the configured one lazily
+    """
+    global _weather_backend
+    
+    with _weather_backend_lock:
+        _weather_backend = backend
+
+
+def save_weather_data(weather_data: Dict[str, Any], data_type: str = "current") -> Optional[str]:
+    """
+    Save weather data with the configured backend.
+    
+    Args:
+        weather_data: Weather data from the API
+        data_type: Type of data - "current" or "forecast"
+    
+    Returns:
+        Optional[str]: Record ID if successful, None if failed
+    """
+    return get_weather_backend().save(weather_data, data_type)
+
+
+def get_recent_weather(location: str, hours: int = 24) -> List[Dict[str, Any]]:
+    """
+    Retrieve recent weather data for a location.
+    
+    Args:
+        location: Location name
+        hours: Number of hours to look back (default 24)
+    
+    Returns:
+        List of weather records
+    """
+    return get_weather_backend().get_recent(location, hours)
+
+
+def get_weather_history_page(
+    location: str,
+    hours: int = 24,
+    page_size: int = WEATHER_HISTORY_PAGE_SIZE,
+    fields: Optional[List[str]] = None,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get one page of weather history for a location, newest first.
+    
+    Args:
+        location: Location name
+        hours: Number of hours to look back
+        page_size: Maximum records in the page
+        fields: Fields to return (timestamp and doc_id are always included)
+        cursor: next_cursor from the previous page
+    
+    Returns:
+        Dictionary with "records" and "next_cursor"
+    """
+    return get_weather_backend().get_history_page(location, hours, page_size, fields, cursor)
+
+
+def iter_weather_history(
+    location: str,
+    hours: int = 24,
+    page_size: int = WEATHER_HISTORY_PAGE_SIZE,
+    fields: Optional[List[str]] = None,
+    cursor: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over weather history for a location, newest first.
+    
+    Args:
+        location: Location name
+        hours: Number of hours to look back
+        page_size: Records fetched per page
+        fields: Fields to return (timestamp and doc_id are always included)
+        cursor: Cursor to resume from
+    
+    Returns:
+        Generator of weather records
+    """
+    return get_weather_backend().iter_history(location, hours, page_size, fields, cursor)
+
+
+def get_weather_statistics(location: str, days: int = 7) -> Dict[str, Any]:
+    """
+    Get weather statistics for a location over the specified days.
+    
+    Args:
+        location: Location name
+        days: Number of days to analyze
+    
+    Returns:
+        Dictionary with statistics
+    """
+    return get_weather_backend().get_statistics(location, days)
+
+
+def run_cleanup(days_to_keep: int = 30, dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Delete (or count) weather data older than specified days.
+    
+    Args:
+        days_to_keep: Number of days of data to keep
+        dry_run: Only count what would be deleted
+    
+    Returns:
+        Cleanup report from the backend
+    """
+    return get_weather_backend().cleanup(days_to_keep, dry_run)
+
+
+def cleanup_old_data(days_to_keep: int = 30) -> int:
+    """
+    Clean up weather data older than specified days.
+    
+    Args:
+        days_to_keep: Number of days of data to keep
+    
+    Returns:
+        Number of documents deleted
+    """
+    return run_cleanup(days_to_keep).get("deleted", 0)
+
+
+def flush_weather_writes(timeout: Optional[float] = None) -> bool:
+    """
+    Wait until buffered weather writes have been stored.
+    
+    Args:
+        timeout: Maximum seconds to wait
+    
+    Returns:
+        bool: True if everything was flushed within the timeout
+    """
+    if _weather_backend is None:
+        return True
+    return _weather_backend.flush(timeout)
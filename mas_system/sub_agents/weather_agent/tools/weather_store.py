@@ -14,10 +14,34 @@
 
 from google.cloud import firestore
 from google.cloud.firestore import SERVER_TIMESTAMP
-from typing import Dict, Any, Optional, List
+from google.cloud.firestore_v1.field_path import FieldPath
+from typing import Dict, Any, Iterator, Optional, List, Tuple
+import itertools
 import logging
 import os
-from datetime import datetime, timedelta
+import secrets
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from .cache import TTLCache
+from .weather_storage import (
+    WeatherStorageBackend,
+    build_weather_document,
+    decode_history_cursor,
+    encode_history_cursor,
+    iter_history_pages,
+    observation_document_id,
+)
+from .write_behind import WriteBehindQueue
+from ..config import (
+    WEATHER_CLEANUP_PAGE_SIZE,
+    WEATHER_DEDUP_CACHE_SIZE,
+    WEATHER_DEDUP_ENABLED,
+    WEATHER_DEDUP_TTL_SECONDS,
+    WEATHER_HISTORY_PAGE_SIZE,
+    WEATHER_WRITE_BEHIND_ENABLED,
+)
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -25,6 +49,22 @@ logger = logging.getLogger(__name__)
 # Initialize Firestore client once
 _firestore_client = None
 
+# Write-behind queue for weather records, created on first save
+_write_queue = None
+
+# Per-location, per-day statistics maintained at write time
+ROLLUP_COLLECTION = "weather_daily_rollups"
+
+# Firestore's limit on operations in a single batch write
+MAX_BATCH_OPERATIONS = 500
+
+# Deterministic IDs of observations this process has already saved
+_saved_observations = TTLCache(maxsize=WEATHER_DEDUP_CACHE_SIZE, ttl=WEATHER_DEDUP_TTL_SECONDS)
+
+# Same alphabet and length as Firestore auto-generated document IDs
+_DOCUMENT_ID_ALPHABET = string.ascii_letters + string.digits
+_DOCUMENT_ID_LENGTH = 20
+
 def get_firestore_client() -> firestore.Client:
     """
     Get or create a Firestore client instance.
@@ -46,10 +86,188 @@ def get_firestore_client() -> firestore.Client:
     return _firestore_client
 
 
+def _generate_document_id() -> str:
+    """Generate a Firestore-style document ID without a round-trip."""
+    return "".join(secrets.choice(_DOCUMENT_ID_ALPHABET) for _ in range(_DOCUMENT_ID_LENGTH))
+
+
+def _rollup_document_id(location: str, day: date) -> str:
+    """Build the rollup document ID for a location and UTC day."""
+    return f"{location.replace('/', '_')}_{day.isoformat()}"
+
+
+def _rollup_update(doc_data: Dict[str, Any], day: date) -> Dict[str, Any]:
+    """
+    Build the merge update that folds one current observation into its daily rollup.
+    
+    Args:
+        doc_data: Current weather document data
+        day: UTC day the observation belongs to
+    
+    Returns:
+        Dictionary of field transforms for set(..., merge=True)
+    """
+    update = {
+        "location": doc_data["location"],
+        "date": day.isoformat(),
+    }
+    
+    temperature = doc_data.get("temperature")
+    if temperature is not None:
+        update.update({
+            "count": firestore.Increment(1),
+            "temperature_sum": firestore.Increment(temperature),
+            "temperature_min": firestore.Minimum(temperature),
+            "temperature_max": firestore.Maximum(temperature),
+        })
+    
+    humidity = doc_data.get("humidity")
+    if humidity is not None:
+        update.update({
+            "humidity_sum": firestore.Increment(humidity),
+            "humidity_count": firestore.Increment(1),
+        })
+    
+    if "description" in doc_data:
+        update["conditions"] = {str(doc_data["description"]): firestore.Increment(1)}
+    
+    return update
+
+
+def _drop_existing_observations(
+    client: firestore.Client,
+    records: List[Tuple[str, str, Dict[str, Any]]]
+) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Remove current observations that are repeated in the batch or already stored.
+    
+    Observations with deterministic IDs are checked with a single get_all,
+    so a duplicate costs one document read instead of two writes, and
+    never updates the daily rollup a second time.
+    """
+    unique = {}
+    for record in records:
+        collection_name, doc_id, _ = record
+        unique.setdefault((collection_name, doc_id), record)
+    
+    candidates = [
+        client.collection(collection_name).document(doc_id)
+        for (collection_name, doc_id), (_, _, doc_data) in unique.items()
+        if collection_name == "weather_current" and doc_id == observation_document_id(doc_data)
+    ]
+    if not candidates:
+        return list(unique.values())
+    
+    existing = {snapshot.id for snapshot in client.get_all(candidates) if snapshot.exists}
+    return [
+        record for (collection_name, doc_id), record in unique.items()
+        if not (collection_name == "weather_current" and doc_id in existing)
+    ]
+
+
+def _write_weather_batch(records: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+    """
+    Commit weather records in Firestore batch writes.
+    
+    Each current observation is written together with the update to its
+    daily rollup, so a record may take two of a batch's operations.
+    Observations that are already stored are skipped when deduplication
+    is enabled.
+    
+    Args:
+        records: (collection name, document ID, document data) tuples
+    """
+    client = get_firestore_client()
+    today = datetime.utcnow().date()
+    
+    if WEATHER_DEDUP_ENABLED:
+        submitted = len(records)
+        records = _drop_existing_observations(client, records)
+        if len(records) < submitted:
+            logger.info(f"Skipped {submitted - len(records)} duplicate weather observations")
+    
+    batch = client.batch()
+    operations = 0
+    pending = []
+    try:
+        for collection_name, doc_id, doc_data in records:
+            record_operations = 2 if collection_name == "weather_current" else 1
+            if operations + record_operations > MAX_BATCH_OPERATIONS:
+                batch.commit()
+                batch = client.batch()
+                operations = 0
+                pending = []
+            
+            batch.set(client.collection(collection_name).document(doc_id), doc_data)
+            if collection_name == "weather_current":
+                rollup_ref = client.collection(ROLLUP_COLLECTION).document(
+                    _rollup_document_id(doc_data["location"], today)
+                )
+                batch.set(rollup_ref, _rollup_update(doc_data, today), merge=True)
+            operations += record_operations
+            pending.append(doc_id)
+        
+        if operations:
+            batch.commit()
+            logger.info(f"Committed {len(records)} weather records")
+    except Exception:
+        # Let later saves of the uncommitted observations through again
+        for doc_id in pending:
+            _saved_observations.discard(doc_id)
+        raise
+
+
+def get_write_queue() -> WriteBehindQueue:
+    """
+    Get or create the write-behind queue for weather records.
+    
+    Returns:
+        WriteBehindQueue: Queue flushing to Firestore in batch writes
+    """
+    global _write_queue
+    
+    if _write_queue is None:
+        _write_queue = WriteBehindQueue(_write_weather_batch)
+    
+    return _write_queue
+
+
+def set_write_queue(write_queue: Optional[WriteBehindQueue]) -> None:
+    """
+    Replace the write-behind queue, e.g. with one writing to a fake store.
+    
+    Args:
+        write_queue: Queue to install, or None to rebuild the default lazily
+    """
+    global _write_queue
+    
+    _write_queue = write_queue
+
+
+def flush_weather_writes(timeout: Optional[float] = None) -> bool:
+    """
+    Wait until all buffered weather records have been written.
+    
+    Args:
+        timeout: Maximum seconds to wait
+    
+    Returns:
+        bool: True if everything was flushed within the timeout
+    """
+    if _write_queue is None:
+        return True
+    return _write_queue.flush(timeout)
+
+
 def save_weather_data(weather_data: Dict[str, Any], data_type: str = "current") -> Optional[str]:
     """
     Save weather data to Firestore.
     
+    With write-behind enabled the record is buffered and committed later in
+    a batch write; the returned ID is the ID the document will have.
+    Current observations already saved for the same location and API
+    timestamp are not written again; their existing ID is returned.
+    
     Args:
         weather_data: Weather data from the API
         data_type: Type of data - "current" or "forecast"
@@ -63,42 +281,33 @@ def save_weather_data(weather_data: Dict[str, Any], data_type: str = "current")
             logger.warning(f"Skipping save due to error: {weather_data['error']}")
             return None
         
-        client = get_firestore_client()
-        
         # Create collection name based on data type
         collection_name = "weather_current" if data_type == "current" else "weather_forecasts"
         
         # Prepare document data
-        doc_data = {
-            "location": weather_data.get("location", "Unknown"),
-            "coordinates": weather_data.get("coordinates", {}),
-            "timestamp": SERVER_TIMESTAMP,
-            "data_type": data_type,
-        }
+        doc_data = build_weather_document(weather_data, data_type)
+        doc_data["timestamp"] = SERVER_TIMESTAMP
         
-        if data_type == "current":
-            # Add current weather specific fields
-            doc_data.update({
-                "temperature": weather_data.get("temperature"),
-                "temperature_unit": weather_data.get("unit", "fahrenheit"),
-                "description": weather_data.get("description"),
-                "humidity": weather_data.get("humidity"),
-                "wind_speed": weather_data.get("wind_speed"),
-                "feels_like": weather_data.get("feels_like"),
-                "precipitation_probability": weather_data.get("precipitation_probability"),
-                "api_timestamp": weather_data.get("timestamp")
-            })
-        else:
-            # Add forecast specific fields
-            doc_data.update({
-                "forecast_days": weather_data.get("days"),
-                "temperature_unit": weather_data.get("unit", "fahrenheit"),
-                "forecasts": weather_data.get("forecast", [])
-            })
+        # Repeated observations map to one deterministic document ID
+        observation_id = observation_document_id(doc_data) if WEATHER_DEDUP_ENABLED else None
+        if observation_id is not None and _saved_observations.get(observation_id):
+            logger.debug(f"Skipping duplicate observation for {doc_data['location']} ({observation_id})")
+            return observation_id
+        doc_id = observation_id or _generate_document_id()
         
-        # Save to Firestore
-        doc_ref = client.collection(collection_name).add(doc_data)
-        doc_id = doc_ref[1].id
+        if WEATHER_WRITE_BEHIND_ENABLED:
+            # Buffer the write; it is committed in a batch off the request path
+            if not get_write_queue().submit((collection_name, doc_id, doc_data)):
+                return None
+            if observation_id is not None:
+                _saved_observations.set(observation_id, True)
+            logger.info(f"Queued {data_type} weather data for {doc_data['location']} with ID: {doc_id}")
+            return doc_id
+        
+        # Save to Firestore, together with the daily rollup update
+        _write_weather_batch([(collection_name, doc_id, doc_data)])
+        if observation_id is not None:
+            _saved_observations.set(observation_id, True)
         
         logger.info(f"Saved {data_type} weather data for {doc_data['location']} with ID: {doc_id}")
         return doc_id
@@ -108,16 +317,29 @@ def save_weather_data(weather_data: Dict[str, Any], data_type: str = "current")
         return None
 
 
-def get_recent_weather(location: str, hours: int = 24) -> List[Dict[str, Any]]:
+def get_weather_history_page(
+    location: str,
+    hours: int = 24,
+    page_size: int = WEATHER_HISTORY_PAGE_SIZE,
+    fields: Optional[List[str]] = None,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
     """
-    Retrieve recent weather data for a location.
+    Retrieve one page of weather history for a location, newest first.
+    
+    Pages are ordered by (timestamp, document ID) so records sharing a
+    commit timestamp are neither skipped nor repeated across pages. With
+    `fields`, only those fields are read from Firestore.
     
     Args:
         location: Location name
         hours: Number of hours to look back (default 24)
+        page_size: Maximum records in the page
+        fields: Fields to return (timestamp and doc_id are always included)
+        cursor: next_cursor from the previous page
     
     Returns:
-        List of weather records
+        Dictionary with "records" and "next_cursor" (None on the last page)
     """
     try:
         client = get_firestore_client()
@@ -125,36 +347,91 @@ def get_recent_weather(location: str, hours: int = 24) -> List[Dict[str, Any]]:
         # Calculate time threshold
         time_threshold = datetime.utcnow() - timedelta(hours=hours)
         
-        # Query recent weather data
         query = (
             client.collection("weather_current")
             .where("location", "==", location)
             .where("timestamp", ">=", time_threshold)
             .order_by("timestamp", direction=firestore.Query.DESCENDING)
-            .limit(10)
+            .order_by(FieldPath.document_id(), direction=firestore.Query.DESCENDING)
         )
+        if fields:
+            query = query.select(sorted(set(fields) | {"timestamp"}))
+        if cursor:
+            position, doc_id = decode_history_cursor(cursor)
+            query = query.start_after({"timestamp": datetime.fromisoformat(position), "__name__": doc_id})
         
-        results = []
-        for doc in query.stream():
+        records = []
+        last_timestamp = None
+        for doc in query.limit(page_size).stream():
             data = doc.to_dict()
             data["doc_id"] = doc.id
+            last_timestamp = data.get("timestamp")
             # Convert timestamp to ISO format
-            if "timestamp" in data and data["timestamp"]:
-                data["timestamp"] = data["timestamp"].isoformat()
-            results.append(data)
+            if last_timestamp:
+                data["timestamp"] = last_timestamp.isoformat()
+            records.append(data)
+        
+        next_cursor = None
+        if len(records) == page_size and last_timestamp:
+            next_cursor = encode_history_cursor(last_timestamp.isoformat(), records[-1]["doc_id"])
         
-        logger.info(f"Retrieved {len(results)} weather records for {location}")
-        return results
+        logger.info(f"Retrieved {len(records)} weather records for {location}")
+        return {"records": records, "next_cursor": next_cursor}
         
     except Exception as e:
         logger.error(f"Failed to retrieve weather data: {str(e)}")
-        return []
+        return {"records": [], "next_cursor": None, "error": str(e)}
+
+
+def iter_weather_history(
+    location: str,
+    hours: int = 24,
+    page_size: int = WEATHER_HISTORY_PAGE_SIZE,
+    fields: Optional[List[str]] = None,
+    cursor: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over weather history for a location, newest first.
+    
+    Each page is queried only when the previous one has been consumed.
+    
+    Args:
+        location: Location name
+        hours: Number of hours to look back (default 24)
+        page_size: Records fetched per query
+        fields: Fields to return (timestamp and doc_id are always included)
+        cursor: Cursor to resume from
+    
+    Returns:
+        Generator of weather records
+    """
+    return iter_history_pages(
+        lambda page_cursor: get_weather_history_page(location, hours, page_size, fields, page_cursor),
+        cursor
+    )
+
+
+def get_recent_weather(location: str, hours: int = 24) -> List[Dict[str, Any]]:
+    """
+    Retrieve recent weather data for a location.
+    
+    Args:
+        location: Location name
+        hours: Number of hours to look back (default 24)
+    
+    Returns:
+        List of up to 10 weather records, newest first
+    """
+    return list(itertools.islice(iter_weather_history(location, hours, page_size=10), 10))
 
 
 def get_weather_statistics(location: str, days: int = 7) -> Dict[str, Any]:
     """
     Get weather statistics for a location over the specified days.
     
+    Reads at most `days` daily rollup documents (today and the preceding
+    UTC days) instead of scanning individual observations.
+    
     Args:
         location: Location name
         days: Number of days to analyze
@@ -165,48 +442,55 @@ def get_weather_statistics(location: str, days: int = 7) -> Dict[str, Any]:
     try:
         client = get_firestore_client()
         
-        # Calculate time threshold
-        time_threshold = datetime.utcnow() - timedelta(days=days)
-        
-        # Query weather data
-        query = (
-            client.collection("weather_current")
-            .where("location", "==", location)
-            .where("timestamp", ">=", time_threshold)
-        )
+        # One rollup document per UTC day in the window
+        today = datetime.utcnow().date()
+        rollup_refs = [
+            client.collection(ROLLUP_COLLECTION).document(
+                _rollup_document_id(location, today - timedelta(days=offset))
+            )
+            for offset in range(days)
+        ]
         
-        temps = []
-        humidity_values = []
+        count = 0
+        temperature_sum = 0
+        temperature_min = None
+        temperature_max = None
+        humidity_sum = 0
+        humidity_count = 0
         conditions = {}
         
-        for doc in query.stream():
-            data = doc.to_dict()
+        for snapshot in client.get_all(rollup_refs):
+            if not snapshot.exists:
+                continue
+            rollup = snapshot.to_dict()
             
-            if "temperature" in data and data["temperature"] is not None:
-                temps.append(data["temperature"])
+            if rollup.get("count"):
+                count += rollup["count"]
+                temperature_sum += rollup["temperature_sum"]
+                temperature_min = rollup["temperature_min"] if temperature_min is None else min(temperature_min, rollup["temperature_min"])
+                temperature_max = rollup["temperature_max"] if temperature_max is None else max(temperature_max, rollup["temperature_max"])
             
-            if "humidity" in data and data["humidity"] is not None:
-                humidity_values.append(data["humidity"])
+            humidity_sum += rollup.get("humidity_sum", 0)
+            humidity_count += rollup.get("humidity_count", 0)
             
-            if "description" in data:
-                condition = data["description"]
-                conditions[condition] = conditions.get(condition, 0) + 1
+            for condition, condition_count in rollup.get("conditions", {}).items():
+                conditions[condition] = conditions.get(condition, 0) + condition_count
         
-        if not temps:
+        if not count:
             return {"error": f"No weather data found for {location} in the last {days} days"}
         
         # Calculate statistics
         stats = {
             "location": location,
             "period_days": days,
-            "data_points": len(temps),
+            "data_points": count,
             "temperature": {
-                "avg": round(sum(temps) / len(temps), 1),
-                "min": min(temps),
-                "max": max(temps)
+                "avg": round(temperature_sum / count, 1),
+                "min": temperature_min,
+                "max": temperature_max
             },
             "humidity": {
-                "avg": round(sum(humidity_values) / len(humidity_values), 1) if humidity_values else None
+                "avg": round(humidity_sum / humidity_count, 1) if humidity_count else None
             },
             "most_common_condition": max(conditions.items(), key=lambda x: x[1])[0] if conditions else None,
             "conditions_breakdown": conditions
@@ -220,35 +504,286 @@ def get_weather_statistics(location: str, days: int = 7) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
-def cleanup_old_data(days_to_keep: int = 30) -> int:
+def rebuild_weather_rollups(days: int = 30) -> int:
     """
-    Clean up weather data older than specified days.
+    Recompute daily rollups from stored observations.
+    
+    Use once to backfill rollups for data written before they existed, or to
+    repair them. Existing rollups for the affected days are overwritten.
     
     Args:
-        days_to_keep: Number of days of data to keep
+        days: Number of days of observations to scan
     
     Returns:
-        Number of documents deleted
+        Number of rollup documents written
     """
     try:
         client = get_firestore_client()
         
-        # Calculate cutoff time
-        cutoff_time = datetime.utcnow() - timedelta(days=days_to_keep)
+        # Calculate time threshold
+        time_threshold = datetime.utcnow() - timedelta(days=days)
         
-        deleted_count = 0
+        query = client.collection("weather_current").where("timestamp", ">=", time_threshold)
         
-        # Clean up current weather data
-        for collection_name in ["weather_current", "weather_forecasts"]:
-            query = client.collection(collection_name).where("timestamp", "<", cutoff_time)
+        rollups = {}
+        for doc in query.stream():
+            data = doc.to_dict()
+            if not data.get("timestamp") or "location" not in data:
+                continue
+            day = data["timestamp"].date()
+            rollup = rollups.setdefault((data["location"], day), {
+                "location": data["location"],
+                "date": day.isoformat(),
+                "count": 0,
+                "temperature_sum": 0,
+                "humidity_sum": 0,
+                "humidity_count": 0,
+                "conditions": {}
+            })
+            
+            temperature = data.get("temperature")
+            if temperature is not None:
+                rollup["count"] += 1
+                rollup["temperature_sum"] += temperature
+                rollup["temperature_min"] = min(rollup.get("temperature_min", temperature), temperature)
+                rollup["temperature_max"] = max(rollup.get("temperature_max", temperature), temperature)
+            
+            humidity = data.get("humidity")
+            if humidity is not None:
+                rollup["humidity_sum"] += humidity
+                rollup["humidity_count"] += 1
             
-            for doc in query.stream():
-                doc.reference.delete()
-                deleted_count += 1
+            if "description" in data:
+                condition = str(data["description"])
+                rollup["conditions"][condition] = rollup["conditions"].get(condition, 0) + 1
+        
+        items = list(rollups.items())
+        for start in range(0, len(items), MAX_BATCH_OPERATIONS):
+            batch = client.batch()
+            for (location, day), rollup in items[start:start + MAX_BATCH_OPERATIONS]:
+                batch.set(
+                    client.collection(ROLLUP_COLLECTION).document(_rollup_document_id(location, day)),
+                    rollup
+                )
+            batch.commit()
         
-        logger.info(f"Deleted {deleted_count} old weather records")
-        return deleted_count
+        logger.info(f"Rebuilt {len(items)} weather rollups")
+        return len(items)
+        
+    except Exception as e:
+        logger.error(f"Failed to rebuild weather rollups: {str(e)}")
+        return 0
+
+
+# Collections swept by cleanup, with the field their age is judged by
+CLEANUP_TARGETS = [
+    ("weather_current", "timestamp"),
+    ("weather_forecasts", "timestamp"),
+    (ROLLUP_COLLECTION, "date"),
+]
+
+
+def _cleanup_cutoff(field: str, cutoff_time: datetime) -> Any:
+    """Express the cutoff in the type stored in `field`."""
+    return cutoff_time.date().isoformat() if field == "date" else cutoff_time
+
+
+def _encode_cursor(value: Any) -> str:
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def _decode_cursor(field: str, cursor: str) -> Any:
+    return cursor if field == "date" else datetime.fromisoformat(cursor)
+
+
+def _cleanup_collection(
+    client: firestore.Client,
+    collection_name: str,
+    field: str,
+    cutoff: Any,
+    dry_run: bool,
+    page_size: int,
+    cursor: Optional[str],
+    deadline: Optional[float]
+) -> Dict[str, Any]:
+    """
+    Delete (or count) expired documents of one collection page by page.
+    
+    Pages are ordered by the age field and each page is removed with one
+    batch write. Queries start at the cursor, which skips the index range
+    (and its delete tombstones) already cleaned by this or an earlier run.
+    """
+    query = client.collection(collection_name).where(field, "<", cutoff)
+    
+    if dry_run:
+        if cursor:
+            query = query.order_by(field).start_at({field: _decode_cursor(field, cursor)})
+        count = query.count().get()[0][0].value
+        return {"would_delete": count, "pages": 0, "cursor": cursor, "completed": True}
+    
+    query = query.order_by(field).select([field]).limit(page_size)
+    report = {"deleted": 0, "pages": 0, "cursor": cursor, "completed": False}
+    try:
+        while True:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            
+            page_query = query.start_at({field: _decode_cursor(field, cursor)}) if cursor else query
+            docs = list(page_query.stream())
+            if not docs:
+                report["completed"] = True
+                break
+            
+            batch = client.batch()
+            for doc in docs:
+                batch.delete(doc.reference)
+            batch.commit()
+            
+            cursor = _encode_cursor(docs[-1].to_dict()[field])
+            report["deleted"] += len(docs)
+            report["pages"] += 1
+            report["cursor"] = cursor
+            if len(docs) < page_size:
+                report["completed"] = True
+                break
+    except Exception as e:
+        # Keep the progress made so far so the run can be resumed
+        logger.error(f"Cleanup of {collection_name} interrupted: {str(e)}")
+        report["error"] = str(e)
+    
+    return report
+
+
+def run_cleanup(
+    days_to_keep: int = 30,
+    dry_run: bool = False,
+    page_size: int = WEATHER_CLEANUP_PAGE_SIZE,
+    parallel: bool = True,
+    cursors: Optional[Dict[str, str]] = None,
+    time_budget_seconds: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Delete weather data older than specified days in batched pages.
+    
+    Args:
+        days_to_keep: Number of days of data to keep
+        dry_run: Only count what would be deleted
+        page_size: Documents deleted per batch write (at most 500)
+        parallel: Clean the collections concurrently
+        cursors: Per-collection cursors from a previous, interrupted run
+        time_budget_seconds: Stop starting new pages after this many seconds
+    
+    Returns:
+        Report with per-collection counts, resume cursors and throughput
+    """
+    client = get_firestore_client()
+    page_size = min(page_size, MAX_BATCH_OPERATIONS)
+    cursors = cursors or {}
+    
+    # Calculate cutoff time
+    cutoff_time = datetime.utcnow() - timedelta(days=days_to_keep)
+    
+    start = time.monotonic()
+    deadline = start + time_budget_seconds if time_budget_seconds is not None else None
+    
+    def clean(target: Tuple[str, str]) -> Dict[str, Any]:
+        collection_name, field = target
+        try:
+            return _cleanup_collection(
+                client, collection_name, field, _cleanup_cutoff(field, cutoff_time),
+                dry_run, page_size, cursors.get(collection_name), deadline
+            )
+        except Exception as e:
+            logger.error(f"Cleanup of {collection_name} failed: {str(e)}")
+            return {
+                "deleted": 0, "pages": 0, "cursor": cursors.get(collection_name),
+                "completed": False, "error": str(e)
+            }
+    
+    if parallel:
+        with ThreadPoolExecutor(max_workers=len(CLEANUP_TARGETS)) as pool:
+            results = list(pool.map(clean, CLEANUP_TARGETS))
+    else:
+        results = [clean(target) for target in CLEANUP_TARGETS]
+    
+    elapsed = time.monotonic() - start
+    collections = {name: result for (name, _), result in zip(CLEANUP_TARGETS, results)}
+    count_key = "would_delete" if dry_run else "deleted"
+    total = sum(result.get(count_key, 0) for result in results)
+    
+    report = {
+        "dry_run": dry_run,
+        "cutoff": cutoff_time.isoformat(),
+        count_key: total,
+        "collections": collections,
+        "completed": all(result["completed"] for result in results),
+        "cursors": {name: result["cursor"] for name, result in collections.items() if result["cursor"]},
+        "elapsed_seconds": round(elapsed, 3),
+        "docs_per_second": round(total / elapsed, 1) if elapsed > 0 else None
+    }
+    
+    if dry_run:
+        logger.info(f"Cleanup dry run: {total} old weather records would be deleted")
+    else:
+        logger.info(f"Deleted {total} old weather records in {elapsed:.1f}s")
+    return report
+
+
+def cleanup_old_data(days_to_keep: int = 30) -> int:
+    """
+    Clean up weather data older than specified days.
+    
+    Args:
+        days_to_keep: Number of days of data to keep
+    
+    Returns:
+        Number of documents deleted
+    """
+    try:
+        return run_cleanup(days_to_keep)["deleted"]
         
     except Exception as e:
         logger.error(f"Failed to cleanup old data: {str(e)}")
-        return 0
\ No newline at end of file
+        return 0
+
+
+class FirestoreWeatherBackend(WeatherStorageBackend):
+    """Weather storage backed by the Firestore functions in this module."""
+    
+    name = "firestore"
+    
+    def save(self, weather_data: Dict[str, Any], data_type: str = "current") -> Optional[str]:
+        return save_weather_data(weather_data, data_type)
+    
+    def get_history_page(
+        self,
+        location: str,
+        hours: int = 24,
+        page_size: int = WEATHER_HISTORY_PAGE_SIZE,
+        fields: Optional[List[str]] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        return get_weather_history_page(location, hours, page_size, fields, cursor)
+    
+    def get_recent(self, location: str, hours: int = 24) -> List[Dict[str, Any]]:
+        return get_recent_weather(location, hours)
+    
+    def get_statistics(self, location: str, days: int = 7) -> Dict[str, Any]:
+        return get_weather_statistics(location, days)
+    
+    def cleanup(self, days_to_keep: int = 30, dry_run: bool = False) -> Dict[str, Any]:
+        try:
+            return run_cleanup(days_to_keep, dry_run=dry_run)
+        except Exception as e:
+            logger.error(f"Failed to cleanup old data: {str(e)}")
+            return {"error": str(e)}
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return flush_weather_writes(timeout)
+    
+    def close(self) -> None:
+        write_queue = _write_queue
+        if write_queue is not None:
+            # Later saves lazily start a fresh queue instead of hitting the closed one
+            set_write_queue(None)
+            write_queue.close()
@@ -0,0 +1,254 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Write-behind buffer that batches storage writes off the request path."""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from ..config import (
+    WEATHER_WRITE_BATCH_SIZE,
+    WEATHER_WRITE_FLUSH_INTERVAL_SECONDS,
+    WEATHER_WRITE_MAX_RETRIES,
+    WEATHER_WRITE_PUT_TIMEOUT_SECONDS,
+    WEATHER_WRITE_QUEUE_SIZE,
+    WEATHER_WRITE_RETRY_BACKOFF_SECONDS,
+)
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Sentinel asking the worker to write everything and exit
+_STOP = object()
+
+
+class WriteBehindQueue:
+    """
+    Bounded queue of records written in batches by a background thread.
+
+    Records are flushed when a batch fills up or when the flush interval
+    elapses, whichever comes first. When the queue is full, submit() waits
+    briefly and then drops the record (backpressure without stalling the
+    caller). A failed batch is retried with exponential backoff before its
+    records are given up. Remaining records are flushed at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[Any]], None],
+        max_batch_size: int = WEATHER_WRITE_BATCH_SIZE,
+        flush_interval: float = WEATHER_WRITE_FLUSH_INTERVAL_SECONDS,
+        max_queue_size: int = WEATHER_WRITE_QUEUE_SIZE,
+        put_timeout: float = WEATHER_WRITE_PUT_TIMEOUT_SECONDS,
+        max_retries: int = WEATHER_WRITE_MAX_RETRIES,
+        retry_backoff: float = WEATHER_WRITE_RETRY_BACKOFF_SECONDS,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            write_batch: Writes one batch of records (at most max_batch_size)
+            max_batch_size: Records per batch write
+            flush_interval: Maximum seconds a record waits before being written
+            max_queue_size: Maximum number of buffered records
+            put_timeout: Seconds submit() waits for space before dropping
+            max_retries: Retries of a failed batch before its records are dropped
+            retry_backoff: Delay before the first retry, doubled for each next one
+            sleep: Sleep function (overridable for tests)
+        """
+        self._write_batch = write_batch
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._sleep = sleep
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.retries = 0
+        self.batches = 0
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="weather-write-behind", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def submit(self, record: Any) -> bool:
+        """
+        Buffer a record for writing.
+
+        Args:
+            record: Record passed to write_batch later
+
+        Returns:
+            True if the record was queued, False if it was dropped
+        """
+        if self._closed:
+            logger.warning("Write-behind queue is closed, dropping record")
+            self.dropped += 1
+            return False
+
+        self._ensure_worker()
+        try:
+            self._queue.put(record, timeout=self.put_timeout)
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("Write-behind queue is full, dropping record")
+            return False
+        self.enqueued += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every record submitted so far has been written.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the flush completed within the timeout
+        """
+        if self._thread is None:
+            return True
+        if self._closed or not self._thread.is_alive():
+            # close() drains the queue; nothing consumes it afterwards
+            return not self._thread.is_alive()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = threading.Event()
+        # The queue is bounded; a stalled writer must not block the caller forever
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            logger.warning("Write-behind queue is full, flush timed out")
+            return False
+        return done.wait(None if deadline is None else max(deadline - time.monotonic(), 0))
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """
+        Flush remaining records and stop the worker.
+
+        Args:
+            timeout: Maximum seconds to wait for the worker
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                logger.warning("Write-behind queue is full, stopping without a final flush")
+                return
+            self._thread.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+
+    def _write(self, records: List[Any]) -> None:
+        for start in range(0, len(records), self.max_batch_size):
+            chunk = records[start:start + self.max_batch_size]
+            for attempt in range(self.max_retries + 1):
+                try:
+                    self._write_batch(chunk)
+                except Exception as e:
+                    if attempt < self.max_retries:
+                        self.retries += 1
+                        logger.warning(f"Failed to write batch of {len(chunk)} records ({e}), retrying")
+                        self._sleep(self.retry_backoff * (2 ** attempt))
+                        continue
+                    self.failed += len(chunk)
+                    logger.error(f"Failed to write batch of {len(chunk)} records: {e}")
+                else:
+                    self.written += len(chunk)
+                    self.batches += 1
+                break
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            records: List[Any] = []
+            waiters: List[threading.Event] = []
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    records.append(item)
+
+                if stop or waiters or len(records) >= self.max_batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if stop:
+                # Drain whatever arrived before shutdown
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(item, threading.Event):
+                        waiters.append(item)
+                    elif item is not _STOP:
+                        records.append(item)
+
+            if records:
+                self._write(records)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queue counters.
+
+        Returns:
+            Dictionary with enqueued, written, dropped, failed and retry counts
+        """
+        return {
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "retries": self.retries,
+            "batches": self.batches,
+            "pending": self._queue.qsize()
+        }
@@ -0,0 +1,88 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Microbenchmark for weather response shaping.
+
+Compares the previous per-call description dict and per-day indexing loop
+with the precomputed table and single-pass shaping in weather_format.
+
+Usage:
+    python tests/benchmarks/bench_weather_format.py [--forecasts 500] [--days 16]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from mas_system.sub_agents.weather_agent.tools.weather_format import (  # noqa: E402
+    WEATHER_CODE_DESCRIPTIONS,
+    shape_daily_forecast,
+)
+
+
+def legacy_shape_daily_forecast(daily):
+    """The original loop, including rebuilding the description dict per call."""
+    weather_descriptions = dict(WEATHER_CODE_DESCRIPTIONS)
+    forecast_data = []
+    for i in range(len(daily["time"])):
+        weather_code = daily["weather_code"][i]
+        description = weather_descriptions.get(weather_code, "Unknown")
+        forecast_data.append({
+            "date": daily["time"][i],
+            "temperature_high": round(daily["temperature_2m_max"][i]),
+            "temperature_low": round(daily["temperature_2m_min"][i]),
+            "description": description,
+            "precipitation_chance": daily["precipitation_probability_max"][i],
+            "precipitation_amount": daily["precipitation_sum"][i]
+        })
+    return forecast_data
+
+
+def make_daily(days, rng):
+    """Build a random Open-Meteo daily block."""
+    codes = list(WEATHER_CODE_DESCRIPTIONS) + [4]
+    return {
+        "time": [f"2025-06-{day + 1:02d}" for day in range(days)],
+        "weather_code": [rng.choice(codes) for _ in range(days)],
+        "temperature_2m_max": [rng.uniform(50, 95) for _ in range(days)],
+        "temperature_2m_min": [rng.uniform(30, 60) for _ in range(days)],
+        "precipitation_sum": [round(rng.uniform(0, 20), 1) for _ in range(days)],
+        "precipitation_probability_max": [rng.randint(0, 100) for _ in range(days)],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Weather response shaping microbenchmark")
+    parser.add_argument("--forecasts", type=int, default=500, help="forecasts shaped per run")
+    parser.add_argument("--days", type=int, default=16, help="days per forecast")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    payloads = [make_daily(args.days, rng) for _ in range(args.forecasts)]
+    assert all(legacy_shape_daily_forecast(p) == shape_daily_forecast(p) for p in payloads)
+
+    for name, func in (("legacy", legacy_shape_daily_forecast), ("single-pass", shape_daily_forecast)):
+        best = min(timeit.repeat(lambda: [func(p) for p in payloads], number=1, repeat=args.repeat))
+        print(f"{name:>12}: {best * 1000:8.2f} ms for {args.forecasts} x {args.days}-day forecasts "
+              f"({best / args.forecasts * 1e6:.1f} us/forecast)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Fixtures for the offline weather benchmarks.
+
+Injected latency and errors are read from the environment so the same
+suite can be run under different network conditions:
+
+    BENCH_STUB_LATENCY_MS   fixed delay per stub request (default 0)
+    BENCH_STUB_JITTER_MS    extra random delay per request (default 0)
+    BENCH_STUB_ERROR_RATE   fraction of requests answered with 503 (default 0)
+    BENCH_STUB_SEED         seed for jitter and error injection (default 0)
+"""
+
+import os
+import sys
+
+import pytest
+
+# The Firestore fake lives in the parent tests directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from open_meteo_stub import OpenMeteoStub  # noqa: E402
+from mas_system.sub_agents.weather_agent.tools import http_client, weather, weather_storage  # noqa: E402
+from mas_system.sub_agents.weather_agent.tools.sqlite_store import SQLiteWeatherBackend  # noqa: E402
+
+
+def stub_conditions():
+    """Injected latency/error settings from the environment."""
+    return {
+        "latency": float(os.getenv("BENCH_STUB_LATENCY_MS", "0")) / 1000,
+        "jitter": float(os.getenv("BENCH_STUB_JITTER_MS", "0")) / 1000,
+        "error_rate": float(os.getenv("BENCH_STUB_ERROR_RATE", "0")),
+        "seed": int(os.getenv("BENCH_STUB_SEED", "0")),
+    }
+
+
+@pytest.fixture(scope="session")
+def open_meteo_stub():
+    with OpenMeteoStub(**stub_conditions()) as stub:
+        yield stub
+
+
+@pytest.fixture
+def weather_stub(open_meteo_stub, monkeypatch, tmp_path):
+    """
+    Point the weather tools at the stub with a fresh pooled HTTP client
+    and a throwaway SQLite storage backend.
+    """
+    open_meteo_stub.configure(**stub_conditions())
+    monkeypatch.setattr(weather, "BASE_URL", open_meteo_stub.forecast_url)
+    monkeypatch.setattr(weather, "GEOCODING_URL", open_meteo_stub.geocoding_url)
+    client = http_client.HTTPClient(pool_maxsize=64, backoff_factor=0.01, backoff_max=0.05)
+    http_client.set_http_client(client)
+    backend = SQLiteWeatherBackend(str(tmp_path / "weather.db"))
+    weather_storage.set_weather_backend(backend)
+    weather.clear_geocode_cache()
+    weather.clear_forecast_cache()
+    yield open_meteo_stub
+    weather_storage.set_weather_backend(None)
+    backend.close()
+    http_client.set_http_client(None)
+    client.close()
+    weather.clear_geocode_cache()
+    weather.clear_forecast_cache()
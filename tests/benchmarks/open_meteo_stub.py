@@ -0,0 +1,302 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Local stand-in for the Open-Meteo geocoding and forecast APIs.
+
+Replays recorded payloads from fixtures/open_meteo.json with configurable
+latency and error injection, so weather tools can be benchmarked without
+network access.
+
+Usage:
+    # Serve on a fixed port and point the weather agent at it
+    python tests/benchmarks/open_meteo_stub.py serve --port 8089 --latency-ms 40 --error-rate 0.01
+
+    # Re-record fixtures from the real API
+    python tests/benchmarks/open_meteo_stub.py record London Paris "New York"
+"""
+
+import argparse
+import copy
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "open_meteo.json")
+
+# Everything the forecast endpoint returns besides the data blocks
+_FORECAST_BLOCKS = ("current", "current_units", "daily", "daily_units")
+
+
+def load_fixtures(path: str = DEFAULT_FIXTURES) -> Dict[str, Any]:
+    """Load recorded geocoding and forecast payloads."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def record_fixtures(
+    locations: List[str],
+    path: str = DEFAULT_FIXTURES,
+    geocoding_url: str = "https://geocoding-api.open-meteo.com/v1/search",
+    forecast_url: str = "https://api.open-meteo.com/v1/forecast"
+) -> Dict[str, Any]:
+    """
+    Record real Open-Meteo payloads for the given locations.
+
+    Forecasts are recorded with every variable the weather tools request
+    and 16 days of daily data, so any `forecast_days` can be replayed.
+    """
+    import requests
+    from mas_system.sub_agents.weather_agent.tools.weather import (
+        CURRENT_VARIABLES,
+        DAILY_VARIABLES,
+        normalize_location,
+    )
+
+    fixtures: Dict[str, Any] = {"geocoding": {}, "forecast": []}
+    for location in locations:
+        name = normalize_location(location)
+        geocoded = requests.get(
+            geocoding_url, params={"name": name, "count": 1, "language": "en", "format": "json"}, timeout=10
+        ).json()
+        fixtures["geocoding"][name] = geocoded
+        if not geocoded.get("results"):
+            continue
+        result = geocoded["results"][0]
+        fixtures["forecast"].append(requests.get(forecast_url, params={
+            "latitude": result["latitude"],
+            "longitude": result["longitude"],
+            "current": CURRENT_VARIABLES,
+            "daily": DAILY_VARIABLES,
+            "temperature_unit": "fahrenheit",
+            "wind_speed_unit": "mph",
+            "timezone": "auto",
+            "forecast_days": 16
+        }, timeout=10).json())
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(fixtures, f, indent=1, ensure_ascii=False)
+    return fixtures
+
+
+class OpenMeteoStub:
+    """
+    Threaded HTTP server replaying recorded Open-Meteo responses.
+
+    Every request waits `latency` seconds plus up to `jitter` seconds, then
+    fails with a 503 with probability `error_rate`. Randomness comes from a
+    seeded generator so runs are reproducible. Forecast requests are
+    answered with the recorded payload nearest to the requested
+    coordinates; several comma-separated coordinates return a list, as the
+    real API does.
+    """
+
+    def __init__(
+        self,
+        fixtures: Optional[Dict[str, Any]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        self.fixtures = fixtures if fixtures is not None else load_fixtures()
+        self.host = host
+        self.port = port
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.configure(latency=latency, jitter=jitter, error_rate=error_rate, seed=seed)
+
+    def configure(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0
+    ) -> None:
+        """Set injected latency and errors, and reset the counters."""
+        with self._lock:
+            self.latency = latency
+            self.jitter = jitter
+            self.error_rate = error_rate
+            self._rng = random.Random(seed)
+            self.requests: Dict[str, int] = {}
+            self.errors = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def forecast_url(self) -> str:
+        return f"{self.base_url}/v1/forecast"
+
+    @property
+    def geocoding_url(self) -> str:
+        return f"{self.base_url}/v1/search"
+
+    def start(self) -> "OpenMeteoStub":
+        """Start serving on a background thread."""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                status, payload = stub.handle(self.path)
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="open-meteo-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "OpenMeteoStub":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests served per path and injected errors."""
+        with self._lock:
+            return {"requests": dict(self.requests), "errors": self.errors}
+
+    def handle(self, raw_path: str):
+        """Answer one request; returns (status, JSON payload)."""
+        url = urlparse(raw_path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        with self._lock:
+            self.requests[url.path] = self.requests.get(url.path, 0) + 1
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+            if fail:
+                self.errors += 1
+        if delay:
+            time.sleep(delay)
+        if fail:
+            return 503, {"error": True, "reason": "Injected error"}
+
+        if url.path == "/v1/search":
+            return 200, self._geocode(params)
+        if url.path == "/v1/forecast":
+            return self._forecast(params)
+        return 404, {"error": True, "reason": "Not found"}
+
+    def _geocode(self, params: Dict[str, str]) -> Dict[str, Any]:
+        name = params.get("name", "").strip().lower()
+        return self.fixtures["geocoding"].get(name, {"generationtime_ms": 0.5})
+
+    def _nearest_forecast(self, lat: float, lon: float) -> Dict[str, Any]:
+        return min(
+            self.fixtures["forecast"],
+            key=lambda payload: math.hypot(payload["latitude"] - lat, payload["longitude"] - lon)
+        )
+
+    def _forecast(self, params: Dict[str, str]):
+        try:
+            latitudes = [float(value) for value in params["latitude"].split(",")]
+            longitudes = [float(value) for value in params["longitude"].split(",")]
+            days = int(params.get("forecast_days", 7))
+        except (KeyError, ValueError):
+            return 400, {"error": True, "reason": "Invalid latitude, longitude or forecast_days"}
+        if len(latitudes) != len(longitudes):
+            return 400, {"error": True, "reason": "Parameter latitude and longitude must have the same number of elements"}
+
+        payloads = []
+        for lat, lon in zip(latitudes, longitudes):
+            recorded = self._nearest_forecast(lat, lon)
+            payload = {key: value for key, value in recorded.items() if key not in _FORECAST_BLOCKS}
+            if "current" in params:
+                payload["current_units"] = recorded["current_units"]
+                payload["current"] = recorded["current"]
+            if "daily" in params:
+                payload["daily_units"] = recorded["daily_units"]
+                payload["daily"] = {name: values[:days] for name, values in recorded["daily"].items()}
+            payloads.append(copy.deepcopy(payload))
+        return 200, payloads if len(payloads) > 1 else payloads[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline Open-Meteo stand-in")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="serve recorded payloads")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8089)
+    serve.add_argument("--latency-ms", type=float, default=0.0)
+    serve.add_argument("--jitter-ms", type=float, default=0.0)
+    serve.add_argument("--error-rate", type=float, default=0.0)
+    serve.add_argument("--seed", type=int, default=0)
+    serve.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+
+    record = commands.add_parser("record", help="record fixtures from the real API")
+    record.add_argument("locations", nargs="+")
+    record.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+
+    args = parser.parse_args()
+    if args.command == "record":
+        fixtures = record_fixtures(args.locations, args.fixtures)
+        print(f"Recorded {len(fixtures['forecast'])} forecasts to {args.fixtures}")
+        return
+
+    stub = OpenMeteoStub(
+        load_fixtures(args.fixtures),
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        host=args.host,
+        port=args.port
+    ).start()
+    print(f"OPEN_METEO_FORECAST_URL={stub.forecast_url}")
+    print(f"OPEN_METEO_GEOCODING_URL={stub.geocoding_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
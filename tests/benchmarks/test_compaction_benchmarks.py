@@ -0,0 +1,95 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+"""
+Per-turn latency over long conversations, with and without compaction.
+
+The model is a fake whose latency grows with the prompt size, so the
+numbers show how much of each turn is spent on the growing history:
+
+    python -m pytest tests/benchmarks/test_compaction_benchmarks.py --benchmark-only
+"""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from google.genai import types  # noqa: E402
+from google.adk.runners import InMemoryRunner  # noqa: E402
+
+from test_compaction import FakeLlm, make_app  # noqa: E402
+
+TURNS = 100
+
+# Simulated model time: 20 ms per call plus 10 ms per 1,000 prompt tokens
+BASE_LATENCY = 0.02
+LATENCY_PER_TOKEN = 0.00001
+
+WINDOW = 10
+
+
+async def timed_conversation(app, turns):
+    """Run a conversation and return the wall time of each turn."""
+    runner = InMemoryRunner(app=app)
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id="bench_user")
+    latencies = []
+    for turn in range(turns):
+        message = types.UserContent(parts=[types.Part(text=f"Question {turn}: tell me more about the forecast")])
+        started = time.perf_counter()
+        async for _ in runner.run_async(user_id="bench_user", session_id=session.id, new_message=message):
+            pass
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def mean_ms(values):
+    return 1000 * sum(values) / len(values)
+
+
+def record(benchmark, llm, latencies):
+    # The first turns have almost no history, so compare against turns 11-20
+    early = mean_ms(latencies[WINDOW:2 * WINDOW])
+    late = mean_ms(latencies[-WINDOW:])
+    benchmark.extra_info.update({
+        "turns": len(latencies),
+        "early_turn_ms": round(early, 2),
+        "late_turn_ms": round(late, 2),
+        "late_to_early_ratio": round(late / early, 2),
+        "max_prompt_tokens": max(llm.prompt_tokens),
+        "summaries": llm.summaries,
+    })
+    return late / early
+
+
+@pytest.mark.parametrize("compaction", [True, False], ids=["compaction", "no_compaction"])
+def test_per_turn_latency_over_long_conversation(benchmark, compaction):
+    if not compaction and benchmark.disabled:
+        pytest.skip("the uncompacted baseline takes ~15 s; it only runs with benchmarking enabled")
+    llm = FakeLlm(prompt_tokens=[], base_latency=BASE_LATENCY, latency_per_token=LATENCY_PER_TOKEN)
+    app = make_app(llm, compaction=compaction)
+
+    latencies = benchmark.pedantic(lambda: asyncio.run(timed_conversation(app, TURNS)), rounds=1, iterations=1)
+    ratio = record(benchmark, llm, latencies)
+
+    # What growth remains with compaction comes from the in-memory session
+    # service copying the full event list on every turn
+    if compaction:
+        assert ratio < 2
+    else:
+        assert ratio > 3
@@ -0,0 +1,57 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+"""
+Cold import time of the agent tree, tracked as a regression benchmark.
+
+Each round imports mas_system.agent in a fresh interpreter with
+`-X importtime` (see eval/import_time_report.py for the full report):
+
+    python -m pytest tests/benchmarks/test_import_benchmarks.py --benchmark-only
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from eval.import_time_report import profile_import  # noqa: E402
+
+# Generous enough for slow CI machines; the import took ~4.6 s before the
+# Vertex AI RAG client was deferred and takes ~1.5 s now
+IMPORT_BUDGET_MS = float(os.getenv("BENCH_IMPORT_BUDGET_MS", "3000"))
+
+
+def test_cold_import_mas_system_agent(benchmark):
+    profiles = []
+    benchmark.pedantic(lambda: profiles.append(profile_import("mas_system.agent")), rounds=3, iterations=1)
+
+    fastest = min(profiles, key=lambda profile: profile["total_ms"])
+    packages = sorted(fastest["packages_ms"].items(), key=lambda item: item[1], reverse=True)
+    benchmark.extra_info.update({
+        "import_ms": round(fastest["total_ms"], 1),
+        "slowest_packages_ms": {name: round(ms, 1) for name, ms in packages[:5]},
+    })
+
+    assert fastest["deferred_loaded"] == []
+    assert fastest["total_ms"] < IMPORT_BUDGET_MS
+
+
+def test_backend_client_does_not_import_vertexai():
+    profile = profile_import("app.core.mas_client", cwd="mas-frontend/backend")
+
+    assert "vertexai" not in profile["deferred_loaded"]
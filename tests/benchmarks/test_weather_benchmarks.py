@@ -0,0 +1,228 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Latency and throughput benchmarks for the weather tools and storage.
+
+Runs entirely offline against the Open-Meteo stub, SQLite and the
+in-memory Firestore fake:
+
+    python -m pytest tests/benchmarks --benchmark-only
+    BENCH_STUB_LATENCY_MS=40 python -m pytest tests/benchmarks --benchmark-only \\
+        --benchmark-save=baseline
+    python -m pytest tests/benchmarks --benchmark-only --benchmark-compare
+"""
+
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from fake_firestore import FakeFirestoreClient  # noqa: E402
+from mas_system.sub_agents.weather_agent.tools import weather, weather_store  # noqa: E402
+from mas_system.sub_agents.weather_agent.tools.sqlite_store import SQLiteWeatherBackend  # noqa: E402
+from mas_system.sub_agents.weather_agent.tools.write_behind import WriteBehindQueue  # noqa: E402
+
+CITIES = ["London", "Paris", "New York", "Los Angeles", "San Francisco", "Chicago", "Tokyo", "Sydney"]
+
+CALLS_PER_ROUND = 64
+
+ROUNDS = 10
+
+CURRENT_RESULT = {
+    "location": "London, England, United Kingdom",
+    "temperature": 64,
+    "unit": "fahrenheit",
+    "description": "Partly cloudy",
+    "humidity": 71,
+    "wind_speed": 10,
+    "feels_like": 63,
+    "precipitation_probability": 10,
+    "timestamp": "2025-06-01T12:00",
+    "coordinates": {"latitude": 51.50853, "longitude": -0.12574},
+}
+
+
+_observation_numbers = itertools.count()
+
+
+def new_observation(_=None):
+    """A CURRENT_RESULT with a fresh API timestamp, so deduplication never skips it."""
+    api_time = datetime(2025, 6, 1) + timedelta(minutes=15 * next(_observation_numbers))
+    return dict(CURRENT_RESULT, timestamp=api_time.strftime("%Y-%m-%dT%H:%M"))
+
+
+def clear_weather_caches():
+    weather.clear_geocode_cache()
+    weather.clear_forecast_cache()
+
+
+def run_concurrently(func, args, workers):
+    """Call func(arg) for every arg on a pool of `workers` threads."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, args))
+
+
+def record_throughput(benchmark, calls):
+    benchmark.extra_info["calls_per_round"] = calls
+    if benchmark.stats is not None:  # None under --benchmark-disable
+        benchmark.extra_info["calls_per_second"] = calls / benchmark.stats.stats.mean
+
+
+@pytest.mark.benchmark(group="current-weather")
+def test_current_weather_cold(benchmark, weather_stub):
+    """Geocoding and forecast requests on every call."""
+    result = benchmark.pedantic(
+        weather.get_current_weather, args=("London",), setup=clear_weather_caches, rounds=ROUNDS * 5
+    )
+    assert result["location"].startswith("London")
+
+
+@pytest.mark.benchmark(group="current-weather")
+def test_current_weather_geocode_cached(benchmark, weather_stub):
+    """Only the forecast request; coordinates come from the geocode cache."""
+    weather.get_current_weather("London")
+    result = benchmark.pedantic(weather.get_current_weather, args=("London",), rounds=ROUNDS * 5)
+    assert "temperature" in result
+
+
+@pytest.mark.benchmark(group="forecast")
+@pytest.mark.parametrize("days", [1, 3, 7])
+def test_weather_forecast_cold(benchmark, weather_stub, days):
+    """Forecast fetch and shaping with an empty forecast cache."""
+    weather.get_coordinates("Tokyo")
+    result = benchmark.pedantic(
+        weather.get_weather_forecast, args=("Tokyo", days), setup=weather.clear_forecast_cache, rounds=ROUNDS * 5
+    )
+    assert result["days"] == days
+
+
+@pytest.mark.benchmark(group="forecast")
+def test_weather_forecast_cached(benchmark, weather_stub):
+    """Forecast served from the grid-cell cache."""
+    weather.get_weather_forecast("Tokyo", 7)
+    result = benchmark.pedantic(weather.get_weather_forecast, args=("Tokyo", 5), rounds=ROUNDS * 5)
+    assert result["days"] == 5
+
+
+@pytest.mark.benchmark(group="current-weather-concurrency")
+@pytest.mark.parametrize("workers", [1, 8, 32])
+def test_current_weather_concurrency(benchmark, weather_stub, workers):
+    """CALLS_PER_ROUND cold current-weather calls spread over a thread pool."""
+    locations = [CITIES[i % len(CITIES)] for i in range(CALLS_PER_ROUND)]
+    results = benchmark.pedantic(
+        run_concurrently, args=(weather.get_current_weather, locations, workers),
+        setup=clear_weather_caches, rounds=ROUNDS
+    )
+    record_throughput(benchmark, CALLS_PER_ROUND)
+    benchmark.extra_info["stub"] = weather_stub.stats()
+    assert sum("temperature" in result for result in results) >= CALLS_PER_ROUND * 0.9
+
+
+@pytest.mark.benchmark(group="forecast-concurrency")
+@pytest.mark.parametrize("workers", [1, 8, 32])
+def test_weather_forecast_concurrency(benchmark, weather_stub, workers):
+    """CALLS_PER_ROUND forecast calls with cached coordinates over a thread pool."""
+    for city in CITIES:
+        weather.get_coordinates(city)
+    locations = [CITIES[i % len(CITIES)] for i in range(CALLS_PER_ROUND)]
+    results = benchmark.pedantic(
+        run_concurrently, args=(weather.get_weather_forecast, locations, workers),
+        setup=weather.clear_forecast_cache, rounds=ROUNDS
+    )
+    record_throughput(benchmark, CALLS_PER_ROUND)
+    assert sum("forecast" in result for result in results) >= CALLS_PER_ROUND * 0.9
+
+
+@pytest.mark.benchmark(group="storage")
+@pytest.mark.parametrize("workers", [1, 8])
+def test_sqlite_save_throughput(benchmark, tmp_path, workers):
+    backend = SQLiteWeatherBackend(str(tmp_path / "bench.db"))
+    try:
+        doc_ids = benchmark.pedantic(
+            run_concurrently, args=(lambda _: backend.save(new_observation(), "current"), range(CALLS_PER_ROUND), workers),
+            rounds=ROUNDS
+        )
+        record_throughput(benchmark, CALLS_PER_ROUND)
+        assert all(doc_ids)
+    finally:
+        backend.close()
+
+
+@pytest.mark.benchmark(group="storage")
+@pytest.mark.parametrize("workers", [1, 8])
+def test_firestore_write_behind_throughput(benchmark, monkeypatch, workers):
+    """Saves through the write-behind queue into the Firestore fake, including the final flush."""
+    monkeypatch.setattr(weather_store, "_firestore_client", FakeFirestoreClient())
+    write_queue = WriteBehindQueue(weather_store._write_weather_batch, flush_interval=0.05)
+    weather_store.set_write_queue(write_queue)
+
+    def save_and_flush():
+        doc_ids = run_concurrently(
+            lambda _: weather_store.save_weather_data(new_observation(), "current"), range(CALLS_PER_ROUND), workers
+        )
+        assert weather_store.flush_weather_writes(timeout=10)
+        return doc_ids
+
+    try:
+        doc_ids = benchmark.pedantic(save_and_flush, rounds=ROUNDS)
+        record_throughput(benchmark, CALLS_PER_ROUND)
+        assert all(doc_ids)
+    finally:
+        write_queue.close()
+        weather_store.set_write_queue(None)
+
+
+@pytest.mark.benchmark(group="storage")
+def test_firestore_duplicate_saves(benchmark, monkeypatch):
+    """Many users asking about one city in one update window: one stored observation."""
+    client = FakeFirestoreClient()
+    monkeypatch.setattr(weather_store, "_firestore_client", client)
+    monkeypatch.setattr(weather_store, "_saved_observations", weather_store.TTLCache(maxsize=4096, ttl=3600))
+    write_queue = WriteBehindQueue(weather_store._write_weather_batch, flush_interval=0.05)
+    weather_store.set_write_queue(write_queue)
+    duplicate = new_observation()
+
+    def save_and_flush():
+        doc_ids = run_concurrently(
+            lambda _: weather_store.save_weather_data(duplicate, "current"), range(CALLS_PER_ROUND), 8
+        )
+        assert weather_store.flush_weather_writes(timeout=10)
+        return doc_ids
+
+    try:
+        doc_ids = benchmark.pedantic(save_and_flush, rounds=ROUNDS)
+        record_throughput(benchmark, CALLS_PER_ROUND)
+        benchmark.extra_info["operations_committed"] = sum(client.commits)
+        assert len(set(doc_ids)) == 1
+        assert len(client.collection("weather_current").documents) == 1
+    finally:
+        write_queue.close()
+        weather_store.set_write_queue(None)
+
+
+@pytest.mark.benchmark(group="storage")
+def test_sqlite_statistics_read(benchmark, tmp_path):
+    backend = SQLiteWeatherBackend(str(tmp_path / "bench.db"))
+    try:
+        for _ in range(500):
+            backend.save(new_observation(), "current")
+        stats = benchmark.pedantic(backend.get_statistics, args=(CURRENT_RESULT["location"], 7), rounds=ROUNDS * 5)
+        assert stats["data_points"] == 500
+    finally:
+        backend.close()
@@ -0,0 +1,242 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""In-memory stand-in for the parts of firestore.Client the weather store uses."""
+
+import operator
+from datetime import datetime, timezone
+
+from google.cloud import firestore
+
+
+def _normalize(value):
+    """Firestore treats naive datetimes as UTC; do the same for comparisons."""
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _apply_transform(current, value):
+    """Apply a Firestore field transform (or plain value) to a field."""
+    if isinstance(value, firestore.Increment):
+        return (current or 0) + value.value
+    if isinstance(value, firestore.Maximum):
+        return value.value if current is None else max(current, value.value)
+    if isinstance(value, firestore.Minimum):
+        return value.value if current is None else min(current, value.value)
+    if value is firestore.SERVER_TIMESTAMP:
+        return FakeFirestoreClient.now()
+    return value
+
+
+def _merge(target, updates):
+    for key, value in updates.items():
+        if isinstance(value, dict):
+            _merge(target.setdefault(key, {}), value)
+        else:
+            target[key] = _apply_transform(target.get(key), value)
+
+
+class FakeSnapshot:
+    def __init__(self, reference, data):
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeDocumentReference:
+    def __init__(self, collection, doc_id):
+        self.collection = collection
+        self.id = doc_id
+
+    def set(self, data, merge=False):
+        documents = self.collection.documents
+        if not merge or self.id not in documents:
+            documents[self.id] = {}
+        _merge(documents[self.id], data)
+
+    def delete(self):
+        self.collection.client.deletes += 1
+        self.collection.documents.pop(self.id, None)
+
+    def get(self):
+        return FakeSnapshot(self, self.collection.documents.get(self.id))
+
+
+_OPERATORS = {
+    "==": operator.eq,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+class FakeQuery:
+    def __init__(self, collection, filters=(), orders=(), limit_count=None, cursor=None, projection=None):
+        self.collection = collection
+        self.filters = list(filters)
+        self.orders = list(orders)
+        self.limit_count = limit_count
+        self.cursor = cursor
+        self.projection = projection
+
+    def _copy(self, **changes):
+        params = dict(
+            filters=self.filters, orders=self.orders,
+            limit_count=self.limit_count, cursor=self.cursor, projection=self.projection
+        )
+        params.update(changes)
+        return FakeQuery(self.collection, **params)
+
+    def where(self, field, op, value):
+        return self._copy(filters=self.filters + [(field, op, value)])
+
+    def order_by(self, field, direction=firestore.Query.ASCENDING):
+        return self._copy(orders=self.orders + [(field, direction)])
+
+    def limit(self, count):
+        return self._copy(limit_count=count)
+
+    def select(self, field_paths):
+        return self._copy(projection=list(field_paths))
+
+    def start_after(self, values):
+        return self._copy(cursor=(values, False))
+
+    def start_at(self, values):
+        return self._copy(cursor=(values, True))
+
+    def count(self):
+        return FakeAggregationQuery(len(list(self.stream())))
+
+    def _sort_key(self, snapshot):
+        data = snapshot.to_dict()
+        return tuple(
+            snapshot.id if field == "__name__" else _normalize(data.get(field))
+            for field, _ in self.orders
+        ) + (snapshot.id,)
+
+    def stream(self):
+        snapshots = []
+        for doc_id, data in list(self.collection.documents.items()):
+            if all(
+                field in data and data[field] is not None
+                and _OPERATORS[op](_normalize(data[field]), _normalize(value))
+                for field, op, value in self.filters
+            ):
+                snapshots.append(FakeSnapshot(self.collection.document(doc_id), data))
+
+        descending = bool(self.orders) and self.orders[0][1] == firestore.Query.DESCENDING
+        snapshots.sort(key=self._sort_key, reverse=descending)
+
+        if self.cursor is not None:
+            values, inclusive = self.cursor
+            cursor = tuple(_normalize(values.get(field)) for field, _ in self.orders)
+
+            def after_cursor(snapshot):
+                key = tuple(_normalize(value) for value in self._sort_key(snapshot)[:len(cursor)])
+                if key == cursor:
+                    return inclusive
+                return key < cursor if descending else key > cursor
+
+            snapshots = [snapshot for snapshot in snapshots if after_cursor(snapshot)]
+
+        if self.limit_count is not None:
+            snapshots = snapshots[:self.limit_count]
+        if self.projection is not None:
+            snapshots = [
+                FakeSnapshot(snapshot.reference, {
+                    field: value for field, value in snapshot.to_dict().items() if field in self.projection
+                })
+                for snapshot in snapshots
+            ]
+        return iter(snapshots)
+
+
+class FakeAggregationResult:
+    def __init__(self, value):
+        self.value = value
+
+
+class FakeAggregationQuery:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return [[FakeAggregationResult(self.value)]]
+
+
+class FakeCollection(FakeQuery):
+    def __init__(self, client, name):
+        super().__init__(self)
+        self.client = client
+        self.name = name
+        self.documents = {}
+
+    def document(self, doc_id):
+        return FakeDocumentReference(self, doc_id)
+
+
+class FakeBatch:
+    def __init__(self, client):
+        self.client = client
+        self.writes = []
+
+    def set(self, doc_ref, data, merge=False):
+        self.writes.append(("set", doc_ref, data, merge))
+
+    def delete(self, doc_ref):
+        self.writes.append(("delete", doc_ref, None, False))
+
+    def commit(self):
+        if len(self.writes) > 500:
+            raise ValueError("Batch exceeds 500 operations")
+        self.client.commits.append(len(self.writes))
+        for action, doc_ref, data, merge in self.writes:
+            if action == "set":
+                doc_ref.set(data, merge=merge)
+            else:
+                doc_ref.delete()
+
+
+class FakeFirestoreClient:
+    """In-memory client supporting collections, queries, batches and get_all."""
+
+    _now = None
+
+    def __init__(self):
+        self.collections = {}
+        self.commits = []
+        self.deletes = 0
+
+    @classmethod
+    def now(cls):
+        return cls._now or datetime.now(timezone.utc)
+
+    def collection(self, name):
+        if name not in self.collections:
+            self.collections[name] = FakeCollection(self, name)
+        return self.collections[name]
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def get_all(self, references):
+        return [reference.get() for reference in references]
@@ -0,0 +1,146 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for conversation context compaction."""
+
+import asyncio
+from typing import AsyncGenerator, List
+
+import pytest
+from google.adk.agents import LlmAgent
+from google.adk.apps import App
+from google.adk.apps.llm_event_summarizer import LlmEventSummarizer
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from mas_system.compaction import SUMMARY_PROMPT, build_compaction_config
+from mas_system.router import FastPathRouter
+
+pytest_plugins = ("pytest_asyncio",)
+
+PADDING = "Some detail about the conversation so far. " * 20
+
+SUMMARY_REQUEST = SUMMARY_PROMPT.split("{conversation_history}")[0]
+
+
+def content_chars(contents: List[types.Content]) -> int:
+    return sum(len(part.text or "") for content in contents for part in content.parts or [])
+
+
+class FakeLlm(BaseLlm):
+    """Answers every turn with a long reply and reports ~4 characters per prompt token.
+
+    Summary requests (the compaction prompt) are answered with a short summary.
+    `base_latency` and `latency_per_token` simulate a model whose latency grows
+    with the prompt.
+    """
+
+    model: str = "fake-llm"
+    base_latency: float = 0.0
+    latency_per_token: float = 0.0
+    prompt_tokens: List[int] = []
+    summaries: int = 0
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        tokens = content_chars(llm_request.contents) // 4
+        if llm_request.contents[-1].parts[0].text.startswith(SUMMARY_REQUEST):
+            self.summaries += 1
+            text = f"Summary {self.summaries}: the user has been chatting about the weather."
+        else:
+            self.prompt_tokens.append(tokens)
+            text = f"Reply {len(self.prompt_tokens)}. {PADDING}"
+        await asyncio.sleep(self.base_latency + tokens * self.latency_per_token)
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(prompt_token_count=tokens),
+        )
+
+
+def make_app(llm: FakeLlm, compaction: bool = True, token_threshold: int = 1500, retain_events: int = 6) -> App:
+    coordinator = LlmAgent(name="mas_coordinator", model=llm, instruction="Answer the user.")
+    router = FastPathRouter(name="mas_router", fallback_agent=coordinator.name, sub_agents=[coordinator])
+    config = None
+    if compaction:
+        summarizer = LlmEventSummarizer(llm=llm, prompt_template=SUMMARY_PROMPT)
+        config = build_compaction_config(token_threshold=token_threshold, retain_events=retain_events, summarizer=summarizer)
+    return App(name="mas_system", root_agent=router, events_compaction_config=config)
+
+
+async def run_conversation(app: App, turns: int) -> None:
+    runner = InMemoryRunner(app=app)
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id="test_user")
+    for turn in range(turns):
+        message = types.UserContent(parts=[types.Part(text=f"Question {turn}: tell me more about the forecast")])
+        async for _ in runner.run_async(user_id="test_user", session_id=session.id, new_message=message):
+            pass
+    return await runner.session_service.get_session(app_name=runner.app_name, user_id="test_user", session_id=session.id)
+
+
+@pytest.mark.asyncio
+async def test_prompt_grows_without_compaction():
+    llm = FakeLlm(prompt_tokens=[])
+    await run_conversation(make_app(llm, compaction=False), 30)
+
+    assert llm.prompt_tokens[-1] > 10 * llm.prompt_tokens[0]
+    assert llm.summaries == 0
+
+
+@pytest.mark.asyncio
+async def test_compaction_keeps_prompt_bounded():
+    llm = FakeLlm(prompt_tokens=[])
+    session = await run_conversation(make_app(llm), 100)
+
+    assert llm.summaries > 0
+    # Threshold plus the events of one turn past it
+    assert max(llm.prompt_tokens) < 1500 + 400
+    # The session keeps the full history; only the prompt is compacted
+    user_turns = [event for event in session.events if event.author == "user" and not event.actions.compaction]
+    assert len(user_turns) == 100
+    assert any(event.actions.compaction for event in session.events)
+
+
+@pytest.mark.asyncio
+async def test_recent_turns_stay_verbatim():
+    llm = FakeLlm(prompt_tokens=[])
+    app = make_app(llm)
+    recorded = []
+    original = llm.generate_content_async
+
+    async def record(llm_request, stream=False):
+        recorded.append([part.text for content in llm_request.contents for part in content.parts if part.text])
+        async for response in original(llm_request, stream):
+            yield response
+
+    object.__setattr__(llm, "generate_content_async", record)
+    await run_conversation(app, 40)
+
+    last_prompt = "\n".join(recorded[-1])
+    assert "Summary" in last_prompt
+    assert "Question 39" in last_prompt
+    assert "Question 38" in last_prompt
+    assert "Question 0:" not in last_prompt
+
+
+def test_build_compaction_config_defaults():
+    config = build_compaction_config(token_threshold=100, retain_events=3)
+
+    assert config.token_threshold == 100
+    assert config.event_retention_size == 3
+    assert config.summarizer is not None
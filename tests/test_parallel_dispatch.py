@@ -0,0 +1,183 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for parallel dispatch of compound requests."""
+
+import asyncio
+import time
+from typing import AsyncGenerator
+
+import pytest
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from mas_system.parallel_dispatch import TRACE_KEY
+from mas_system.router import (
+    FastPathRouter,
+    get_fast_path_stats,
+    plan_compound_request,
+    reset_fast_path_stats,
+    split_compound_request,
+)
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+class SlowEchoAgent(BaseAgent):
+    """Waits, then answers with its name and the request it was given."""
+
+    delay: float = 0.0
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        await asyncio.sleep(self.delay)
+        request = ctx.user_content.parts[0].text
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            branch=ctx.branch,
+            actions=EventActions(state_delta={f"last_{self.name}": request}),
+            content=types.ModelContent(parts=[types.Part(text=f"{self.name}: {request}")]),
+        )
+
+
+def make_router(delay=0.2, **kwargs) -> FastPathRouter:
+    return FastPathRouter(
+        name="mas_router",
+        fallback_agent="mas_coordinator",
+        sub_agents=[
+            SlowEchoAgent(name="mas_coordinator"),
+            SlowEchoAgent(name="greeter_agent", delay=delay),
+            SlowEchoAgent(name="weather_agent", delay=delay),
+            SlowEchoAgent(name="rag_agent", delay=delay),
+        ],
+        **kwargs,
+    )
+
+
+async def run_turn(router, message):
+    runner = InMemoryRunner(agent=router)
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id="test_user")
+    events = []
+    async for event in runner.run_async(
+        user_id="test_user",
+        session_id=session.id,
+        new_message=types.UserContent(parts=[types.Part(text=message)]),
+    ):
+        events.append(event)
+    session = await runner.session_service.get_session(
+        app_name=runner.app_name, user_id="test_user", session_id=session.id
+    )
+    return events, session
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_fast_path_stats()
+    yield
+    reset_fast_path_stats()
+
+
+def test_split_compound_request():
+    assert split_compound_request("Hi! greet me, weather in Oslo and then list my corpora.") == [
+        "Hi",
+        "greet me",
+        "weather in Oslo",
+        "list my corpora",
+    ]
+
+
+@pytest.mark.parametrize(
+    "message, agents",
+    [
+        (
+            "greet me, give me London weather and search my corpus for onboarding",
+            ["greeter_agent", "weather_agent", "rag_agent"],
+        ),
+        ("Good morning. List my corpora please", ["greeter_agent", "rag_agent"]),
+        ("Hello!", []),
+        # The second clause has no intent of its own
+        ("weather in Paris and London", []),
+        # Academic clauses need the coordinator
+        ("hello and find papers on transformers", []),
+        # A single clause that touches two domains is ambiguous
+        ("hi, search my corpus for weather reports", []),
+    ],
+)
+def test_plan_compound_request(message, agents):
+    assert [task["agent"] for task in plan_compound_request(message)] == agents
+
+
+def test_plan_respects_task_limit_and_clause_fallback():
+    message = "hi, weather in Oslo, list my corpora, forecast for Rome"
+    assert plan_compound_request(message, max_tasks=3) == []
+
+    plan = plan_compound_request("hi, how hot is Cairo", classify_clause=lambda clause: "weather_agent")
+    assert [task["agent"] for task in plan] == ["greeter_agent", "weather_agent"]
+
+
+async def test_compound_request_runs_agents_concurrently():
+    started = time.perf_counter()
+    events, session = await run_turn(
+        make_router(), "greet me, give me London weather and search my corpus for onboarding"
+    )
+    elapsed = time.perf_counter() - started
+
+    # Three 0.2 s agents finish in about the time of one
+    assert elapsed < 0.5
+
+    calls, responses, final = events
+    assert [call.name for call in calls.get_function_calls()] == ["greeter_agent", "weather_agent", "rag_agent"]
+    assert [response.name for response in responses.get_function_responses()] == [
+        "greeter_agent",
+        "weather_agent",
+        "rag_agent",
+    ]
+    assert final.content.parts[0].text == (
+        "greeter_agent: greet me\n\n"
+        "weather_agent: give me London weather\n\n"
+        "rag_agent: search my corpus for onboarding"
+    )
+
+    trace = final.custom_metadata[TRACE_KEY]
+    assert [task["status"] for task in trace["tasks"]] == ["ok", "ok", "ok"]
+    assert trace["critical_path"][-1] == "synthesis"
+    assert trace["sequential_ms"] > 2 * trace["fan_out_ms"]
+
+    # State written by the sub-agents reaches the parent session
+    assert session.state["last_weather_agent"] == "give me London weather"
+    assert get_fast_path_stats() == {"parallel": 1}
+
+
+async def test_single_intent_and_disabled_dispatch_use_normal_routing():
+    events, _ = await run_turn(make_router(delay=0), "Hello!")
+    assert [event.author for event in events] == ["greeter_agent"]
+
+    events, _ = await run_turn(make_router(delay=0, parallel_enabled=False), "hi, list my corpora")
+    assert [event.author for event in events] == ["mas_coordinator"]
+
+
+async def test_synthesizer_and_timeouts():
+    router = make_router(delay=0, synthesizer=SlowEchoAgent(name="mas_synthesizer"))
+    events, _ = await run_turn(router, "hi, list my corpora")
+    answer = events[-1].content.parts[0].text
+    assert answer.startswith("mas_synthesizer: User message: hi, list my corpora")
+    assert "greeter_agent: hi" in answer
+
+    events, _ = await run_turn(make_router(delay=1.0, task_timeout=0.05), "hi, list my corpora")
+    trace = events[-1].custom_metadata[TRACE_KEY]
+    assert [task["status"] for task in trace["tasks"]] == ["timeout", "timeout"]
+    assert "did not answer" in events[-1].content.parts[0].text
@@ -0,0 +1,83 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the RAG agent's lazy Vertex AI loading."""
+
+import sys
+import threading
+import types
+
+import pytest
+
+from mas_system.sub_agents.rag_agent import utils
+
+
+@pytest.fixture
+def fake_vertexai(monkeypatch):
+    """Install stand-ins for vertexai and vertexai.preview.rag."""
+    calls = []
+    rag = types.ModuleType("vertexai.preview.rag")
+    preview = types.ModuleType("vertexai.preview")
+    preview.rag = rag
+    vertexai = types.ModuleType("vertexai")
+    vertexai.preview = preview
+    vertexai.init = lambda **kwargs: calls.append(kwargs)
+    monkeypatch.setitem(sys.modules, "vertexai", vertexai)
+    monkeypatch.setitem(sys.modules, "vertexai.preview", preview)
+    monkeypatch.setitem(sys.modules, "vertexai.preview.rag", rag)
+    monkeypatch.setattr(utils, "_rag", None)
+    monkeypatch.setattr(utils, "GOOGLE_CLOUD_PROJECT", "test-project")
+    monkeypatch.setattr(utils, "GOOGLE_CLOUD_LOCATION", "us-central1")
+    return rag, calls
+
+
+def get_rag_with_timeout(timeout=5):
+    """Call get_rag() on a daemon thread so a deadlock fails the test instead of hanging it."""
+    results = []
+    thread = threading.Thread(target=lambda: results.append(utils.get_rag()), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "get_rag() did not return"
+    return results[0]
+
+
+def test_get_rag_imports_and_initializes_once(fake_vertexai):
+    rag, calls = fake_vertexai
+
+    assert get_rag_with_timeout() is rag
+    assert get_rag_with_timeout() is rag
+    assert calls == [{"project": "test-project", "location": "us-central1"}]
+
+
+def test_get_rag_does_not_block_across_threads(fake_vertexai):
+    rag, calls = fake_vertexai
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(utils.get_rag()), daemon=True) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert results == [rag] * 8
+    assert len(calls) == 1
+
+
+def test_get_rag_skips_init_without_project(fake_vertexai, monkeypatch):
+    rag, calls = fake_vertexai
+    monkeypatch.setattr(utils, "GOOGLE_CLOUD_PROJECT", None)
+
+    assert get_rag_with_timeout() is rag
+    assert calls == []
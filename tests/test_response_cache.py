@@ -0,0 +1,161 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the agent response cache."""
+
+from types import SimpleNamespace
+
+from google.adk.events import Event
+from google.genai import types
+
+from mas_system.cache_generations import CORPUS, VOLATILE, bump_for_tool, bump_generation
+from mas_system.response_cache import (
+    ResponseCache,
+    collect_agent_names,
+    response_cache_key,
+    responding_agents,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_cache(**kwargs):
+    clock = FakeClock()
+    ttls = {"greeter_agent": 3600, "weather_agent": 300, "rag_agent": 600}
+    return ResponseCache(ttls=ttls, default_ttl=0, clock=clock, **kwargs), clock
+
+
+def test_key_normalizes_message_and_separates_state():
+    assert response_cache_key("  Hello!", "greeter_agent") == response_cache_key("hello", "greeter_agent")
+    assert response_cache_key("hello", "greeter_agent") != response_cache_key("hello", "mas_coordinator")
+    assert response_cache_key("list files", "rag_agent", {"current_corpus": "a"}) != response_cache_key(
+        "list files", "rag_agent", {"current_corpus": "b"}
+    )
+
+
+def test_entries_expire_per_agent_ttl():
+    cache, clock = make_cache()
+    greeting = response_cache_key("hello", "greeter_agent")
+    weather = response_cache_key("weather in oslo", "weather_agent")
+
+    assert cache.put(greeting, "Hi!", "greeter_agent", ["greeter_agent"], cache.snapshot())
+    assert cache.put(weather, "Sunny", "weather_agent", ["weather_agent"], cache.snapshot())
+    assert cache.get(weather).response == "Sunny"
+
+    clock.now = 301
+    assert cache.get(weather) is None
+    assert cache.get(greeting).author == "greeter_agent"
+
+    # Answers combining several agents live as long as the shortest TTL
+    both = response_cache_key("hi, weather in oslo?", "mas_coordinator")
+    cache.put(both, "Hi! Sunny", "mas_coordinator", ["greeter_agent", "weather_agent"], cache.snapshot())
+    clock.now = 602
+    assert cache.get(both) is None
+
+
+def test_uncacheable_turns_are_skipped():
+    cache, _ = make_cache()
+    key = response_cache_key("tell me a joke", "mas_coordinator")
+
+    # The coordinator answering alone uses the default TTL, which is off
+    assert not cache.put(key, "A joke", "mas_coordinator", [], cache.snapshot())
+    assert not cache.put(key, "", "greeter_agent", ["greeter_agent"], cache.snapshot())
+
+    before = cache.snapshot()
+    bump_generation(VOLATILE)
+    assert not cache.put(key, "Your lucky number is 7", "weather_agent", ["weather_agent"], before)
+
+    assert cache.get(key) is None
+    assert cache.stats()["skipped"] == 3
+
+
+def test_corpus_mutation_invalidates_rag_answers_only():
+    cache, _ = make_cache()
+    corpora = response_cache_key("list my corpora", "rag_agent")
+    greeting = response_cache_key("hello", "greeter_agent")
+    cache.put(corpora, "docs, notes", "rag_agent", ["rag_agent"], cache.snapshot())
+    cache.put(greeting, "Hi!", "greeter_agent", ["greeter_agent"], cache.snapshot())
+
+    bump_generation(CORPUS)
+
+    assert cache.get(corpora) is None
+    assert cache.get(greeting).response == "Hi!"
+    assert cache.stats()["invalidations"] == 1
+
+    # A turn that mutated a corpus is never stored
+    before = cache.snapshot()
+    bump_generation(CORPUS)
+    create = response_cache_key("create a corpus called docs", "rag_agent")
+    assert not cache.put(create, "Created docs", "rag_agent", ["rag_agent"], before)
+
+
+def test_tool_callback_bumps_the_tool_scope():
+    cache, _ = make_cache()
+    corpora = response_cache_key("list my corpora", "rag_agent")
+    cache.put(corpora, "docs, notes", "rag_agent", ["rag_agent"], cache.snapshot())
+
+    # Read-only tools leave cached answers alone
+    assert bump_for_tool(SimpleNamespace(name="list_corpora"), {}, None, {"status": "success"}) is None
+    assert cache.get(corpora).response == "docs, notes"
+
+    assert bump_for_tool(SimpleNamespace(name="add_data"), {}, None, {"status": "success"}) is None
+    assert cache.get(corpora) is None
+
+
+def test_lru_eviction_and_hit_rate():
+    cache, _ = make_cache(maxsize=2)
+    keys = [response_cache_key(f"weather in city {n}", "weather_agent") for n in range(3)]
+    cache.put(keys[0], "a", "weather_agent", ["weather_agent"], cache.snapshot())
+    cache.put(keys[1], "b", "weather_agent", ["weather_agent"], cache.snapshot())
+    cache.get(keys[0])
+    cache.put(keys[2], "c", "weather_agent", ["weather_agent"], cache.snapshot())
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]).response == "a"
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hit_rate"] == 2 / 3
+
+
+def test_responding_agents_from_authors_and_agent_tool_calls():
+    from mas_system.agent import root_agent
+
+    names = collect_agent_names(root_agent)
+    assert {"mas_router", "mas_coordinator", "weather_agent", "academic_websearch_wrapper"} <= names
+
+    routers = {"mas_router", "mas_coordinator"}
+    delegated = Event(
+        author="mas_coordinator",
+        content=types.ModelContent(
+            parts=[types.Part(function_call=types.FunctionCall(name="rag_agent", args={"request": "list"}))]
+        ),
+    )
+    answer = Event(author="mas_coordinator", content=types.ModelContent(parts=[types.Part(text="docs")]))
+    direct = Event(
+        author="weather_agent",
+        content=types.ModelContent(
+            parts=[types.Part(function_call=types.FunctionCall(name="get_current_weather", args={}))]
+        ),
+    )
+
+    assert responding_agents([delegated, answer], names, routers) == ["rag_agent"]
+    assert responding_agents([direct], names, routers) == ["weather_agent"]
+    assert responding_agents([answer], names, routers) == []
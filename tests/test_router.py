@@ -0,0 +1,227 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the keyword fast-path router."""
+
+from typing import AsyncGenerator
+
+import pytest
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from mas_system.router import (
+    FastPathRouter,
+    classify_intent,
+    get_fast_path_stats,
+    reset_fast_path_stats,
+)
+from mas_system.semantic_router import CentroidIndex, HashingEmbedder
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+class EchoAgent(BaseAgent):
+    """Replies with its own name so tests can see who answered."""
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        yield Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            branch=ctx.branch,
+            content=types.ModelContent(parts=[types.Part(text=self.name)]),
+        )
+
+
+def make_router(**kwargs) -> FastPathRouter:
+    return FastPathRouter(
+        name="mas_router",
+        fallback_agent="mas_coordinator",
+        sub_agents=[
+            EchoAgent(name="mas_coordinator"),
+            EchoAgent(name="greeter_agent"),
+            EchoAgent(name="weather_agent"),
+            EchoAgent(name="rag_agent"),
+        ],
+        **kwargs,
+    )
+
+
+async def ask(runner: InMemoryRunner, session_id: str, message) -> list:
+    if isinstance(message, str):
+        message = types.UserContent(parts=[types.Part(text=message)])
+    authors = []
+    async for event in runner.run_async(user_id="test_user", session_id=session_id, new_message=message):
+        authors.append(event.author)
+    return authors
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_fast_path_stats()
+    yield
+    reset_fast_path_stats()
+
+
+@pytest.mark.parametrize(
+    "message, agent",
+    [
+        ("Hello!", "greeter_agent"),
+        ("good morning everyone", "greeter_agent"),
+        ("Hi, I'm Alex", "greeter_agent"),
+        ("What's the weather in New York?", "weather_agent"),
+        ("forecast for Tokyo this week", "weather_agent"),
+        ("Will it rain in Seattle tomorrow?", "weather_agent"),
+        ("List my corpora", "rag_agent"),
+        ("Which knowledge bases are available?", "rag_agent"),
+    ],
+)
+def test_classify_obvious_intents(message, agent):
+    decision = classify_intent(message)
+    assert decision["agent"] == agent
+    assert decision["confidence"] >= 0.8
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "Hello, can you find recent papers on transformers?",
+        "Tell me about quantum computing",
+        "Query the corpus for the onboarding policy",
+        "",
+        "weather in " + "x" * 200,
+    ],
+)
+def test_classify_falls_through(message):
+    assert classify_intent(message)["agent"] is None
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "What's the weather in Paris and find papers on climate research",
+        "weather in Paris and then tell me a joke",
+    ],
+)
+def test_mixed_requests_have_low_confidence(message):
+    decision = classify_intent(message)
+    assert decision["agent"] == "weather_agent"
+    assert decision["confidence"] < 0.8
+
+
+async def test_router_dispatches_and_falls_back():
+    runner = InMemoryRunner(agent=make_router())
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id="test_user")
+
+    assert await ask(runner, session.id, "Hello!") == ["greeter_agent"]
+    assert await ask(runner, session.id, "What's the weather in Boston?") == ["weather_agent"]
+    # A follow-up turn starts at the router again, not at the last responder
+    assert await ask(runner, session.id, "Summarize that for me") == ["mas_coordinator"]
+    assert await ask(runner, session.id, "List my corpora") == ["rag_agent"]
+
+    assert get_fast_path_stats() == {
+        "greeter_agent": 1,
+        "weather_agent": 1,
+        "rag_agent": 1,
+        "fallback": 1,
+    }
+
+
+def test_select_predicts_route_without_counting():
+    router = make_router()
+
+    assert router.select(types.UserContent(parts=[types.Part(text="Hello!")])).name == "greeter_agent"
+    assert router.select(types.UserContent(parts=[types.Part(text="Why?")])).name == "mas_coordinator"
+    assert get_fast_path_stats() == {}
+
+
+def test_keyword_target_ignores_semantic_stage_and_fallback():
+    index = CentroidIndex(
+        {"weather_agent": ["And tomorrow?"], "mas_coordinator": ["Tell me a story"]},
+        embedder=HashingEmbedder(),
+        min_score=0.0,
+        min_margin=0.0,
+    )
+    router = make_router(semantic_index=index)
+
+    def target(text):
+        return router.keyword_target(types.UserContent(parts=[types.Part(text=text)]))
+
+    assert target("What's the weather in Boston?").name == "weather_agent"
+    # Follow-ups depend on the conversation, so no keyword route is given
+    assert router.select(types.UserContent(parts=[types.Part(text="And tomorrow?")])).name == "weather_agent"
+    assert target("And tomorrow?") is None
+    assert target("Summarize that for me") is None
+    assert make_router(enabled=False).keyword_target(types.UserContent(parts=[types.Part(text="Hello!")])) is None
+
+
+async def test_router_falls_back_for_non_text_and_when_disabled():
+    runner = InMemoryRunner(agent=make_router())
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id="test_user")
+    image = types.UserContent(
+        parts=[types.Part(text="Hello!"), types.Part.from_bytes(data=b"\x89PNG", mime_type="image/png")]
+    )
+    assert await ask(runner, session.id, image) == ["mas_coordinator"]
+
+    runner = InMemoryRunner(agent=make_router(enabled=False))
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id="test_user")
+    assert await ask(runner, session.id, "Hello!") == ["mas_coordinator"]
+
+
+async def test_router_semantic_stage_covers_keyword_misses():
+    index = CentroidIndex(
+        {
+            "mas_coordinator": ["Find papers on transformers", "Search for recent AI research"],
+            "rag_agent": ["Create a new corpus", "Delete a document from the corpus", "Add files to my corpus"],
+            "weather_agent": ["What's the weather in London?", "Temperature in Tokyo"],
+        },
+        embedder=HashingEmbedder(),
+        min_score=0.2,
+        min_margin=0.1,
+    )
+    runner = InMemoryRunner(agent=make_router(semantic_index=index))
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id="test_user")
+
+    # Keyword rules still answer first; the semantic stage catches paraphrases
+    assert await ask(runner, session.id, "Hello!") == ["greeter_agent"]
+    assert await ask(runner, session.id, "Create a corpus for my notes") == ["rag_agent"]
+    # Nearest to the coordinator's centroid, or chained requests, still fall back
+    assert await ask(runner, session.id, "Find papers on diffusion models") == ["mas_coordinator"]
+    assert await ask(runner, session.id, "Create a corpus and then tell me a joke") == ["mas_coordinator"]
+
+    assert get_fast_path_stats() == {"greeter_agent": 1, "rag_agent": 1, "fallback": 2}
+
+
+def test_root_agent_routes_through_fast_path():
+    from mas_system.agent import mas_coordinator, root_agent
+
+    assert isinstance(root_agent, FastPathRouter)
+    assert root_agent.fallback_agent == mas_coordinator.name
+    assert {agent.name for agent in root_agent.sub_agents} == {
+        "mas_coordinator",
+        "greeter_agent",
+        "weather_agent",
+        "rag_agent",
+    }
+
+
+def test_semantic_index_from_agent_descriptions_and_scenarios():
+    from mas_system.agent import build_semantic_index
+
+    index = build_semantic_index(embedder=HashingEmbedder())
+
+    assert set(index.labels) == {"greeter_agent", "weather_agent", "rag_agent", "mas_coordinator"}
+    assert index.classify("Give me a 5-day forecast for Chicago")["agent"] == "weather_agent"
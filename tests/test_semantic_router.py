@@ -0,0 +1,120 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the embedding-based semantic router."""
+
+import numpy as np
+import pytest
+
+from mas_system.semantic_router import (
+    CentroidIndex,
+    HashingEmbedder,
+    build_routing_examples,
+    create_embedder,
+    load_test_scenarios,
+)
+
+EXAMPLES = {
+    "greeter_agent": ["Hello!", "Good morning", "Goodbye"],
+    "weather_agent": ["What's the weather in London?", "Forecast for New York", "Temperature in Tokyo"],
+    "rag_agent": ["List my document collections", "Create a new corpus", "Delete a document from the corpus"],
+}
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self):
+        super().__init__(dimensions=256)
+        self.calls = 0
+
+    def __call__(self, texts):
+        self.calls += 1
+        return super().__call__(texts)
+
+
+def test_hashing_embedder_is_deterministic_and_normalized():
+    first = HashingEmbedder(dimensions=128)(["weather in Paris", "hello"])
+    second = HashingEmbedder(dimensions=128)(["weather in Paris", "hello"])
+
+    assert first.shape == (2, 128)
+    np.testing.assert_array_equal(first, second)
+    np.testing.assert_allclose(np.linalg.norm(first, axis=1), 1.0, rtol=1e-5)
+    # Messages made only of stopwords embed to zeros instead of NaNs
+    assert not np.isnan(HashingEmbedder(dimensions=16)(["what is the"])).any()
+
+
+def test_create_embedder_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        create_embedder("word2vec")
+
+
+def test_index_routes_to_nearest_centroid():
+    index = CentroidIndex(EXAMPLES, embedder=HashingEmbedder(), min_score=0.2, min_margin=0.1)
+
+    results = index.classify_batch(["What's the weather in Berlin?", "list my corpus documents", "Hello"])
+
+    assert [result["agent"] for result in results] == ["weather_agent", "rag_agent", "greeter_agent"]
+    assert all(result["margin"] >= 0.1 for result in results)
+    assert index.classify_batch([]) == []
+
+
+def test_index_abstains_on_weak_or_ambiguous_matches():
+    index = CentroidIndex(EXAMPLES, embedder=HashingEmbedder(), min_score=0.2, min_margin=0.1)
+
+    unrelated = index.classify("Translate this sentence into Klingon")
+    assert unrelated["agent"] is None
+    assert unrelated["label"] in EXAMPLES
+
+    strict = CentroidIndex(EXAMPLES, embedder=HashingEmbedder(), min_score=0.2, min_margin=2.0)
+    assert strict.classify("What's the weather in Berlin?")["agent"] is None
+
+
+def test_index_builds_centroids_once_on_first_use():
+    embedder = CountingEmbedder()
+    index = CentroidIndex(EXAMPLES, embedder=embedder)
+    assert embedder.calls == 0
+
+    index.classify("hello")
+    index.classify("weather in Rome")
+    # One call builds the centroids, then one per lookup
+    assert embedder.calls == 3
+
+
+def test_index_needs_two_agents():
+    with pytest.raises(ValueError):
+        CentroidIndex({"greeter_agent": ["Hello"]}, embedder=HashingEmbedder())
+
+
+def test_load_test_scenarios_reads_frontend_routes():
+    scenarios = load_test_scenarios()
+
+    assert {"greeter", "weather", "rag", "academic"} <= set(scenarios)
+    assert scenarios["weather"][0]["message"]
+
+
+def test_load_test_scenarios_handles_missing_definitions(tmp_path):
+    assert load_test_scenarios(str(tmp_path / "missing.py")) == {}
+
+    source = tmp_path / "routes.py"
+    source.write_text('OTHER = {"weather": []}\nTEST_SCENARIOS = {"weather": [{"message": "rain?"}]}\n')
+    assert load_test_scenarios(str(source)) == {"weather": [{"message": "rain?"}]}
+
+
+def test_build_routing_examples_maps_scenarios_to_agents():
+    examples = build_routing_examples(
+        descriptions={"weather_agent": ["Handles weather"]},
+        scenarios={"weather": [{"message": "Rain in Oslo?"}], "unmapped": [{"message": "x"}]},
+        scenario_agents={"weather": "weather_agent"},
+    )
+
+    assert examples == {"weather_agent": ["Handles weather", "Rain in Oslo?"]}
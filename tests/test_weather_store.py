@@ -0,0 +1,459 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Offline unit tests for weather storage, using an in-memory Firestore fake."""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fake_firestore import FakeBatch, FakeFirestoreClient
+from mas_system.sub_agents.weather_agent.tools import weather_storage, weather_store
+from mas_system.sub_agents.weather_agent.tools.sqlite_store import SQLiteWeatherBackend
+from mas_system.sub_agents.weather_agent.tools.write_behind import WriteBehindQueue
+
+
+CURRENT_RESULT = {
+    "location": "London, England, United Kingdom",
+    "temperature": 64,
+    "unit": "fahrenheit",
+    "description": "Partly cloudy",
+    "humidity": 71,
+    "wind_speed": 10,
+    "feels_like": 63,
+    "precipitation_probability": 10,
+    "timestamp": "2025-06-01T12:00",
+    "coordinates": {"latitude": 51.50853, "longitude": -0.12574},
+}
+
+
+def observation(n, **fields):
+    """CURRENT_RESULT as returned in the n-th 15-minute Open-Meteo update window."""
+    api_time = datetime(2025, 6, 1, 12) + timedelta(minutes=15 * n)
+    return dict(CURRENT_RESULT, timestamp=api_time.strftime("%Y-%m-%dT%H:%M"), **fields)
+
+
+@pytest.fixture
+def fake_firestore(monkeypatch):
+    client = FakeFirestoreClient()
+    monkeypatch.setattr(weather_store, "_firestore_client", client)
+    weather_store._saved_observations.clear()
+    write_queue = WriteBehindQueue(
+        weather_store._write_weather_batch, flush_interval=0.05, sleep=lambda seconds: None
+    )
+    weather_store.set_write_queue(write_queue)
+    yield client
+    write_queue.close()
+    weather_store.set_write_queue(None)
+    weather_store._saved_observations.clear()
+
+
+def test_save_weather_data_is_buffered_and_batched(fake_firestore):
+    doc_ids = [weather_store.save_weather_data(observation(i), "current") for i in range(3)]
+    assert all(doc_ids)
+    assert weather_store.flush_weather_writes(timeout=5)
+
+    documents = fake_firestore.collection("weather_current").documents
+    assert set(documents) == set(doc_ids)
+    assert documents[doc_ids[0]]["temperature"] == 64
+    # Each observation is written with its rollup update
+    assert sum(fake_firestore.commits) == 6
+    assert len(fake_firestore.commits) < 3
+
+
+def test_write_behind_queue_splits_batches_at_max_size():
+    batches = []
+    write_queue = WriteBehindQueue(batches.append, max_batch_size=4, flush_interval=0.05)
+    for i in range(10):
+        assert write_queue.submit(i)
+    write_queue.close()
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [record for batch in batches for record in batch] == list(range(10))
+    assert write_queue.stats()["written"] == 10
+
+
+def test_write_behind_queue_applies_backpressure_by_dropping():
+    release = threading.Event()
+
+    def slow_write(batch):
+        release.wait(5)
+
+    write_queue = WriteBehindQueue(
+        slow_write, max_batch_size=1, flush_interval=0.01, max_queue_size=2, put_timeout=0.01
+    )
+    results = [write_queue.submit(i) for i in range(10)]
+    release.set()
+    write_queue.close()
+
+    assert not all(results)
+    assert write_queue.stats()["dropped"] == results.count(False)
+
+
+def test_write_behind_queue_flush_and_close_time_out_when_full():
+    release = threading.Event()
+
+    def stalled_write(batch):
+        release.wait(5)
+
+    write_queue = WriteBehindQueue(stalled_write, max_batch_size=1, flush_interval=0.01, max_queue_size=1)
+    write_queue.submit("first")
+    time.sleep(0.05)
+    # The worker is stuck on the first record and the queue is full
+    write_queue.submit("second")
+
+    start = time.monotonic()
+    assert not write_queue.flush(timeout=0.1)
+    write_queue.close(timeout=0.1)
+    assert time.monotonic() - start < 1
+    release.set()
+
+
+def test_write_behind_queue_flushes_on_close_and_counts_failures():
+    def failing_write(batch):
+        raise RuntimeError("unavailable")
+
+    write_queue = WriteBehindQueue(failing_write, flush_interval=10, max_retries=2, sleep=lambda seconds: None)
+    write_queue.submit("record")
+    start = time.monotonic()
+    write_queue.close()
+
+    assert time.monotonic() - start < 5
+    assert write_queue.stats()["failed"] == 1
+    assert write_queue.stats()["retries"] == 2
+    assert not write_queue.submit("late record")
+    # The worker is gone; flushing must not wait for it
+    assert write_queue.flush()
+
+
+def test_write_behind_queue_retries_failed_batches_with_backoff():
+    attempts = []
+    delays = []
+
+    def flaky_write(batch):
+        attempts.append(list(batch))
+        if len(attempts) == 1:
+            raise RuntimeError("unavailable")
+
+    write_queue = WriteBehindQueue(flaky_write, flush_interval=0.01, retry_backoff=0.5, sleep=delays.append)
+    write_queue.submit("record")
+    assert write_queue.flush(timeout=5)
+    write_queue.close()
+
+    assert attempts == [["record"], ["record"]]
+    assert delays == [0.5]
+    assert write_queue.stats()["written"] == 1
+    assert write_queue.stats()["failed"] == 0
+    assert write_queue.stats()["retries"] == 1
+
+
+def test_statistics_are_served_from_daily_rollups(fake_firestore):
+    readings = [(60, 70, "Clear sky"), (70, None, "Overcast"), (65, 80, "Clear sky")]
+    for i, (temperature, humidity, description) in enumerate(readings):
+        weather_store.save_weather_data(
+            observation(i, temperature=temperature, humidity=humidity, description=description),
+            "current"
+        )
+    weather_store.save_weather_data({"location": CURRENT_RESULT["location"], "forecast": [], "days": 0}, "forecast")
+    assert weather_store.flush_weather_writes(timeout=5)
+
+    rollups = fake_firestore.collection(weather_store.ROLLUP_COLLECTION).documents
+    assert len(rollups) == 1
+
+    stats = weather_store.get_weather_statistics(CURRENT_RESULT["location"], days=7)
+    assert stats["data_points"] == 3
+    assert stats["temperature"] == {"avg": 65.0, "min": 60, "max": 70}
+    assert stats["humidity"]["avg"] == 75.0
+    assert stats["most_common_condition"] == "Clear sky"
+    assert stats["conditions_breakdown"] == {"Clear sky": 2, "Overcast": 1}
+
+
+def test_statistics_report_missing_data(fake_firestore):
+    stats = weather_store.get_weather_statistics("Nowhere", days=3)
+    assert "No weather data found" in stats["error"]
+
+
+def test_rebuild_rollups_matches_incremental_rollups(fake_firestore):
+    for i, temperature in enumerate((55, 65)):
+        weather_store.save_weather_data(observation(i, temperature=temperature), "current")
+    assert weather_store.flush_weather_writes(timeout=5)
+    incremental = weather_store.get_weather_statistics(CURRENT_RESULT["location"])
+
+    fake_firestore.collection(weather_store.ROLLUP_COLLECTION).documents.clear()
+    assert weather_store.rebuild_weather_rollups(days=1) == 1
+    assert weather_store.get_weather_statistics(CURRENT_RESULT["location"]) == incremental
+
+
+def test_repeated_observations_are_written_once(fake_firestore):
+    location = CURRENT_RESULT["location"]
+    doc_ids = {weather_store.save_weather_data(observation(0), "current") for _ in range(5)}
+    doc_ids.add(weather_store.save_weather_data(observation(1), "current"))
+    assert weather_store.flush_weather_writes(timeout=5)
+
+    assert set(fake_firestore.collection("weather_current").documents) == doc_ids
+    assert sum(fake_firestore.commits) == 4
+    assert weather_store.get_weather_statistics(location)["data_points"] == 2
+
+    # Another instance (empty local cache) saving a stored observation commits nothing
+    weather_store._saved_observations.clear()
+    commits = list(fake_firestore.commits)
+    assert weather_store.save_weather_data(observation(1), "current") in doc_ids
+    assert weather_store.flush_weather_writes(timeout=5)
+    assert fake_firestore.commits == commits
+    assert weather_store.get_weather_statistics(location)["data_points"] == 2
+
+
+def test_saves_after_backend_close_start_a_fresh_queue(fake_firestore):
+    weather_store.save_weather_data(observation(0), "current")
+    weather_store.FirestoreWeatherBackend().close()
+    assert len(fake_firestore.collection("weather_current").documents) == 1
+
+    doc_id = weather_store.save_weather_data(observation(1), "current")
+    write_queue = weather_store.get_write_queue()
+    try:
+        assert doc_id is not None
+        assert weather_store.flush_weather_writes(timeout=5)
+        assert doc_id in fake_firestore.collection("weather_current").documents
+    finally:
+        write_queue.close()
+
+
+def test_failed_commit_lets_observation_be_saved_again(fake_firestore, monkeypatch):
+    def failing_commit(self):
+        raise RuntimeError("unavailable")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(FakeBatch, "commit", failing_commit)
+        doc_id = weather_store.save_weather_data(observation(0), "current")
+        assert weather_store.flush_weather_writes(timeout=5)
+
+    assert weather_store.save_weather_data(observation(0), "current") == doc_id
+    assert weather_store.flush_weather_writes(timeout=5)
+    assert set(fake_firestore.collection("weather_current").documents) == {doc_id}
+
+
+def test_batches_stay_within_firestore_operation_limit(fake_firestore):
+    records = [
+        ("weather_current", f"doc{i}", dict(CURRENT_RESULT))
+        for i in range(300)
+    ]
+    weather_store._write_weather_batch(records)
+    assert fake_firestore.commits == [500, 100]
+
+
+def seed_old_observations(client, count, age_days=40):
+    """Store `count` observations (and one rollup) older than the retention window."""
+    old = datetime.now(timezone.utc) - timedelta(days=age_days)
+    for i in range(count):
+        client.collection("weather_current").document(f"old{i}").set(
+            {"location": "London", "timestamp": old + timedelta(seconds=i)}
+        )
+    client.collection("weather_current").document("fresh").set(
+        {"location": "London", "timestamp": datetime.now(timezone.utc)}
+    )
+    client.collection(weather_store.ROLLUP_COLLECTION).document("London_old").set(
+        {"location": "London", "date": old.date().isoformat(), "count": count}
+    )
+
+
+def test_cleanup_dry_run_only_counts(fake_firestore):
+    seed_old_observations(fake_firestore, 7)
+
+    report = weather_store.run_cleanup(days_to_keep=30, dry_run=True)
+    assert report["would_delete"] == 8
+    assert report["collections"]["weather_current"]["would_delete"] == 7
+    assert len(fake_firestore.collection("weather_current").documents) == 8
+    assert fake_firestore.deletes == 0
+
+
+def test_cleanup_deletes_in_batched_pages(fake_firestore):
+    seed_old_observations(fake_firestore, 7)
+
+    report = weather_store.run_cleanup(days_to_keep=30, page_size=3)
+    assert report["deleted"] == 8
+    assert report["completed"]
+    assert report["collections"]["weather_current"]["pages"] == 3
+    assert list(fake_firestore.collection("weather_current").documents) == ["fresh"]
+    assert fake_firestore.collection(weather_store.ROLLUP_COLLECTION).documents == {}
+    assert weather_store.cleanup_old_data(days_to_keep=30) == 0
+
+
+def test_cleanup_resumes_from_cursor_after_interruption(fake_firestore, monkeypatch):
+    seed_old_observations(fake_firestore, 7)
+    commit = FakeBatch.commit
+    commits = []
+
+    def flaky_commit(batch):
+        commits.append(batch)
+        if len(commits) == 2:
+            raise RuntimeError("deadline exceeded")
+        commit(batch)
+
+    monkeypatch.setattr(FakeBatch, "commit", flaky_commit)
+    interrupted = weather_store.run_cleanup(days_to_keep=30, page_size=3, parallel=False)
+    current = interrupted["collections"]["weather_current"]
+    assert not interrupted["completed"]
+    assert current["deleted"] == 3 and "deadline exceeded" in current["error"]
+
+    monkeypatch.setattr(FakeBatch, "commit", commit)
+    resumed = weather_store.run_cleanup(days_to_keep=30, page_size=3, cursors=interrupted["cursors"])
+    assert resumed["completed"]
+    assert resumed["collections"]["weather_current"]["deleted"] == 4
+    assert list(fake_firestore.collection("weather_current").documents) == ["fresh"]
+
+
+def test_cleanup_stops_at_time_budget(fake_firestore):
+    seed_old_observations(fake_firestore, 7)
+
+    report = weather_store.run_cleanup(days_to_keep=30, time_budget_seconds=0)
+    assert not report["completed"]
+    assert report["deleted"] == 0
+
+
+def page_through(get_page, page_size):
+    """Follow next_cursor until the last page; returns the page lengths and all records."""
+    sizes, records, cursor = [], [], None
+    while True:
+        page = get_page(page_size=page_size, cursor=cursor)
+        sizes.append(len(page["records"]))
+        records.extend(page["records"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return sizes, records
+
+
+def test_weather_history_pages_through_equal_timestamps(fake_firestore, monkeypatch):
+    # One write-behind batch gives every document the same commit timestamp
+    monkeypatch.setattr(FakeFirestoreClient, "_now", datetime.now(timezone.utc))
+    doc_ids = {weather_store.save_weather_data(observation(i), "current") for i in range(25)}
+    assert weather_store.flush_weather_writes(timeout=5)
+
+    location = CURRENT_RESULT["location"]
+    sizes, records = page_through(
+        lambda **kwargs: weather_store.get_weather_history_page(location, fields=["temperature"], **kwargs), 10
+    )
+    assert sizes == [10, 10, 5]
+    assert {record["doc_id"] for record in records} == doc_ids
+    assert set(records[0]) == {"temperature", "timestamp", "doc_id"}
+
+    assert len(list(weather_store.iter_weather_history(location, page_size=7))) == 25
+    assert len(weather_store.get_recent_weather(location)) == 10
+    assert "Invalid history cursor" in weather_store.get_weather_history_page(location, cursor="nope")["error"]
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path):
+    clock = {"now": datetime(2025, 6, 10, 12, tzinfo=timezone.utc).timestamp()}
+    backend = SQLiteWeatherBackend(str(tmp_path / "weather.db"), clock=lambda: clock["now"])
+    backend.clock = clock
+    weather_storage.set_weather_backend(backend)
+    yield backend
+    weather_storage.set_weather_backend(None)
+    backend.close()
+
+
+def test_create_weather_backend_by_name(tmp_path, monkeypatch):
+    monkeypatch.setattr(weather_storage, "WEATHER_SQLITE_PATH", str(tmp_path / "weather.db"))
+    backend = weather_storage.create_weather_backend("sqlite")
+    assert isinstance(backend, SQLiteWeatherBackend)
+    backend.close()
+    assert isinstance(weather_storage.create_weather_backend("firestore"), weather_store.FirestoreWeatherBackend)
+    with pytest.raises(ValueError):
+        weather_storage.create_weather_backend("cassandra")
+
+
+def test_sqlite_backend_uses_wal_mode(sqlite_backend):
+    assert sqlite_backend._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_sqlite_backend_save_recent_and_statistics(sqlite_backend):
+    readings = [(60, 70, "Clear sky"), (70, None, "Overcast"), (65, 80, "Clear sky")]
+    for i, (temperature, humidity, description) in enumerate(readings):
+        assert weather_storage.save_weather_data(
+            observation(i, temperature=temperature, humidity=humidity, description=description),
+            "current"
+        )
+        sqlite_backend.clock["now"] += 60
+    assert weather_storage.save_weather_data({"error": "boom"}, "current") is None
+    assert weather_storage.save_weather_data(
+        {"location": CURRENT_RESULT["location"], "forecast": [{"date": "2025-06-10"}], "days": 1}, "forecast"
+    )
+
+    recent = weather_storage.get_recent_weather(CURRENT_RESULT["location"], hours=1)
+    assert [record["temperature"] for record in recent] == [65, 70, 60]
+    assert recent[0]["coordinates"] == CURRENT_RESULT["coordinates"]
+    assert recent[0]["timestamp"].startswith("2025-06-10T12:02")
+
+    stats = weather_storage.get_weather_statistics(CURRENT_RESULT["location"], days=7)
+    assert stats["data_points"] == 3
+    assert stats["temperature"] == {"avg": 65.0, "min": 60, "max": 70}
+    assert stats["humidity"]["avg"] == 75.0
+    assert stats["conditions_breakdown"] == {"Clear sky": 2, "Overcast": 1}
+
+
+def test_sqlite_backend_cleanup(sqlite_backend):
+    weather_storage.save_weather_data(observation(0), "current")
+    weather_storage.save_weather_data(observation(1), "current")
+    sqlite_backend.clock["now"] += 40 * 86400
+    weather_storage.save_weather_data(observation(2), "current")
+
+    assert weather_storage.run_cleanup(30, dry_run=True)["would_delete"] == 2
+    assert weather_storage.cleanup_old_data(30) == 2
+    assert weather_storage.run_cleanup(30)["completed"]
+    assert weather_storage.cleanup_old_data(30) == 0
+    assert len(weather_storage.get_recent_weather(CURRENT_RESULT["location"])) == 1
+
+
+def test_sqlite_backend_skips_repeated_observations(sqlite_backend):
+    doc_ids = {sqlite_backend.save(observation(0), "current") for _ in range(3)}
+    doc_ids.add(sqlite_backend.save(observation(1), "current"))
+
+    assert len(doc_ids) == 2
+    assert sqlite_backend._connection().execute("SELECT COUNT(*) FROM weather_current").fetchone()[0] == 2
+
+
+def test_sqlite_backend_handles_concurrent_writers(sqlite_backend):
+    def write_many(offset):
+        for i in range(50):
+            assert sqlite_backend.save(observation(offset + i), "current")
+
+    threads = [threading.Thread(target=write_many, args=(50 * n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    count = sqlite_backend._connection().execute("SELECT COUNT(*) FROM weather_current").fetchone()[0]
+    assert count == 200
+
+
+def test_sqlite_backend_history_pages_newest_first(sqlite_backend):
+    doc_ids = []
+    for minute in range(12):
+        # Pairs of records share a timestamp to exercise the id tie-break
+        sqlite_backend.clock["now"] += 60 * (minute % 2)
+        doc_ids.append(sqlite_backend.save(observation(minute, temperature=minute), "current"))
+
+    location = CURRENT_RESULT["location"]
+    sizes, records = page_through(
+        lambda **kwargs: weather_storage.get_weather_history_page(location, fields=["temperature"], **kwargs), 5
+    )
+    assert sizes == [5, 5, 2]
+    assert sorted(record["doc_id"] for record in records) == sorted(doc_ids)
+    assert records == sorted(records, key=lambda record: (record["timestamp"], record["doc_id"]), reverse=True)
+    assert set(records[0]) == {"temperature", "timestamp", "doc_id"}
+    assert len(list(weather_storage.iter_weather_history(location, page_size=4))) == 12
+    assert len(weather_storage.get_recent_weather(location)) == 10
@@ -0,0 +1,617 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Offline unit tests for the weather agent tools."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import requests
+from mas_system.sub_agents.weather_agent.tools import http_client, random_number, weather, weather_async
+from mas_system.sub_agents.weather_agent.tools.cache import TTLCache
+from mas_system.sub_agents.weather_agent.tools.circuit_breaker import CircuitBreaker
+from mas_system.sub_agents.weather_agent.tools.forecast_cache import ForecastCache
+from mas_system.sub_agents.weather_agent.tools.reservoir import RandomNumberReservoir
+from mas_system.sub_agents.weather_agent.tools.weather_format import describe_weather_code, shape_daily_forecast
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self._payload
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Records requests and answers them with a handler function."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.handler(method, url, **kwargs)
+
+    def close(self):
+        pass
+
+
+LONDON_GEOCODE = {
+    "results": [
+        {"name": "London", "admin1": "England", "country": "United Kingdom",
+         "latitude": 51.50853, "longitude": -0.12574}
+    ]
+}
+
+
+CURRENT_PAYLOAD = {
+    "current": {"time": "2025-06-01T12:00", "temperature_2m": 64.4,
+                "relative_humidity_2m": 71, "apparent_temperature": 63.2,
+                "precipitation_probability": 10, "weather_code": 2,
+                "wind_speed_10m": 9.6},
+}
+
+FORECAST_PAYLOAD = {
+    "daily": {
+        "time": ["2025-06-01", "2025-06-02"],
+        "weather_code": [61, 0],
+        "temperature_2m_max": [68.4, 72.6],
+        "temperature_2m_min": [52.1, 55.5],
+        "precipitation_sum": [2.4, 0.0],
+        "precipitation_probability_max": [80, 5],
+    }
+}
+
+
+def open_meteo_payload(url, params):
+    """Return a canned Open-Meteo payload for a request."""
+    if url == weather.GEOCODING_URL:
+        return LONDON_GEOCODE
+    payload = {}
+    if "current" in params:
+        payload.update(CURRENT_PAYLOAD)
+    if "daily" in params:
+        payload.update(FORECAST_PAYLOAD)
+    return payload
+
+
+@pytest.fixture(autouse=True)
+def clear_caches(monkeypatch):
+    weather.clear_geocode_cache()
+    weather.clear_forecast_cache()
+    random_number.clear_reservoirs()
+    monkeypatch.setattr(weather, "save_weather_data", lambda data, data_type: None)
+    yield
+    weather.clear_geocode_cache()
+    weather.clear_forecast_cache()
+    random_number.clear_reservoirs()
+
+
+@pytest.fixture
+def install_session():
+    """Install a FakeSession-backed client as the shared HTTP client."""
+
+    def install(handler, **client_kwargs):
+        session = FakeSession(handler)
+        client_kwargs.setdefault("sleep", lambda seconds: None)
+        http_client.set_http_client(http_client.HTTPClient(session=session, **client_kwargs))
+        return session
+
+    yield install
+    http_client.set_http_client(None)
+
+
+def test_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=4, ttl=10, clock=clock)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    clock.now = 11
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_normalize_location_handles_case_whitespace_and_aliases():
+    assert weather.normalize_location("  London ") == "london"
+    assert weather.normalize_location("Paris ,France") == "paris, france"
+    assert weather.normalize_location("NYC") == "new york"
+
+
+def test_get_coordinates_uses_cache(install_session):
+    session = install_session(lambda method, url, **kwargs: FakeResponse(LONDON_GEOCODE))
+
+    first = weather.get_coordinates("London")
+    second = weather.get_coordinates("  LONDON")
+    assert first == second == (51.50853, -0.12574, "London, England, United Kingdom")
+    assert [kwargs["params"]["name"] for _, _, kwargs in session.calls] == ["london"]
+    assert weather.get_geocode_cache_stats()["hits"] == 1
+
+
+def test_get_coordinates_caches_not_found(install_session):
+    session = install_session(lambda method, url, **kwargs: FakeResponse({}))
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="not found"):
+            weather.get_coordinates("Xyzabcdefg123")
+    assert len(session.calls) == 1
+
+
+def test_get_coordinates_tolerates_missing_optional_fields(install_session):
+    results = {
+        "vatican city": {"name": "Vatican City", "latitude": 41.90268, "longitude": 12.45414},
+        "gibraltar": {"name": "Gibraltar", "country": "Gibraltar", "latitude": 36.14474, "longitude": -5.35257},
+        "nowhere": {"name": "Nowhere"},
+    }
+    install_session(
+        lambda method, url, **kwargs: FakeResponse({"results": [results[kwargs["params"]["name"]]]})
+    )
+
+    assert weather.get_coordinates("Vatican City") == (41.90268, 12.45414, "Vatican City")
+    assert weather.get_coordinates("Gibraltar") == (36.14474, -5.35257, "Gibraltar, Gibraltar")
+    with pytest.raises(ValueError, match="Failed to geocode"):
+        weather.get_coordinates("Nowhere")
+
+
+def test_get_coordinates_does_not_cache_transport_errors(install_session):
+    session = install_session(
+        lambda method, url, **kwargs: FakeResponse({}, status_code=404)
+    )
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Failed to geocode"):
+            weather.get_coordinates("London")
+    assert len(session.calls) == 2
+
+
+def test_http_client_retries_retryable_status(install_session):
+    responses = [FakeResponse({}, status_code=503), FakeResponse(LONDON_GEOCODE)]
+    session = install_session(lambda method, url, **kwargs: responses.pop(0))
+
+    assert weather.get_coordinates("London")[0] == 51.50853
+    assert len(session.calls) == 2
+
+
+def test_http_client_retries_connection_errors_then_raises():
+    delays = []
+
+    def handler(method, url, **kwargs):
+        raise requests.exceptions.ConnectionError("refused")
+
+    session = FakeSession(handler)
+    client = http_client.HTTPClient(
+        session=session, max_retries=2, backoff_factor=0.1, backoff_max=1,
+        sleep=delays.append
+    )
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get("http://stub.invalid/")
+    assert len(session.calls) == 3
+    assert len(delays) == 2
+    assert all(0 <= delay <= 0.2 for delay in delays)
+
+
+def test_http_client_applies_default_timeout():
+    session = FakeSession(lambda method, url, **kwargs: FakeResponse({}))
+    client = http_client.HTTPClient(session=session, connect_timeout=1, read_timeout=5)
+    client.get("http://stub.invalid/")
+    assert session.calls[0][2]["timeout"] == (1, 5)
+
+
+@pytest.fixture
+def install_async_transport():
+    """Install an httpx MockTransport-backed client as the shared async client."""
+
+    def install(handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        http_client.set_async_http_client(http_client.AsyncHTTPClient(client=client))
+
+    yield install
+    http_client.set_async_http_client(None)
+
+
+def test_get_current_weather_shapes_response(install_session):
+    install_session(
+        lambda method, url, **kwargs: FakeResponse(open_meteo_payload(url, kwargs["params"]))
+    )
+
+    result = weather.get_current_weather("London")
+    assert result["location"] == "London, England, United Kingdom"
+    assert result["temperature"] == 64
+    assert result["description"] == "Partly cloudy"
+    assert result["humidity"] == 71
+    assert result["feels_like"] == 63
+
+
+async def test_async_tools_match_sync_tools(install_session, install_async_transport):
+    install_session(
+        lambda method, url, **kwargs: FakeResponse(open_meteo_payload(url, kwargs["params"]))
+    )
+    install_async_transport(
+        lambda request: httpx.Response(
+            200, json=open_meteo_payload(str(request.url.copy_with(query=None)), dict(request.url.params))
+        )
+    )
+
+    assert await weather_async.get_current_weather("London") == weather.get_current_weather("London")
+    assert await weather_async.get_weather_forecast("London", 2) == weather.get_weather_forecast("London", 2)
+
+
+async def test_async_tools_overlap_io(install_async_transport):
+    async def slow_handler(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(
+            200, json=open_meteo_payload(str(request.url.copy_with(query=None)), dict(request.url.params))
+        )
+
+    install_async_transport(slow_handler)
+    weather_async_calls = [weather_async.get_current_weather("London") for _ in range(5)]
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*weather_async_calls)
+    elapsed = time.perf_counter() - start
+
+    assert all("error" not in result for result in results)
+    # Five sessions issuing geocode + forecast sequentially would take ~1s
+    assert elapsed < 0.5
+
+
+async def test_async_tools_report_upstream_errors(install_async_transport):
+    install_async_transport(lambda request: httpx.Response(404))
+
+    result = await weather_async.get_weather_forecast("London")
+    assert result["location"] == "London"
+    assert "Failed to geocode" in result["error"]
+
+
+def make_daily(days, offset=0):
+    """Build a daily forecast block with `days` entries."""
+    return {
+        "time": [f"2025-06-{day + 1:02d}" for day in range(days)],
+        "temperature_2m_max": [70.0 + offset + day for day in range(days)],
+    }
+
+
+def test_forecast_cache_slices_longer_forecast_and_shares_grid_cell():
+    clock = FakeClock()
+    cache = ForecastCache(grid_degrees=0.1, fetch_days=7, clock=clock)
+    fetched = []
+
+    def fetch(days):
+        fetched.append(days)
+        return make_daily(days)
+
+    assert len(cache.get(51.5085, -0.1257, 3, "fahrenheit", fetch)["time"]) == 3
+    sliced = cache.get(51.5101, -0.1301, 5, "fahrenheit", fetch)
+    assert sliced["time"] == make_daily(5)["time"]
+    assert fetched == [7]
+    cache.get(51.5085, -0.1257, 3, "celsius", fetch)
+    assert fetched == [7, 7]
+
+
+def test_forecast_cache_expiry_is_aligned_to_refresh_boundary():
+    cache = ForecastCache(refresh_interval=3600, refresh_delay=300)
+    assert cache.next_refresh(7200 + 100) == 7200 + 300
+    assert cache.next_refresh(7200 + 300) == 10800 + 300
+
+
+def test_forecast_cache_serves_stale_while_refreshing_in_background():
+    clock = FakeClock()
+    cache = ForecastCache(refresh_interval=3600, stale_seconds=600, clock=clock)
+    offsets = [0, 10, 20]
+
+    def fetch(days):
+        return make_daily(days, offset=offsets.pop(0))
+
+    clock.now = 3000
+    assert cache.get(1.0, 1.0, 2, "fahrenheit", fetch)["temperature_2m_max"][0] == 70.0
+
+    clock.now = 3700
+    stale = cache.get(1.0, 1.0, 2, "fahrenheit", fetch)
+    assert stale["temperature_2m_max"][0] == 70.0
+
+    deadline = time.monotonic() + 2
+    while cache.stats()["refreshes"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.get(1.0, 1.0, 2, "fahrenheit", fetch)["temperature_2m_max"][0] == 80.0
+    assert cache.stats()["stale_hits"] == 1
+
+    # Past the stale window the entry is gone and the fetch is synchronous
+    clock.now = 3600 * 2 + 600
+    assert cache.get(1.0, 1.0, 2, "fahrenheit", fetch)["temperature_2m_max"][0] == 90.0
+
+
+async def test_forecast_cache_async_refresh_runs_as_task():
+    clock = FakeClock()
+    cache = ForecastCache(refresh_interval=3600, stale_seconds=600, clock=clock)
+    offsets = [0, 10]
+
+    async def fetch(days):
+        return make_daily(days, offset=offsets.pop(0))
+
+    clock.now = 3000
+    await cache.aget(1.0, 1.0, 2, "fahrenheit", fetch)
+    clock.now = 3700
+    stale = await cache.aget(1.0, 1.0, 2, "fahrenheit", fetch)
+    assert stale["temperature_2m_max"][0] == 70.0
+    await asyncio.sleep(0)
+    fresh = await cache.aget(1.0, 1.0, 2, "fahrenheit", fetch)
+    assert fresh["temperature_2m_max"][0] == 80.0
+
+
+def test_combined_fetch_uses_one_forecast_request(install_session):
+    session = install_session(
+        lambda method, url, **kwargs: FakeResponse(open_meteo_payload(url, kwargs["params"]))
+    )
+
+    result = weather.get_current_weather_and_forecast("London", days=2)
+    forecast_calls = [kwargs["params"] for _, url, kwargs in session.calls if url == weather.BASE_URL]
+    assert len(forecast_calls) == 1
+    assert "hourly" not in forecast_calls[0]
+    assert result["current"]["temperature"] == 64
+    assert [day["description"] for day in result["forecast"]] == ["Slight rain", "Clear sky"]
+
+    # The daily block seeded the forecast cache
+    weather.get_weather_forecast("London", days=2)
+    assert len([url for _, url, _ in session.calls if url == weather.BASE_URL]) == 1
+
+
+async def test_async_combined_fetch_matches_sync(install_session, install_async_transport):
+    install_session(
+        lambda method, url, **kwargs: FakeResponse(open_meteo_payload(url, kwargs["params"]))
+    )
+    install_async_transport(
+        lambda request: httpx.Response(
+            200, json=open_meteo_payload(str(request.url.copy_with(query=None)), dict(request.url.params))
+        )
+    )
+
+    expected = weather.get_current_weather_and_forecast("London", days=2)
+    assert await weather_async.get_current_weather_and_forecast("London", days=2) == expected
+
+
+@pytest.mark.parametrize("days", [0, -3])
+async def test_non_positive_days_return_one_day(install_session, install_async_transport, days):
+    install_session(
+        lambda method, url, **kwargs: FakeResponse(open_meteo_payload(url, kwargs["params"]))
+    )
+    install_async_transport(
+        lambda request: httpx.Response(
+            200, json=open_meteo_payload(str(request.url.copy_with(query=None)), dict(request.url.params))
+        )
+    )
+
+    for result in (
+        weather.get_current_weather_and_forecast("London", days=days),
+        weather.get_weather_forecast("London", days=days),
+        await weather_async.get_current_weather_and_forecast("London", days=days),
+        await weather_async.get_weather_forecast("London", days=days),
+    ):
+        assert "error" not in result
+        assert result["days"] == 1
+        assert [day["description"] for day in result["forecast"]] == ["Slight rain"]
+
+
+def multi_city_handler(url, params):
+    """Answer geocoding by city name and multi-coordinate forecast requests."""
+    if url == weather.GEOCODING_URL:
+        cities = {
+            "london": LONDON_GEOCODE["results"][0],
+            "paris": {"name": "Paris", "admin1": "Ile-de-France", "country": "France",
+                      "latitude": 48.85341, "longitude": 2.3488},
+        }
+        city = cities.get(params["name"])
+        return {"results": [city]} if city else {}
+    latitudes = str(params["latitude"]).split(",")
+    payloads = [
+        {"current": dict(CURRENT_PAYLOAD["current"], temperature_2m=float(lat))}
+        for lat in latitudes
+    ]
+    return payloads if len(payloads) > 1 else payloads[0]
+
+
+def test_weather_for_locations_uses_one_forecast_request(install_session):
+    session = install_session(
+        lambda method, url, **kwargs: FakeResponse(multi_city_handler(url, kwargs["params"]))
+    )
+
+    result = weather.get_weather_for_locations(["London", "Nowhere123", "Paris"])
+    assert result["count"] == 3
+    london, missing, paris = result["locations"]
+    assert london["location"].startswith("London") and london["temperature"] == 52
+    assert "not found" in missing["error"] and missing["location"] == "Nowhere123"
+    assert paris["location"].startswith("Paris") and paris["temperature"] == 49
+    assert len([url for _, url, _ in session.calls if url == weather.BASE_URL]) == 1
+
+
+async def test_async_weather_for_locations_matches_sync(install_session, install_async_transport):
+    install_session(
+        lambda method, url, **kwargs: FakeResponse(multi_city_handler(url, kwargs["params"]))
+    )
+    install_async_transport(
+        lambda request: httpx.Response(
+            200, json=multi_city_handler(str(request.url.copy_with(query=None)), dict(request.url.params))
+        )
+    )
+
+    expected = weather.get_weather_for_locations(["Paris", "London"])
+    weather.clear_geocode_cache()
+    assert await weather_async.get_weather_for_locations(["Paris", "London"]) == expected
+    assert await weather_async.get_weather_for_locations([]) == {"locations": [], "count": 0, "unit": "fahrenheit"}
+
+
+def test_local_random_numbers_follow_cloud_function_contract():
+    single = random_number.get_random_number(min_value=5, max_value=6)
+    many = random_number.get_random_number(min_value=0, max_value=1, count=5, decimal_places=3)
+
+    assert single["success"] and single["source"] == "local" and single["numbers"] in (5, 6)
+    assert len(many["numbers"]) == 5 and all(0 <= n <= 1 for n in many["numbers"])
+    assert many["parameters"] == {"min": 0, "max": 1, "count": 5, "decimal_places": 3}
+    assert single["timestamp"].endswith("Z")
+    assert random_number.get_random_number(min_value=10, max_value=1) == {
+        "success": False, "error": "min must be less than max"
+    }
+    assert "count must be" in random_number.get_random_number(count=101)["error"]
+
+
+def test_remote_random_numbers_fall_back_and_open_breaker(install_session, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(random_number, "RANDOM_NUMBER_MODE", "remote")
+    monkeypatch.setattr(random_number, "_remote_breaker",
+                        CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock))
+    session = install_session(lambda method, url, **kwargs: FakeResponse({}, status_code=503),
+                              max_retries=0)
+
+    results = [random_number.get_random_number() for _ in range(4)]
+    assert all(r["success"] and r["source"] == "local" for r in results)
+    assert len(session.calls) == 2
+    assert random_number.get_remote_breaker_stats()["state"] == "open"
+
+    clock.now += 31
+    session.handler = lambda method, url, **kwargs: FakeResponse(
+        {"status": "success", "numbers": 7, "parameters": {}, "timestamp": "t"}
+    )
+    assert random_number.get_random_number()["source"] == "remote"
+    assert random_number.get_remote_breaker_stats()["state"] == "closed"
+
+
+def test_reservoir_refills_in_bulk_below_low_water():
+    requested = []
+
+    def fetch(count):
+        requested.append(count)
+        return list(range(count))
+
+    reservoir = RandomNumberReservoir(fetch, capacity=10, low_water=4)
+    taken = [reservoir.take() for _ in range(7)]
+
+    deadline = time.monotonic() + 2
+    while reservoir.stats()["refills"] < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    stats = reservoir.stats()
+    assert taken == list(range(7))
+    assert requested == [10, 7]
+    assert stats["dry"] == 1 and stats["takes"] == 7 and stats["size"] == 10
+
+
+def test_reservoir_serializes_concurrent_dry_refills():
+    fetches = []
+
+    def slow_fetch(count):
+        fetches.append(count)
+        time.sleep(0.05)
+        # Return more than asked for; the reservoir must not grow past capacity
+        return list(range(count + 5))
+
+    reservoir = RandomNumberReservoir(slow_fetch, capacity=10, low_water=0)
+    start = threading.Barrier(8)
+    taken = []
+
+    def take():
+        start.wait()
+        taken.append(reservoir.take())
+
+    threads = [threading.Thread(target=take) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert fetches == [10]
+    assert None not in taken and len(taken) == 8
+    assert reservoir.stats()["size"] == 2
+    assert reservoir.stats()["refilled_values"] == 10
+
+
+def test_reservoir_reports_failed_refills():
+    def fetch(count):
+        raise RuntimeError("generator down")
+
+    reservoir = RandomNumberReservoir(fetch, capacity=5, low_water=2)
+    assert reservoir.take() is None
+    assert reservoir.stats()["refill_failures"] == 1 and reservoir.stats()["dry_rate"] == 1.0
+
+
+def test_fun_tools_draw_from_bulk_reservoir(monkeypatch):
+    calls = []
+    real = random_number.get_random_number
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(random_number, "get_random_number", counting)
+    lucky = [random_number.get_random_lucky_number()["lucky_number"] for _ in range(20)]
+    adjustment = random_number.get_random_temperature_adjustment()
+
+    assert all(1 <= n <= 100 for n in lucky) and -5 <= adjustment["adjustment"] <= 5
+    assert calls[0] == (1, 100, random_number.get_reservoir(1, 100).capacity, 0)
+    assert len(calls) == 2
+    assert set(random_number.get_reservoir_stats()) == {"1:100:0", "-5:5:0"}
+
+
+def test_shape_daily_forecast_rounds_and_describes_each_day():
+    daily = {
+        "time": ["2025-06-01", "2025-06-02"],
+        "weather_code": [61, 4],
+        "temperature_2m_max": [71.6, 68.4],
+        "temperature_2m_min": [55.5, 50.1],
+        "precipitation_sum": [2.3, 0.0],
+        "precipitation_probability_max": [80, 5],
+    }
+
+    assert shape_daily_forecast(daily) == [
+        {"date": "2025-06-01", "temperature_high": 72, "temperature_low": 56,
+         "description": "Slight rain", "precipitation_chance": 80, "precipitation_amount": 2.3},
+        {"date": "2025-06-02", "temperature_high": 68, "temperature_low": 50,
+         "description": "Unknown", "precipitation_chance": 5, "precipitation_amount": 0.0},
+    ]
+    assert describe_weather_code(99) == "Thunderstorm with heavy hail"